@@ -0,0 +1,20 @@
+import pytest
+from django.conf import settings
+from django.core.cache import caches
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix, tmp_path_factory):
+    """SQLite de los tests en un archivo y no en memoria: los tests con hilos
+    (p. ej. postulaciones simultáneas) necesitan conexiones que escriban a la vez."""
+    base = settings.DATABASES["default"]
+    if base["ENGINE"] == "django.db.backends.sqlite3" and not base.get("TEST", {}).get("NAME"):
+        base.setdefault("TEST", {})["NAME"] = str(tmp_path_factory.mktemp("db") / "test.sqlite3")
+
+
+@pytest.fixture(autouse=True)
+def limpiar_caches():
+    """La caché en memoria sobrevive al rollback de cada test."""
+    for cache in caches.all():
+        cache.clear()
+    yield
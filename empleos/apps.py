@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class EmpleosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'empleos'
+
+    def ready(self):
+        from .search import instalar_indice
+        post_migrate.connect(instalar_indice, sender=self)
+        from . import signals  # noqa: F401
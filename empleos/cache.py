@@ -0,0 +1,148 @@
+"""
+Caché de respuestas para ``GET /api/vacantes/`` y ``GET /api/vacantes/{id}/``.
+
+Se guardan los datos ya serializados junto con su ``ETag`` y
+``Last-Modified``, así un acierto puede responder 304 sin tocar la base de
+datos. Las claves llevan un número de versión:
+
+- Los listados usan una generación global (``vacantes:lista:gen``) que se
+  incrementa con cualquier cambio en una vacante o en su reclutador, porque
+  un cambio puede mover filas entre páginas.
+- Cada detalle usa su propia versión (``vacantes:detalle:{id}:ver``), y
+  ``?fields=``/``?expand=`` (ver ``jobconnect_api/campos.py``) forman parte
+  de la clave porque cambian la respuesta.
+
+Ambas claves llevan además el formato del renderer negociado, porque el
+``ETag`` guardado depende de él (ver ``jobconnect_api/conditional.py``).
+
+Invalidar es incrementar la versión, y se hace al confirmar la transacción
+que escribe (``transaction.on_commit``; fuera de una transacción, en el
+acto). Una petición que armó su clave antes del incremento guarda lo que
+leyó bajo una clave que ya nadie consulta. Si el incremento se hiciera
+antes del commit, una petición concurrente armaría la clave nueva, leería
+los datos viejos aún confirmados y los dejaría ahí hasta
+``VACANTES_CACHE_TIMEOUT``. Solo se cachean peticiones anónimas y de candidatos: los
+reclutadores ven únicamente sus propias vacantes.
+
+Los backends de caché de Django no informan de los desalojos, así que se
+estiman: junto a cada entrada se guarda una marca con su vencimiento, y un
+fallo en una clave cuya marca sigue vigente cuenta como desalojo. Si el
+backend desaloja también la marca, ese desalojo no se cuenta: el contador
+es una cota inferior.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from jobconnect_api.campos import PARAMETRO_CAMPOS, PARAMETRO_EXPANDIR
+
+PREFIJO = 'vacantes'
+CLAVE_GENERACION = f'{PREFIJO}:lista:gen'
+CONTADORES = ('aciertos', 'fallos', 'desalojos', 'invalidaciones')
+
+
+def _cache():
+    return caches[getattr(settings, 'VACANTES_CACHE_ALIAS', 'default')]
+
+
+def activa():
+    return getattr(settings, 'VACANTES_CACHE_ACTIVA', True)
+
+
+def _incrementar(clave, delta=1):
+    cache = _cache()
+    cache.add(clave, 0, timeout=None)
+    try:
+        return cache.incr(clave, delta)
+    except ValueError:
+        # La clave expiró entre add() e incr()
+        cache.set(clave, delta, timeout=None)
+        return delta
+
+
+def _contar(nombre):
+    _incrementar(f'{PREFIJO}:stats:{nombre}')
+
+
+def _version(clave):
+    return _cache().get(clave) or 0
+
+
+def cacheable(request):
+    user = request.user
+    return activa() and not (user.is_authenticated and user.rol == 'reclutador')
+
+
+def clave_lista(request):
+    params = sorted(
+        (k, tuple(sorted(request.query_params.getlist(k))))
+        for k in request.query_params
+    )
+    formato = getattr(request.accepted_renderer, 'format', '')
+    huella = hashlib.sha256(repr((request.get_host(), request.path, formato, params)).encode()).hexdigest()[:32]
+    return f'{PREFIJO}:lista:{_version(CLAVE_GENERACION)}:{huella}'
+
+
+def clave_detalle(request, pk):
+    formato = getattr(request.accepted_renderer, 'format', '')
+    clave = f'{PREFIJO}:detalle:{pk}:{_version(f"{PREFIJO}:detalle:{pk}:ver")}:{formato}'
+    forma = [request.query_params.get(p) for p in (PARAMETRO_CAMPOS, PARAMETRO_EXPANDIR)]
+    if any(v is not None for v in forma):
+        clave += ':' + hashlib.sha256(repr(forma).encode()).hexdigest()[:16]
+    return clave
+
+
+def _marca(clave):
+    return f'{clave}:vence'
+
+
+def obtener(clave):
+    """Entrada ``{'datos', 'etag', 'last_modified'}`` guardada o None."""
+    valores = _cache().get_many([clave, _marca(clave)])
+    entrada = valores.get(clave)
+    _contar('aciertos' if entrada is not None else 'fallos')
+    if entrada is None and valores.get(_marca(clave), 0) > time.time():
+        _contar('desalojos')
+    return entrada
+
+
+def guardar(clave, response):
+    """Guarda los datos de una respuesta 200 junto con sus validadores HTTP."""
+    if response.status_code != 200:
+        return
+    entrada = {
+        'datos': response.data,
+        'etag': response.get('ETag'),
+        'last_modified': response.get('Last-Modified'),
+    }
+    timeout = getattr(settings, 'VACANTES_CACHE_TIMEOUT', 300)
+    vence = float('inf') if timeout is None else time.time() + timeout
+    _cache().set_many({clave: entrada, _marca(clave): vence}, timeout=timeout)
+
+
+def invalidar(ids=(), listados=True):
+    """Invalida el detalle de las vacantes indicadas y, salvo ``listados=False``, los listados.
+
+    Dentro de una transacción, la invalidación espera a que se confirme.
+    """
+    ids = list(ids)
+    transaction.on_commit(lambda: _invalidar(ids, listados))
+
+
+def _invalidar(ids, listados):
+    if listados:
+        _incrementar(CLAVE_GENERACION)
+    for pk in ids:
+        _incrementar(f'{PREFIJO}:detalle:{pk}:ver')
+    _incrementar(f'{PREFIJO}:stats:invalidaciones', int(listados) + len(ids))
+
+
+def estadisticas():
+    valores = _cache().get_many([f'{PREFIJO}:stats:{n}' for n in CONTADORES])
+    datos = {n: valores.get(f'{PREFIJO}:stats:{n}', 0) for n in CONTADORES}
+    consultas = datos['aciertos'] + datos['fallos']
+    datos['tasa_aciertos'] = round(datos['aciertos'] / consultas, 4) if consultas else 0.0
+    return datos
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 10:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('empleos', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vacante',
+            index=models.Index(fields=['-fecha_publicacion', '-id'], name='vacante_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacante',
+            index=models.Index(fields=['reclutador', '-fecha_publicacion'], name='vacante_reclutador_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacante',
+            index=models.Index(fields=['ubicacion', '-fecha_publicacion'], name='vacante_ubicacion_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacante',
+            index=models.Index(fields=['tipo_contrato', '-fecha_publicacion'], name='vacante_contrato_fecha_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-18 11:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('empleos', '0002_vacante_vacante_fecha_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacante',
+            name='fecha_actualizacion',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-18 11:25
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+ESTADOS = ['en revision', 'descartado', 'seleccionado']
+CAMPOS = {e: f"postulaciones_{e.replace(' ', '_')}" for e in ESTADOS}
+
+
+def calcular_contadores(apps, schema_editor):
+    Vacante = apps.get_model('empleos', 'Vacante')
+    Postulacion = apps.get_model('postulaciones', 'Postulacion')
+    conteos = Postulacion.objects.order_by().values('vacante_id').annotate(
+        postulaciones_total=Count('id'),
+        **{c: Count('id', filter=Q(estado=e)) for e, c in CAMPOS.items()},
+    )
+    vacantes = [Vacante(pk=fila.pop('vacante_id'), **fila) for fila in conteos.iterator()]
+    Vacante.objects.bulk_update(vacantes, ['postulaciones_total', *CAMPOS.values()], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('empleos', '0003_vacante_fecha_actualizacion'),
+        ('postulaciones', '0003_postulacion_fecha_actualizacion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacante',
+            name='postulaciones_descartado',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='vacante',
+            name='postulaciones_en_revision',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='vacante',
+            name='postulaciones_seleccionado',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='vacante',
+            name='postulaciones_total',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(calcular_contadores, migrations.RunPython.noop),
+    ]
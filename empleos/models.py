@@ -14,6 +14,23 @@ class Vacante(models.Model):
     ubicacion = models.CharField(max_length=100, blank=True, null=True)
     tipo_contrato = models.CharField(max_length=50, blank=True, null=True)
     fecha_publicacion = models.DateTimeField(auto_now_add=True)
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+    # Contadores de postulaciones por estado (ver postulaciones/contadores.py)
+    postulaciones_total = models.PositiveIntegerField(default=0)
+    postulaciones_en_revision = models.PositiveIntegerField(default=0)
+    postulaciones_descartado = models.PositiveIntegerField(default=0)
+    postulaciones_seleccionado = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            # Listado público y paginación por cursor (-fecha_publicacion, -id)
+            models.Index(fields=['-fecha_publicacion', '-id'], name='vacante_fecha_idx'),
+            # "Mis vacantes" del reclutador
+            models.Index(fields=['reclutador', '-fecha_publicacion'], name='vacante_reclutador_fecha_idx'),
+            # filterset_fields del listado
+            models.Index(fields=['ubicacion', '-fecha_publicacion'], name='vacante_ubicacion_fecha_idx'),
+            models.Index(fields=['tipo_contrato', '-fecha_publicacion'], name='vacante_contrato_fecha_idx'),
+        ]
 
     def __str__(self):
         return self.titulo
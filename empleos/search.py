@@ -0,0 +1,250 @@
+"""
+Búsqueda de texto completo para vacantes.
+
+El parámetro ``?search=`` de ``VacanteViewSet`` se resuelve con el backend
+indicado en ``settings.SEARCH_BACKEND``:
+
+- ``'auto'``: usa el índice del motor activo (FTS5 en SQLite, ``tsvector`` +
+  GIN en PostgreSQL) y cae a ``'simple'`` si el índice no está instalado.
+- ``'sqlite_fts5'`` / ``'postgres'``: fuerza un backend concreto.
+- ``'simple'``: el ``SearchFilter`` de DRF (``icontains`` sobre cada campo).
+
+Los índices se instalan en ``post_migrate`` (ver ``EmpleosConfig.ready``) y
+no mediante una migración, porque en SQLite cualquier ``AddField`` que
+reconstruya la tabla ``empleos_vacante`` borraría los triggers de
+sincronización.
+"""
+import re
+import unicodedata
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
+
+TABLA_VACANTES = 'empleos_vacante'
+TABLA_FTS = 'empleos_vacante_fts'
+CONFIG_POSTGRES = 'spanish_unaccent'
+
+# Peso de cada columna en el ranking: el título pesa más que el cuerpo
+PESOS_SQLITE = (10.0, 2.0, 1.0)
+
+STOPWORDS = {
+    'a', 'al', 'con', 'de', 'del', 'e', 'el', 'en', 'es', 'la', 'las', 'lo',
+    'los', 'o', 'para', 'por', 'que', 'se', 'sin', 'su', 'sus', 'u', 'un',
+    'una', 'y',
+}
+
+# Sufijos flexivos y derivativos frecuentes, del más largo al más corto
+SUFIJOS = (
+    'amientos', 'imientos', 'amiento', 'imiento', 'aciones', 'uciones',
+    'adoras', 'adores', 'ancias', 'encias', 'idades', 'mente', 'acion',
+    'ucion', 'adora', 'ador', 'ancia', 'encia', 'idad', 'ismos', 'istas',
+    'ismo', 'ista', 'ivas', 'ivos', 'iva', 'ivo', 'es', 'os', 'as', 's',
+    'a', 'o', 'e',
+)
+LONGITUD_MINIMA_RAIZ = 4
+
+
+def normalizar(texto):
+    """Pasa a minúsculas y elimina tildes y diéresis."""
+    descompuesto = unicodedata.normalize('NFKD', texto.lower())
+    return ''.join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+def raiz(palabra):
+    """Stemmer ligero para español: recorta el sufijo más largo posible."""
+    for sufijo in SUFIJOS:
+        if palabra.endswith(sufijo) and len(palabra) - len(sufijo) >= LONGITUD_MINIMA_RAIZ:
+            return palabra[:-len(sufijo)]
+    return palabra
+
+
+def terminos(texto):
+    """Tokeniza un texto en raíces normalizadas, sin stopwords."""
+    palabras = re.findall(r'\w+', normalizar(texto))
+    return [raiz(p) for p in palabras if len(p) > 1 and p not in STOPWORDS]
+
+
+class BusquedaSQLite:
+    """FTS5 con contenido externo sobre ``empleos_vacante`` y ranking BM25.
+
+    FTS5 no trae stemmer para español, así que las consultas se reducen a
+    raíces con ``raiz()`` y se buscan como prefijos (``"desarroll"*``).
+    """
+    vendor = 'sqlite'
+
+    def instalar(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE %s",
+                [f'{TABLA_FTS}_%'],
+            )
+            triggers_previos = {fila[0] for fila in cursor.fetchall()}
+            cursor.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {TABLA_FTS} USING fts5(
+                    titulo, descripcion, requisitos,
+                    content='{TABLA_VACANTES}', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {TABLA_FTS}_ai AFTER INSERT ON {TABLA_VACANTES} BEGIN
+                    INSERT INTO {TABLA_FTS}(rowid, titulo, descripcion, requisitos)
+                    VALUES (new.id, new.titulo, new.descripcion, new.requisitos);
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {TABLA_FTS}_ad AFTER DELETE ON {TABLA_VACANTES} BEGIN
+                    INSERT INTO {TABLA_FTS}({TABLA_FTS}, rowid, titulo, descripcion, requisitos)
+                    VALUES ('delete', old.id, old.titulo, old.descripcion, old.requisitos);
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {TABLA_FTS}_au
+                AFTER UPDATE OF titulo, descripcion, requisitos ON {TABLA_VACANTES} BEGIN
+                    INSERT INTO {TABLA_FTS}({TABLA_FTS}, rowid, titulo, descripcion, requisitos)
+                    VALUES ('delete', old.id, old.titulo, old.descripcion, old.requisitos);
+                    INSERT INTO {TABLA_FTS}(rowid, titulo, descripcion, requisitos)
+                    VALUES (new.id, new.titulo, new.descripcion, new.requisitos);
+                END
+            """)
+            # Si faltaba algún trigger el índice pudo quedar desfasado
+            if len(triggers_previos) < 3:
+                self.reconstruir(connection)
+
+    def reconstruir(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {TABLA_FTS}({TABLA_FTS}) VALUES ('rebuild')")
+
+    def disponible(self, connection):
+        return TABLA_FTS in connection.introspection.table_names()
+
+    def buscar(self, queryset, texto):
+        raices = terminos(texto)
+        if not raices:
+            return None
+        consulta = ' '.join(f'"{r}"*' for r in raices)
+        pesos = ', '.join(str(p) for p in PESOS_SQLITE)
+        ids = RawSQL(f"SELECT rowid FROM {TABLA_FTS} WHERE {TABLA_FTS} MATCH %s", (consulta,))
+        rank = RawSQL(
+            f"SELECT bm25({TABLA_FTS}, {pesos}) FROM {TABLA_FTS} "
+            f"WHERE {TABLA_FTS} MATCH %s AND {TABLA_FTS}.rowid = {TABLA_VACANTES}.id",
+            (consulta,),
+            output_field=FloatField(),
+        )
+        # bm25() devuelve valores negativos: cuanto menor, más relevante
+        return (
+            queryset.filter(id__in=ids)
+            .annotate(search_rank=rank)
+            .order_by('search_rank', '-fecha_publicacion')
+        )
+
+
+class BusquedaPostgres:
+    """``tsvector`` en español con ``unaccent``, indexado con GIN.
+
+    La expresión de ``VECTOR`` debe coincidir exactamente con la del índice
+    para que el planificador lo use.
+    """
+    vendor = 'postgresql'
+    indice = 'empleos_vacante_busqueda_gin'
+    VECTOR = (
+        f"setweight(to_tsvector('{CONFIG_POSTGRES}'::regconfig, "
+        f"coalesce({TABLA_VACANTES}.titulo, '')), 'A') || "
+        f"setweight(to_tsvector('{CONFIG_POSTGRES}'::regconfig, "
+        f"coalesce({TABLA_VACANTES}.descripcion, '') || ' ' || "
+        f"coalesce({TABLA_VACANTES}.requisitos, '')), 'B')"
+    )
+
+    def instalar(self, connection):
+        with connection.cursor() as cursor:
+            try:
+                with transaction.atomic(using=connection.alias):
+                    cursor.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+                mapeo = 'unaccent, spanish_stem'
+            except DatabaseError:
+                # Sin permisos para crear la extensión: se conserva el stemming
+                mapeo = 'spanish_stem'
+            cursor.execute(f"""
+                DO $$ BEGIN
+                    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{CONFIG_POSTGRES}') THEN
+                        CREATE TEXT SEARCH CONFIGURATION {CONFIG_POSTGRES} (COPY = spanish);
+                        ALTER TEXT SEARCH CONFIGURATION {CONFIG_POSTGRES}
+                            ALTER MAPPING FOR hword, hword_part, word WITH {mapeo};
+                    END IF;
+                END $$
+            """)
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.indice} ON {TABLA_VACANTES} USING gin (({self.VECTOR}))"
+            )
+
+    def reconstruir(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(f"REINDEX INDEX {self.indice}")
+
+    def disponible(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_indexes WHERE indexname = %s", [self.indice])
+            return cursor.fetchone() is not None
+
+    def buscar(self, queryset, texto):
+        consulta = f"websearch_to_tsquery('{CONFIG_POSTGRES}'::regconfig, %s)"
+        coincide = RawSQL(f"({self.VECTOR}) @@ {consulta}", (texto,), output_field=BooleanField())
+        rank = RawSQL(f"ts_rank({self.VECTOR}, {consulta})", (texto,), output_field=FloatField())
+        return (
+            queryset.filter(coincide)
+            .annotate(search_rank=rank)
+            .order_by('-search_rank', '-fecha_publicacion')
+        )
+
+
+BACKENDS = {
+    'sqlite_fts5': BusquedaSQLite,
+    'postgres': BusquedaPostgres,
+}
+
+# Alias de base de datos cuyo índice ya se comprobó como instalado
+_indices_disponibles = set()
+
+
+def backend_para(connection):
+    """Devuelve el backend de índice para ``connection`` o None si no aplica."""
+    nombre = getattr(settings, 'SEARCH_BACKEND', 'auto')
+    if nombre == 'simple':
+        return None
+    if nombre == 'auto':
+        clase = next((b for b in BACKENDS.values() if b.vendor == connection.vendor), None)
+    else:
+        clase = BACKENDS[nombre]
+    if clase is None or clase.vendor != connection.vendor:
+        return None
+    backend = clase()
+    if connection.alias not in _indices_disponibles:
+        if not backend.disponible(connection):
+            return None
+        _indices_disponibles.add(connection.alias)
+    return backend
+
+
+def instalar_indice(using='default', **kwargs):
+    """Receptor de ``post_migrate``: crea o repara el índice de búsqueda."""
+    connection = connections[using]
+    clase = next((b for b in BACKENDS.values() if b.vendor == connection.vendor), None)
+    if clase is not None:
+        clase().instalar(connection)
+
+
+class VacanteSearchFilter(filters.SearchFilter):
+    """``SearchFilter`` que resuelve ``?search=`` contra el índice de texto completo."""
+
+    def filter_queryset(self, request, queryset, view):
+        texto = ' '.join(self.get_search_terms(request))
+        if not texto:
+            return queryset
+        backend = backend_para(connections[queryset.db])
+        resultado = backend.buscar(queryset, texto) if backend else None
+        if resultado is None:
+            return super().filter_queryset(request, queryset, view)
+        return resultado
@@ -1,26 +1,73 @@
+from django.db.models.functions import Substr
 from rest_framework import serializers
+from jobconnect_api.campos import CamposDinamicosMixin
 from .models import Vacante
 from usuarios.models import Usuario
 from usuarios.serializers import PerfilReclutadorSerializer
 
-class ReclutadorMiniSerializer(serializers.ModelSerializer):
+class ReclutadorMiniSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     perfil_reclutador = PerfilReclutadorSerializer()
 
     class Meta:
         model = Usuario
         fields = ['id', 'first_name', 'last_name', 'email', 'perfil_reclutador']
 
-class VacanteSerializer(serializers.ModelSerializer):
+class VacanteSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     reclutador = ReclutadorMiniSerializer(read_only=True)  # 👈 aquí lo cambiamos
     
     class Meta:
         model = Vacante
         fields = '__all__'
-        read_only_fields = ['reclutador', 'fecha_publicacion']
+        read_only_fields = [
+            'reclutador', 'fecha_publicacion', 'postulaciones_total', 'postulaciones_en_revision',
+            'postulaciones_descartado', 'postulaciones_seleccionado',
+        ]
         extra_kwargs = {
             'titulo': {'required': True},
             'descripcion': {'required': True},
             'requisitos': {'required': True},
             'ubicacion': {'required': False},
             'tipo_contrato': {'required': True}
-        }
\ No newline at end of file
+        }
+
+class ResumenField(serializers.Field):
+    """Corta en la última palabra completa un texto que la base de datos ya recortó a ``largo + 1``."""
+
+    def __init__(self, largo, **kwargs):
+        self.largo = largo
+        super().__init__(read_only=True, **kwargs)
+
+    def to_representation(self, texto):
+        if len(texto) <= self.largo:
+            return texto
+        recorte = texto[:self.largo]
+        if texto[self.largo] != ' ':
+            # El corte cae dentro de una palabra: se descarta ese trozo
+            recorte = recorte.rsplit(' ', 1)[0]
+        return recorte.rstrip(' ,.;:') + '…'
+
+# Tarjeta del listado: sin los TextField completos ni el perfil del reclutador
+class VacanteListaSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
+    largo_resumen = 200
+
+    resumen = ResumenField(largo_resumen, source='resumen_crudo')
+    empresa = serializers.CharField(source='reclutador.perfil_reclutador.empresa', read_only=True)
+
+    class Meta:
+        model = Vacante
+        fields = [
+            'id', 'titulo', 'resumen', 'ubicacion', 'tipo_contrato', 'reclutador', 'empresa',
+            'fecha_publicacion', 'fecha_actualizacion', 'postulaciones_total', 'postulaciones_en_revision',
+            'postulaciones_descartado', 'postulaciones_seleccionado',
+        ]
+        read_only_fields = fields
+        expandibles = {'reclutador': ReclutadorMiniSerializer}  # ?expand=reclutador
+        columnas = {'resumen': ()}  # sale de la anotación de preparar()
+
+    @classmethod
+    def preparar(cls, queryset):
+        """Solo las columnas de la tarjeta; la descripción llega ya recortada por la base de datos."""
+        return queryset.only(
+            *(f for f in cls.Meta.fields if f not in ('resumen', 'empresa')),
+            'reclutador__perfil_reclutador__empresa',
+        ).annotate(resumen_crudo=Substr('descripcion', 1, cls.largo_resumen + 1))
@@ -0,0 +1,54 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from usuarios.models import PerfilReclutador, Usuario
+from . import cache
+from .models import Vacante
+
+# Campos del reclutador que van anidados en cada vacante (ReclutadorMiniSerializer)
+CAMPOS_RECLUTADOR = ('first_name', 'last_name', 'email')
+
+
+@receiver([post_save, post_delete], sender=Vacante)
+def invalidar_vacante(sender, instance, **kwargs):
+    cache.invalidar([instance.pk])
+
+
+def _invalidar_vacantes_de(usuario_id):
+    vacantes = Vacante.objects.filter(reclutador_id=usuario_id)
+    cache.invalidar(list(vacantes.values_list('id', flat=True)))
+    # Nueva versión para los ETag de las vacantes y de sus postulaciones
+    vacantes.update(fecha_actualizacion=timezone.now())
+
+
+def _al_confirmar(usuario_id):
+    # Fuera de la transacción del cambio: no bloquea las vacantes mientras dura
+    transaction.on_commit(lambda: _invalidar_vacantes_de(usuario_id))
+
+
+# El reclutador y su perfil van anidados en cada vacante serializada
+@receiver([post_save, post_delete], sender=PerfilReclutador)
+def invalidar_perfil_reclutador(sender, instance, **kwargs):
+    _al_confirmar(instance.user_id)
+
+
+@receiver(pre_save, sender=Usuario)
+def recordar_reclutador(sender, instance, update_fields=None, **kwargs):
+    """Guarda los campos anidados antes de guardar; ``last_login`` o la contraseña no invalidan nada."""
+    instance._reclutador_previo = None
+    if instance.pk is None or instance.rol != Usuario.Rol.RECLUTADOR:
+        return
+    if update_fields is not None and not set(update_fields) & set(CAMPOS_RECLUTADOR):
+        return
+    instance._reclutador_previo = Usuario.objects.filter(pk=instance.pk).values(*CAMPOS_RECLUTADOR).first()
+
+
+@receiver(post_save, sender=Usuario)
+def invalidar_reclutador(sender, instance, created=False, **kwargs):
+    previo = getattr(instance, '_reclutador_previo', None)
+    if created or previo is None:
+        return
+    if any(previo[campo] != getattr(instance, campo) for campo in CAMPOS_RECLUTADOR):
+        _al_confirmar(instance.pk)
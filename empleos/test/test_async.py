@@ -0,0 +1,77 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from empleos.models import Vacante
+from usuarios.authentication import TokenConRolSerializer
+from usuarios.models import PerfilReclutador, Usuario
+
+
+@pytest.fixture
+def vacantes(db):
+    reclutador = Usuario.objects.create(username="reclu_async", first_name="Ana", rol="reclutador")
+    PerfilReclutador.objects.create(user=reclutador, empresa="Empresa X", cargo="Gerente", telefono="123")
+    return [
+        Vacante.objects.create(
+            titulo=f"Backend {i}", descripcion="APIs", requisitos="Python",
+            ubicacion="Bogotá" if i % 2 else "Cali", tipo_contrato="Indefinido", reclutador=reclutador,
+        )
+        for i in range(15)
+    ]
+
+
+def sin_enlaces(datos):
+    return {k: v for k, v in datos.items() if k not in ("next", "previous")}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params", [{}, {"page": 2}, {"ubicacion": "Cali"}, {"search": "backend"}, {"paginacion": "cursor"}])
+def test_listado_async_coincide_con_el_sincrono(vacantes, params):
+    client = APIClient()
+    sincrono = client.get(reverse("vacante-list"), params)
+    asincrono = client.get(reverse("vacante-list-async"), params)
+
+    assert asincrono.status_code == sincrono.status_code == 200
+    assert sin_enlaces(asincrono.json()) == sin_enlaces(sincrono.json())
+
+
+@pytest.mark.django_db
+def test_listado_async_enlaza_paginas_asincronas(vacantes):
+    datos = APIClient().get(reverse("vacante-list-async")).json()
+
+    assert datos["count"] == 15
+    assert "/api/async/vacantes/?page=2" in datos["next"]
+
+
+@pytest.mark.django_db
+def test_detalle_async_responde_304_y_404(vacantes):
+    client = APIClient()
+    url = reverse("vacante-detail-async", args=[vacantes[0].id])
+    primera = client.get(url)
+    assert primera.json() == client.get(reverse("vacante-detail", args=[vacantes[0].id])).json()
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=primera["ETag"]).status_code == 304
+    assert client.get(reverse("vacante-detail-async", args=[0])).status_code == 404
+
+
+@pytest.mark.django_db
+def test_listado_async_de_reclutador_con_usuario_en_cache(vacantes):
+    otro = Usuario.objects.create(username="otro_reclu", rol="reclutador")
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {TokenConRolSerializer.get_token(otro).access_token}")
+    url = reverse("vacante-list-async")
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as consultas:
+        response = client.get(url)
+
+    assert response.json()["count"] == 0
+    # Solo el COUNT de la paginación: el usuario sale de la caché y no hay filas
+    assert len(consultas) == 1
+
+
+@pytest.mark.django_db
+def test_async_solo_admite_lecturas(vacantes):
+    assert APIClient().post(reverse("vacante-list-async"), {}).status_code == 405
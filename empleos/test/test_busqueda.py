@@ -0,0 +1,82 @@
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from usuarios.models import Usuario
+from empleos.models import Vacante
+from empleos.search import raiz, terminos
+
+
+def crear_vacante(reclutador, titulo, descripcion="Trabajo remoto", requisitos="Ninguno"):
+    return Vacante.objects.create(
+        titulo=titulo,
+        descripcion=descripcion,
+        requisitos=requisitos,
+        ubicacion="Remoto",
+        tipo_contrato="Indefinido",
+        reclutador=reclutador
+    )
+
+
+@pytest.fixture
+def reclutador(db):
+    return Usuario.objects.create_user(
+        username="reclu_busqueda",
+        email="busqueda@test.com",
+        password="Reclu123$",
+        rol="reclutador"
+    )
+
+
+def buscar(texto):
+    client = APIClient()
+    response = client.get(reverse("vacante-list"), {"search": texto})
+    assert response.status_code == 200
+    return [v["titulo"] for v in response.data["results"]]
+
+
+def test_terminos_normaliza_tildes_y_sufijos():
+    assert terminos("Gestión de la Información") == ["gestion", "inform"]
+    assert raiz("desarrolladores") == raiz("desarrollador") == "desarroll"
+
+
+@pytest.mark.django_db
+def test_busqueda_ignora_tildes_y_plurales(reclutador):
+    crear_vacante(reclutador, "Analista de Información")
+    crear_vacante(reclutador, "Desarrollador Python")
+    crear_vacante(reclutador, "Contador")
+
+    assert buscar("informacion") == ["Analista de Información"]
+    assert buscar("desarrolladores") == ["Desarrollador Python"]
+
+
+@pytest.mark.django_db
+def test_busqueda_ordena_por_relevancia(reclutador):
+    crear_vacante(reclutador, "Soporte técnico", descripcion="Atención a usuarios de Django")
+    crear_vacante(reclutador, "Desarrollador Django", descripcion="APIs con Django")
+
+    assert buscar("django") == ["Desarrollador Django", "Soporte técnico"]
+
+
+@pytest.mark.django_db
+def test_indice_refleja_ediciones_y_borrados(reclutador, django_capture_on_commit_callbacks):
+    vacante = crear_vacante(reclutador, "Diseñador UX")
+    with django_capture_on_commit_callbacks(execute=True):
+        vacante.titulo = "Diseñador gráfico"
+        vacante.save()
+
+    assert buscar("grafico") == ["Diseñador gráfico"]
+    assert buscar("ux") == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        vacante.delete()
+    assert buscar("grafico") == []
+
+
+@pytest.mark.django_db
+@override_settings(SEARCH_BACKEND="simple")
+def test_backend_simple_usa_search_filter(reclutador):
+    crear_vacante(reclutador, "Desarrollador Backend")
+
+    assert buscar("Backend") == ["Desarrollador Backend"]
+    assert buscar("desarrolladores") == []
@@ -0,0 +1,180 @@
+import pytest
+from django.contrib.auth.models import update_last_login
+from django.db import transaction
+from django.urls import reverse
+from rest_framework.test import APIClient
+from usuarios.models import Usuario, PerfilReclutador
+from empleos.models import Vacante
+from empleos import cache
+
+
+@pytest.fixture
+def vacante(db, django_capture_on_commit_callbacks):
+    reclutador = Usuario.objects.create(username="reclu_cache", first_name="Ana", rol="reclutador")
+    PerfilReclutador.objects.create(user=reclutador, empresa="Empresa X", cargo="Gerente", telefono="123")
+    with django_capture_on_commit_callbacks(execute=True):
+        return Vacante.objects.create(
+            titulo="Backend",
+            descripcion="APIs",
+            requisitos="Python",
+            tipo_contrato="Indefinido",
+            reclutador=reclutador
+        )
+
+
+@pytest.mark.django_db
+def test_listado_se_sirve_desde_cache(vacante, django_assert_num_queries):
+    client = APIClient()
+    url = reverse("vacante-list")
+    primera = client.get(url, {"ubicacion": "", "page": 1})
+
+    with django_assert_num_queries(0):
+        segunda = client.get(url, {"page": 1, "ubicacion": ""})
+
+    assert segunda.data == primera.data
+    assert cache.estadisticas()["aciertos"] == 1
+
+
+@pytest.mark.django_db
+def test_editar_vacante_invalida_listado_y_detalle(vacante, django_capture_on_commit_callbacks):
+    client = APIClient()
+    client.get(reverse("vacante-list"))
+    client.get(reverse("vacante-detail", args=[vacante.id]))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        vacante.titulo = "Backend Senior"
+        vacante.save()
+
+    assert client.get(reverse("vacante-list")).data["results"][0]["titulo"] == "Backend Senior"
+    assert client.get(reverse("vacante-detail", args=[vacante.id])).data["titulo"] == "Backend Senior"
+    assert cache.estadisticas()["aciertos"] == 0
+
+
+@pytest.mark.django_db
+def test_cambios_del_reclutador_invalidan_sus_vacantes(vacante, django_capture_on_commit_callbacks):
+    client = APIClient()
+    url = reverse("vacante-detail", args=[vacante.id])
+    client.get(url)
+
+    perfil = vacante.reclutador.perfil_reclutador
+    perfil.empresa = "Empresa Y"
+    with django_capture_on_commit_callbacks(execute=True):
+        perfil.save()
+    assert client.get(url).data["reclutador"]["perfil_reclutador"]["empresa"] == "Empresa Y"
+
+    vacante.reclutador.first_name = "Andrea"
+    with django_capture_on_commit_callbacks(execute=True):
+        vacante.reclutador.save()
+    assert client.get(url).data["reclutador"]["first_name"] == "Andrea"
+
+
+@pytest.mark.django_db
+def test_reclutador_no_usa_cache(vacante):
+    client = APIClient()
+    client.force_authenticate(user=vacante.reclutador)
+    client.get(reverse("vacante-list"))
+    client.get(reverse("vacante-list"))
+
+    assert cache.estadisticas()["aciertos"] == cache.estadisticas()["fallos"] == 0
+
+
+@pytest.mark.django_db
+def test_estadisticas_solo_para_administradores(vacante):
+    client = APIClient()
+    client.get(reverse("vacante-list"))
+    assert client.get(reverse("vacante-estadisticas-cache")).status_code == 401
+
+    admin = Usuario.objects.create(username="admin", is_staff=True, rol="reclutador")
+    client.force_authenticate(user=admin)
+    response = client.get(reverse("vacante-estadisticas-cache"))
+
+    assert response.status_code == 200
+    assert response.data["fallos"] == 1
+    assert response.data["invalidaciones"] >= 1
+
+
+@pytest.mark.django_db
+def test_detalle_con_fields_no_pisa_el_detalle_completo(vacante):
+    client = APIClient()
+    url = reverse("vacante-detail", args=[vacante.id])
+
+    assert client.get(url, {"fields": "id"}).data == {"id": vacante.id}
+    completo = client.get(url).data
+    assert completo["titulo"] == "Backend"
+    assert completo["reclutador"]["perfil_reclutador"]["empresa"] == "Empresa X"
+    assert client.get(url, {"fields": "id"}).data == {"id": vacante.id}
+    assert cache.estadisticas()["aciertos"] == 1
+
+
+@pytest.mark.django_db
+def test_cada_formato_tiene_su_entrada(vacante):
+    client = APIClient()
+    url = reverse("vacante-detail", args=[vacante.id])
+
+    html = client.get(url, HTTP_ACCEPT="text/html")
+    plano = client.get(url, HTTP_ACCEPT="application/json")
+
+    assert html["Content-Type"].startswith("text/html")
+    assert plano["ETag"] != html["ETag"]
+    assert client.get(url, HTTP_ACCEPT="application/json")["ETag"] == plano["ETag"]
+    assert cache.estadisticas()["aciertos"] == 1
+
+
+@pytest.mark.django_db
+def test_cuenta_desalojos_pero_no_invalidaciones(vacante, monkeypatch, django_capture_on_commit_callbacks):
+    guardadas = []
+    guardar = cache.guardar
+    monkeypatch.setattr(cache, "guardar", lambda clave, response: (guardadas.append(clave), guardar(clave, response)))
+    client = APIClient()
+    url = reverse("vacante-list")
+    client.get(url)
+
+    cache._cache().delete(guardadas[0])  # el backend la desaloja antes de vencer
+    client.get(url)
+    with django_capture_on_commit_callbacks(execute=True):
+        vacante.save()
+    client.get(url)
+
+    assert cache.estadisticas()["fallos"] == 3
+    assert cache.estadisticas()["desalojos"] == 1
+
+
+@pytest.mark.django_db
+def test_invalidacion_espera_al_commit(vacante, django_capture_on_commit_callbacks):
+    version = f"vacantes:detalle:{vacante.id}:ver"
+    antes = cache._version(version), cache._version(cache.CLAVE_GENERACION)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            vacante.titulo = "Backend Senior"
+            vacante.save()
+            # Quien lea antes del commit arma la clave vieja: lo que guarde no sobrevive al commit
+            assert (cache._version(version), cache._version(cache.CLAVE_GENERACION)) == antes
+
+    assert cache._version(version) == antes[0] + 1
+    assert cache._version(cache.CLAVE_GENERACION) == antes[1] + 1
+
+
+@pytest.mark.django_db
+def test_guardar_el_reclutador_sin_cambios_anidados_no_invalida(vacante, django_capture_on_commit_callbacks):
+    reclutador = vacante.reclutador
+    version = vacante.fecha_actualizacion
+    generacion = cache._version(cache.CLAVE_GENERACION)
+
+    with django_capture_on_commit_callbacks(execute=True) as al_confirmar:
+        update_last_login(None, reclutador)
+        reclutador.set_password("Nueva123$")
+        reclutador.save(update_fields=["password"])
+        reclutador.save()
+
+    assert al_confirmar == []
+    assert cache._version(cache.CLAVE_GENERACION) == generacion
+    vacante.refresh_from_db()
+    assert vacante.fecha_actualizacion == version
+
+    reclutador.email = "ana@empresa.co"
+    with django_capture_on_commit_callbacks(execute=True):
+        reclutador.save()
+    vacante.refresh_from_db()
+    assert vacante.fecha_actualizacion > version
+    assert cache._version(cache.CLAVE_GENERACION) == generacion + 1
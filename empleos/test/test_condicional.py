@@ -0,0 +1,132 @@
+import pytest
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+from usuarios.models import Usuario, PerfilReclutador, PerfilCandidato
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+
+
+@pytest.fixture
+def vacante(db):
+    reclutador = Usuario.objects.create(username="reclu_etag", first_name="Ana", rol="reclutador")
+    PerfilReclutador.objects.create(user=reclutador, empresa="Empresa X", cargo="Gerente", telefono="123")
+    return Vacante.objects.create(
+        titulo="Backend",
+        descripcion="APIs",
+        requisitos="Python",
+        tipo_contrato="Indefinido",
+        reclutador=reclutador
+    )
+
+
+@pytest.mark.django_db
+def test_detalle_responde_304_con_if_none_match(vacante, django_capture_on_commit_callbacks):
+    client = APIClient()
+    url = reverse("vacante-detail", args=[vacante.id])
+    primera = client.get(url)
+    etag = primera["ETag"]
+
+    segunda = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert segunda.status_code == 304
+    assert segunda["ETag"] == etag
+    assert not segunda.content
+
+    with django_capture_on_commit_callbacks(execute=True):
+        vacante.titulo = "Backend Senior"
+        vacante.save()
+    tercera = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert tercera.status_code == 200
+    assert tercera["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_detalle_responde_304_con_if_modified_since(vacante):
+    client = APIClient()
+    url = reverse("vacante-detail", args=[vacante.id])
+    ultima = client.get(url)["Last-Modified"]
+
+    assert client.get(url, HTTP_IF_MODIFIED_SINCE=ultima).status_code == 304
+    anterior = http_date(vacante.fecha_actualizacion.timestamp() - 60)
+    assert client.get(url, HTTP_IF_MODIFIED_SINCE=anterior).status_code == 200
+
+
+@pytest.mark.django_db
+def test_listado_cambia_etag_al_publicar_vacante(vacante, django_capture_on_commit_callbacks):
+    client = APIClient()
+    url = reverse("vacante-list")
+    etag = client.get(url)["ETag"]
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Vacante.objects.create(
+            titulo="Frontend", descripcion="UI", requisitos="React",
+            tipo_contrato="Indefinido", reclutador=vacante.reclutador
+        )
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data["count"] == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ruta", ["vacante-list", "vacante-list-async"])
+def test_listado_ignora_if_modified_since_tras_borrar(vacante, settings, ruta):
+    settings.VACANTES_CACHE_ACTIVA = False
+    otra = Vacante.objects.create(
+        titulo="Frontend", descripcion="UI", requisitos="React",
+        tipo_contrato="Indefinido", reclutador=vacante.reclutador
+    )
+    client = APIClient()
+    url = reverse(ruta)
+    assert "Last-Modified" not in client.get(url)
+
+    ultima = http_date(max(vacante.fecha_actualizacion, otra.fecha_actualizacion).timestamp() + 60)
+    otra.delete()
+    response = client.get(url, HTTP_IF_MODIFIED_SINCE=ultima)
+
+    assert response.status_code == 200
+    assert [v["id"] for v in response.json()["results"]] == [vacante.id]
+
+
+@pytest.mark.django_db
+def test_listado_sin_cache_responde_304_sin_serializar(vacante, settings, django_assert_num_queries):
+    settings.VACANTES_CACHE_ACTIVA = False
+    client = APIClient()
+    url = reverse("vacante-list")
+    etag = client.get(url, {"paginacion": "cursor"})["ETag"]
+
+    with django_assert_num_queries(1):
+        response = client.get(url, {"paginacion": "cursor"}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_cambio_en_perfil_del_reclutador_cambia_etag(vacante, settings, django_capture_on_commit_callbacks):
+    settings.VACANTES_CACHE_ACTIVA = False
+    client = APIClient()
+    url = reverse("vacante-detail", args=[vacante.id])
+    etag = client.get(url)["ETag"]
+
+    perfil = vacante.reclutador.perfil_reclutador
+    perfil.empresa = "Empresa Y"
+    with django_capture_on_commit_callbacks(execute=True):
+        perfil.save()
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_postulacion_detalle_condicional(vacante):
+    candidato = Usuario.objects.create(username="cand_etag", rol="candidato")
+    PerfilCandidato.objects.create(user=candidato, telefono="1", ciudad="Cali")
+    postulacion = Postulacion.objects.create(candidato=candidato, vacante=vacante)
+    client = APIClient()
+    client.force_authenticate(user=candidato)
+    url = reverse("postulaciones-detail", args=[postulacion.id])
+    etag = client.get(url)["ETag"]
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    # la vacante va anidada: editarla cambia la representación
+    vacante.titulo = "Backend Senior"
+    vacante.save()
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
@@ -0,0 +1,80 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from empleos.models import Vacante
+from usuarios.models import PerfilReclutador, Usuario
+
+DESCRIPCION = "Diseñar y mantener APIs REST con Django, " * 20
+
+
+@pytest.fixture
+def vacante(db):
+    reclutador = Usuario.objects.create(username="reclu_lista", first_name="Ana", rol="reclutador")
+    PerfilReclutador.objects.create(user=reclutador, empresa="Empresa Lista", cargo="CTO", telefono="1")
+    return Vacante.objects.create(titulo="Backend", descripcion=DESCRIPCION, requisitos="Python " * 200,
+                                  ubicacion="Pasto", tipo_contrato="Indefinido", reclutador=reclutador)
+
+
+@pytest.mark.django_db
+def test_listado_trae_la_tarjeta_sin_textos_completos(vacante):
+    client = APIClient()
+
+    with CaptureQueriesContext(connection) as consultas:
+        [tarjeta] = client.get(reverse("vacante-list")).data["results"]
+
+    assert tarjeta["empresa"] == "Empresa Lista"
+    assert tarjeta["reclutador"] == vacante.reclutador_id
+    assert "descripcion" not in tarjeta and "requisitos" not in tarjeta
+    assert tarjeta["resumen"].endswith("…") and len(tarjeta["resumen"]) <= 201
+    assert DESCRIPCION.startswith(tarjeta["resumen"][:-1])
+    listado = consultas.captured_queries[-1]["sql"]
+    assert listado.count('"empleos_vacante"."descripcion"') == 1  # solo dentro de SUBSTR
+    assert 'SUBSTR("empleos_vacante"."descripcion", 1, 201)' in listado
+    assert '"empleos_vacante"."requisitos"' not in listado
+
+
+@pytest.mark.django_db
+def test_resumen_corto_se_devuelve_entero(vacante):
+    vacante.descripcion = "APIs REST."
+    vacante.save()
+
+    [tarjeta] = APIClient().get(reverse("vacante-list")).data["results"]
+
+    assert tarjeta["resumen"] == "APIs REST."
+
+
+@pytest.mark.parametrize("descripcion, resumen", [
+    # El carácter 201 es un espacio: la palabra 200 está completa
+    ("Python " * 28 + "Java y Go", "Python " * 28 + "Java…"),
+    ("Python " * 28 + "Javascript", "Python " * 27 + "Python…"),
+])
+def test_resumen_en_el_limite_de_una_palabra(vacante, descripcion, resumen):
+    vacante.descripcion = descripcion
+    vacante.save()
+
+    [tarjeta] = APIClient().get(reverse("vacante-list")).data["results"]
+
+    assert tarjeta["resumen"] == resumen
+
+
+@pytest.mark.django_db
+def test_detalle_mantiene_la_representacion_completa(vacante):
+    datos = APIClient().get(reverse("vacante-detail", args=[vacante.id])).data
+
+    assert datos["descripcion"] == DESCRIPCION
+    assert datos["reclutador"]["perfil_reclutador"]["empresa"] == "Empresa Lista"
+
+
+@pytest.mark.django_db
+def test_listado_async_usa_la_misma_tarjeta(vacante, settings):
+    settings.VACANTES_CACHE_ACTIVA = False
+    client = APIClient()
+
+    sincrono = client.get(reverse("vacante-list")).json()
+    asincrono = client.get(reverse("vacante-list-async")).json()
+
+    assert asincrono["results"] == sincrono["results"]
+    assert "resumen" in asincrono["results"][0]
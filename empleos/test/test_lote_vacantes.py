@@ -0,0 +1,74 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from usuarios.models import Usuario, PerfilReclutador
+from empleos.models import Vacante
+
+
+def vacante_valida(i):
+    return {
+        "titulo": f"Vacante {i}",
+        "descripcion": "APIs",
+        "requisitos": "Python",
+        "tipo_contrato": "Indefinido",
+        "ubicacion": "Pasto",
+    }
+
+
+@pytest.fixture
+def reclutador(db):
+    reclutador = Usuario.objects.create(username="reclu_lote", rol="reclutador")
+    PerfilReclutador.objects.create(user=reclutador, empresa="Empresa X", cargo="Gerente", telefono="123")
+    return reclutador
+
+
+@pytest.mark.django_db
+def test_publicar_vacantes_en_lote(reclutador, django_assert_max_num_queries):
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+
+    with django_assert_max_num_queries(3):
+        response = client.post(reverse("vacante-lote"), [vacante_valida(i) for i in range(25)], format="json")
+
+    assert response.status_code == 201
+    assert len(response.data["vacantes"]) == 25
+    assert response.data["vacantes"][0]["reclutador"]["perfil_reclutador"]["empresa"] == "Empresa X"
+    assert Vacante.objects.filter(reclutador=reclutador).count() == 25
+
+
+@pytest.mark.django_db
+def test_lote_con_errores_no_crea_ninguna(reclutador):
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    invalida = {"titulo": "Sin descripción"}
+
+    response = client.post(
+        reverse("vacante-lote"), {"vacantes": [vacante_valida(0), invalida]}, format="json"
+    )
+
+    assert response.status_code == 400
+    assert response.data["errores"][0] == {}
+    assert "descripcion" in response.data["errores"][1]
+    assert not Vacante.objects.exists()
+
+
+@pytest.mark.django_db
+def test_lote_invalida_cache_del_listado(reclutador, django_capture_on_commit_callbacks):
+    client = APIClient()
+    assert client.get(reverse("vacante-list")).data["count"] == 0
+
+    client.force_authenticate(user=reclutador)
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(reverse("vacante-lote"), [vacante_valida(0)], format="json")
+
+    assert APIClient().get(reverse("vacante-list")).data["count"] == 1
+
+
+@pytest.mark.django_db
+def test_lote_solo_para_reclutadores():
+    candidato = Usuario.objects.create(username="cand_lote", rol="candidato")
+    client = APIClient()
+    client.force_authenticate(user=candidato)
+
+    assert client.post(reverse("vacante-lote"), [vacante_valida(0)], format="json").status_code == 403
+    assert APIClient().post(reverse("vacante-lote"), [vacante_valida(0)], format="json").status_code == 401
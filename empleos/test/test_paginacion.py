@@ -0,0 +1,148 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from django.db.models import QuerySet
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from usuarios.models import Usuario
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+from jobconnect_api import pagination
+
+
+@pytest.fixture
+def reclutador(db):
+    return Usuario.objects.create_user(
+        username="reclu_paginas",
+        email="paginas@test.com",
+        password="Reclu123$",
+        rol="reclutador"
+    )
+
+
+def crear_vacantes(reclutador, cantidad):
+    vacantes = [
+        Vacante.objects.create(
+            titulo=f"Vacante {i}",
+            descripcion="Descripción",
+            requisitos="Requisitos",
+            tipo_contrato="Indefinido",
+            reclutador=reclutador
+        )
+        for i in range(cantidad)
+    ]
+    # Varias vacantes con la misma fecha para probar el desempate por id
+    Vacante.objects.filter(id__in=[v.id for v in vacantes[:4]]).update(fecha_publicacion=timezone.now())
+    return vacantes
+
+
+def recorrer(client, url, params):
+    ids = []
+    response = client.get(url, params)
+    while True:
+        assert response.status_code == 200
+        assert "count" not in response.data
+        ids += [r["id"] for r in response.data["results"]]
+        if not response.data["next"]:
+            return ids, response
+        response = client.get(response.data["next"])
+
+
+@pytest.mark.django_db
+def test_cursor_recorre_todas_las_vacantes_sin_repetir(reclutador):
+    crear_vacantes(reclutador, 7)
+    client = APIClient()
+
+    ids, _ = recorrer(client, reverse("vacante-list"), {"paginacion": "cursor", "page_size": 3})
+
+    esperado = list(Vacante.objects.order_by("-fecha_publicacion", "-id").values_list("id", flat=True))
+    assert ids == esperado
+
+
+@pytest.mark.django_db
+def test_cursor_permite_volver_a_la_pagina_anterior(reclutador):
+    crear_vacantes(reclutador, 5)
+    client = APIClient()
+
+    primera = client.get(reverse("vacante-list"), {"paginacion": "cursor", "page_size": 2})
+    segunda = client.get(primera.data["next"])
+    anterior = client.get(segunda.data["previous"])
+
+    assert anterior.data["results"] == primera.data["results"]
+    assert anterior.data["previous"] is None
+
+
+@pytest.mark.django_db
+def test_cursor_invalido_devuelve_404():
+    client = APIClient()
+    response = client.get(reverse("vacante-list"), {"cursor": "no-es-un-cursor"})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_conteo_estimado(reclutador):
+    crear_vacantes(reclutador, 3)
+    client = APIClient()
+
+    response = client.get(reverse("vacante-list"), {"conteo": "estimado"})
+
+    assert response.status_code == 200
+    assert response.data["count"] == 3
+    assert response.data["count_estimado"] is True
+
+
+def simular_postgresql(monkeypatch, filas_estimadas):
+    monkeypatch.setattr(pagination, "connections", {"default": SimpleNamespace(vendor="postgresql")})
+    monkeypatch.setattr(QuerySet, "explain",
+                        lambda self, **kwargs: json.dumps([{"Plan": {"Plan Rows": filas_estimadas}}]))
+
+
+@pytest.mark.django_db
+def test_conteo_estimado_corto_no_pierde_paginas(reclutador, monkeypatch):
+    crear_vacantes(reclutador, 7)
+    simular_postgresql(monkeypatch, 1)
+    client = APIClient()
+    url = reverse("vacante-list")
+
+    segunda = client.get(url, {"conteo": "estimado", "page_size": 3, "page": 2})
+    tercera = client.get(url, {"conteo": "estimado", "page_size": 3, "page": 3})
+    cursor = client.get(url, {"conteo": "estimado", "paginacion": "cursor", "page_size": 3})
+
+    assert segunda.data["count"] == 7
+    assert segunda.data["next"] is not None
+    assert tercera.status_code == 200
+    assert len(tercera.data["results"]) == 1
+    assert cursor.data["count"] == 7
+
+
+@pytest.mark.django_db
+def test_conteo_estimado_usa_el_planificador_si_alcanza(reclutador, monkeypatch):
+    crear_vacantes(reclutador, 3)
+    simular_postgresql(monkeypatch, 5000)
+    client = APIClient()
+
+    response = client.get(reverse("vacante-list"), {"conteo": "estimado", "page_size": 3})
+
+    assert response.data["count"] == 5000
+
+
+@pytest.mark.django_db
+def test_cursor_en_mis_postulaciones(reclutador):
+    candidato = Usuario.objects.create_user(
+        username="candi_paginas",
+        email="candi_paginas@test.com",
+        password="Candi123$",
+        rol="candidato"
+    )
+    for vacante in crear_vacantes(reclutador, 4):
+        Postulacion.objects.create(candidato=candidato, vacante=vacante)
+
+    client = APIClient()
+    client.force_authenticate(user=candidato)
+    ids, ultima = recorrer(client, reverse("mis-postulaciones"), {"paginacion": "cursor", "page_size": 3})
+
+    assert len(ids) == len(set(ids)) == 4
+    assert len(ultima.data["results"]) == 1
@@ -1,5 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from jobconnect_api.asincrono import vista_async
 from .views import VacanteViewSet
 
 router = DefaultRouter()
@@ -7,4 +8,8 @@ router.register(r'vacantes', VacanteViewSet, basename='vacante')
 
 urlpatterns = [
     path('', include(router.urls)),
+
+    # Lecturas asíncronas (ver jobconnect_api/asincrono.py)
+    path('async/vacantes/', vista_async(VacanteViewSet, 'list'), name='vacante-list-async'),
+    path('async/vacantes/<int:pk>/', vista_async(VacanteViewSet, 'retrieve'), name='vacante-detail-async'),
 ]
@@ -1,27 +1,49 @@
 # from rest_framework.permissions import IsAuthenticated    
+from datetime import datetime, timezone as dt_timezone
+from django.utils.http import parse_http_date_safe
 from rest_framework import viewsets, permissions, status
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from .models import Vacante
-from .serializers import VacanteSerializer
+from .serializers import VacanteListaSerializer, VacanteSerializer
+from .search import VacanteSearchFilter
+from . import cache
+from jobconnect_api.asincrono import LecturaAsyncMixin
+from jobconnect_api.conditional import ConditionalGetMixin
+from jobconnect_api.eager_loading import EagerLoadingMixin
 from rest_framework.response import Response
+from django.db.models import Exists, OuterRef
+from postulaciones.models import Postulacion
+from recomendaciones.models import Afinidad, Posting
+from recomendaciones.serializers import CandidatoRecomendadoSerializer, VacanteRecomendadaSerializer
+from recomendaciones.signals import programar
 
 # Create your views here.
-class VacanteViewSet(viewsets.ModelViewSet):
+class VacanteViewSet(LecturaAsyncMixin, ConditionalGetMixin, EagerLoadingMixin, viewsets.ModelViewSet):
     serializer_class = VacanteSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, VacanteSearchFilter, filters.OrderingFilter]
     filterset_fields = ['ubicacion', 'tipo_contrato']
     search_fields = ['titulo', 'descripcion', 'requisitos']
     ordering_fields = ['fecha_publicacion', 'titulo']
+    keyset_ordering = ('-fecha_publicacion', '-id')  # ?paginacion=cursor
+    parametros_sincronos = ('search',)  # el backend de búsqueda consulta si hay índice
+    max_lote = 100
     
     def get_permissions(self):
         if self.action in ['update', 'partial_update', 'destroy']:
             return [permissions.IsAuthenticated()]
         return super().get_permissions()
     
+    def get_serializer_class(self):
+        # El listado lleva la representación compacta; el detalle, la completa
+        if self.action == 'list':
+            return VacanteListaSerializer
+        return super().get_serializer_class()
+
     def get_queryset(self):
         user = self.request.user
         
@@ -31,11 +53,70 @@ class VacanteViewSet(viewsets.ModelViewSet):
         
         # Si está autenticado y es reclutador -> solo sus vacantes  
         if user.is_authenticated and user.rol == 'reclutador':
-            return Vacante.objects.filter(reclutador=user).order_by('-fecha_publicacion')
-        
-        # Todos los usuarios ven vacantes publicadas
-        return Vacante.objects.all().order_by('-fecha_publicacion')
+            queryset = Vacante.objects.filter(reclutador=user).order_by('-fecha_publicacion')
+        else:
+            # Todos los usuarios ven vacantes publicadas
+            queryset = Vacante.objects.all().order_by('-fecha_publicacion')
+        if self.action == 'list':
+            queryset = VacanteListaSerializer.preparar(queryset)
+        return queryset
     
+    def list(self, request, *args, **kwargs):
+        if not cache.cacheable(request):
+            return super().list(request, *args, **kwargs)
+        clave = cache.clave_lista(request)
+        entrada = cache.obtener(clave)
+        if entrada is not None:
+            return self.respuesta_cacheada(request, entrada)
+        response = super().list(request, *args, **kwargs)
+        cache.guardar(clave, response)
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        if not cache.cacheable(request):
+            return super().retrieve(request, *args, **kwargs)
+        clave = cache.clave_detalle(request, kwargs[self.lookup_field])
+        entrada = cache.obtener(clave)
+        if entrada is not None:
+            return self.respuesta_cacheada(request, entrada)
+        response = super().retrieve(request, *args, **kwargs)
+        cache.guardar(clave, response)
+        return response
+
+    # Variantes asíncronas (/api/async/vacantes/). La caché de respuestas es
+    # local o de red cercana, así que se consulta sin pasar a un hilo.
+    async def alist(self, request, *args, **kwargs):
+        if self.requiere_sincrono(request) or not cache.cacheable(request):
+            return await super().alist(request, *args, **kwargs)
+        clave = cache.clave_lista(request)
+        entrada = cache.obtener(clave)
+        if entrada is not None:
+            return self.respuesta_cacheada(request, entrada)
+        response = await super().alist(request, *args, **kwargs)
+        cache.guardar(clave, response)
+        return response
+
+    async def aretrieve(self, request, *args, **kwargs):
+        if not cache.cacheable(request):
+            return await super().aretrieve(request, *args, **kwargs)
+        clave = cache.clave_detalle(request, kwargs[self.lookup_field])
+        entrada = cache.obtener(clave)
+        if entrada is not None:
+            return self.respuesta_cacheada(request, entrada)
+        response = await super().aretrieve(request, *args, **kwargs)
+        cache.guardar(clave, response)
+        return response
+
+    def respuesta_cacheada(self, request, entrada):
+        segundos = parse_http_date_safe(entrada['last_modified'] or '')
+        modificado = datetime.fromtimestamp(segundos, tz=dt_timezone.utc) if segundos else None
+        return self.respuesta_condicional(request, entrada['etag'], modificado, entrada['datos'])
+
+    @action(detail=False, methods=['get'], url_path='estadisticas-cache',
+            permission_classes=[permissions.IsAdminUser])
+    def estadisticas_cache(self, request):
+        return Response(cache.estadisticas())
+
     def perform_create(self, serializer):
         # valida el rol (solo reclutadores pueden crear vacantes)
         user = self.request.user
@@ -43,6 +124,72 @@ class VacanteViewSet(viewsets.ModelViewSet):
             raise PermissionDenied("Solo los reclutadores pueden crear vacantes.")
         serializer.save(reclutador=user)
     
+    @action(detail=False, methods=['post'], permission_classes=[permissions.IsAuthenticated])
+    def lote(self, request):
+        """
+        Publica varias vacantes con un solo ``INSERT``. Recibe una lista (o
+        ``{"vacantes": [...]}``); si alguna no es válida no se crea ninguna y
+        ``errores`` trae los errores en la misma posición que cada vacante.
+        """
+        if request.user.rol != 'reclutador':
+            raise PermissionDenied("Solo los reclutadores pueden crear vacantes.")
+        datos = request.data.get('vacantes') if isinstance(request.data, dict) else request.data
+        if not isinstance(datos, list) or not datos:
+            raise ValidationError({"vacantes": "Envía una lista con al menos una vacante."})
+        if len(datos) > self.max_lote:
+            raise ValidationError({"vacantes": f"Máximo {self.max_lote} vacantes por petición."})
+
+        serializer = self.get_serializer(data=datos, many=True)
+        if not serializer.is_valid():
+            return Response({"errores": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        vacantes = Vacante.objects.bulk_create([
+            Vacante(reclutador=request.user, **campos) for campos in serializer.validated_data
+        ])
+        # bulk_create no emite post_save
+        cache.invalidar([v.pk for v in vacantes])
+        for vacante in vacantes:
+            programar(Posting.VACANTE, vacante.pk)
+        return Response({
+            "mensaje": f"{len(vacantes)} vacantes publicadas con éxito.",
+            "vacantes": self.get_serializer(vacantes, many=True).data
+        }, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get'], url_path='candidatos-recomendados',
+            permission_classes=[permissions.IsAuthenticated])
+    def candidatos_recomendados(self, request, pk=None):
+        """Candidatos con más afinidad con una vacante del reclutador (``?limite=``, máx. 100)."""
+        if request.user.rol != 'reclutador':
+            raise PermissionDenied("Solo los reclutadores pueden ver candidatos recomendados.")
+        vacante = self.get_object()
+        postulado = Postulacion.objects.filter(vacante=vacante, candidato=OuterRef('candidato'))
+        afinidades = (
+            vacante.afinidades.select_related('candidato__perfil_candidato')
+            .annotate(ya_postulado=Exists(postulado))
+            .order_by('-puntaje')[:self.limite_recomendaciones(request)]
+        )
+        return Response(CandidatoRecomendadoSerializer(afinidades, many=True).data)
+
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
+    def recomendadas(self, request):
+        """Vacantes con más afinidad con el perfil del candidato, sin las que ya se postuló."""
+        if request.user.rol != 'candidato':
+            raise PermissionDenied("Solo los candidatos tienen vacantes recomendadas.")
+        postulado = Postulacion.objects.filter(candidato=request.user, vacante=OuterRef('vacante'))
+        afinidades = (
+            Afinidad.objects.filter(candidato=request.user).exclude(Exists(postulado))
+            .select_related('vacante__reclutador__perfil_reclutador')
+            .order_by('-puntaje')[:self.limite_recomendaciones(request)]
+        )
+        return Response(VacanteRecomendadaSerializer(afinidades, many=True).data)
+
+    def limite_recomendaciones(self, request):
+        try:
+            limite = int(request.query_params.get('limite', 20))
+        except ValueError:
+            raise ValidationError({"limite": "Debe ser un número entero."})
+        return max(1, min(limite, 100))
+
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -0,0 +1,29 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from estadisticas.rollups import compactar
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula los resúmenes diarios de postulaciones a partir de los datos. "
+        "Pensado para ejecutarse una vez al día (por defecto recalcula ayer y anteayer)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--desde', help='Primer día (AAAA-MM-DD).')
+        parser.add_argument('--hasta', help='Último día (AAAA-MM-DD); por defecto, ayer.')
+        parser.add_argument('--dias', type=int, default=2, help='Días hacia atrás si no se indica --desde.')
+
+    def handle(self, *args, **options):
+        try:
+            hasta = date.fromisoformat(options['hasta']) if options['hasta'] else timezone.localdate() - timedelta(days=1)
+            desde = date.fromisoformat(options['desde']) if options['desde'] else hasta - timedelta(days=options['dias'] - 1)
+        except ValueError:
+            raise CommandError('Las fechas deben tener el formato AAAA-MM-DD.')
+        if desde > hasta:
+            raise CommandError('--desde no puede ser posterior a --hasta.')
+        filas = compactar(desde, hasta)
+        self.stdout.write(self.style.SUCCESS(f'Resúmenes del {desde} al {hasta}: {filas} filas.'))
@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2026-10-18 11:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('empleos', '0004_vacante_contadores_postulaciones'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EstadisticaDiaria',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateField()),
+                ('postulaciones', models.IntegerField(default=0)),
+                ('decisiones', models.IntegerField(default=0)),
+                ('seleccionadas', models.IntegerField(default=0)),
+                ('descartadas', models.IntegerField(default=0)),
+                ('segundos_decision', models.BigIntegerField(default=0)),
+                ('vacante', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='estadisticas', to='empleos.vacante')),
+            ],
+            options={
+                'unique_together': {('vacante', 'fecha')},
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-18 16:40
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def calcular_cohortes(apps, schema_editor):
+    EstadisticaDiaria = apps.get_model('estadisticas', 'EstadisticaDiaria')
+    Postulacion = apps.get_model('postulaciones', 'Postulacion')
+    cohortes = (
+        Postulacion.objects.order_by().filter(estado='seleccionado')
+        .values('vacante_id', dia=TruncDate('fecha_postulacion'))
+        .annotate(total=Count('id'))
+    )
+    for fila in cohortes.iterator():
+        EstadisticaDiaria.objects.filter(vacante_id=fila['vacante_id'], fecha=fila['dia']).update(
+            postulaciones_seleccionadas=fila['total']
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('estadisticas', '0001_initial'),
+        ('postulaciones', '0004_postulacion_fecha_decision'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='estadisticadiaria',
+            name='postulaciones_seleccionadas',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(calcular_cohortes, migrations.RunPython.noop),
+    ]
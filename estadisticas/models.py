@@ -0,0 +1,27 @@
+from django.db import models
+
+from empleos.models import Vacante
+
+
+class EstadisticaDiaria(models.Model):
+    """
+    Resumen por vacante y día. Las postulaciones cuentan en el día en que se
+    crearon; las decisiones, en el día de su ``fecha_decision``, clasificadas
+    por el estado actual de la postulación. ``postulaciones_seleccionadas``
+    son las postulaciones creadas ese día que hoy están seleccionadas (la
+    misma cohorte que ``postulaciones``).
+    """
+    vacante = models.ForeignKey(Vacante, on_delete=models.CASCADE, related_name='estadisticas')
+    fecha = models.DateField()
+    postulaciones = models.IntegerField(default=0)
+    postulaciones_seleccionadas = models.IntegerField(default=0)
+    decisiones = models.IntegerField(default=0)
+    seleccionadas = models.IntegerField(default=0)
+    descartadas = models.IntegerField(default=0)
+    segundos_decision = models.BigIntegerField(default=0)  # suma, para promediar sobre ``decisiones``
+
+    class Meta:
+        unique_together = ['vacante', 'fecha']
+
+    def __str__(self):
+        return f"{self.vacante_id} - {self.fecha}"
@@ -0,0 +1,133 @@
+"""
+Resúmenes diarios de postulaciones (``EstadisticaDiaria``).
+
+Se mantienen de dos formas que dan el mismo resultado:
+
+- ``registrar()``: las vistas pasan el antes y el después de cada
+  postulación que crean, cambian o eliminan, y se suma la diferencia de sus
+  aportes con ``F()``.
+- ``compactar()``: recalcula desde las postulaciones los días indicados
+  (comando ``compactar_estadisticas``), y corrige lo que no pasó por las
+  vistas.
+
+``agregar()`` es la agregación en vivo que usan ``compactar()`` y el día en
+curso de ``/api/estadisticas/``.
+
+Las decisiones se cuentan el día en que se tomaron, pero
+``postulaciones_seleccionadas`` va al día de la postulación: es el
+numerador de la tasa de selección, que compara cada cohorte de
+postulaciones consigo misma.
+"""
+from collections import Counter, defaultdict, namedtuple
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count, DurationField, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from postulaciones.models import Postulacion
+from .models import EstadisticaDiaria
+
+CAMPOS = (
+    'postulaciones', 'postulaciones_seleccionadas', 'decisiones', 'seleccionadas', 'descartadas',
+    'segundos_decision',
+)
+CAMPO_POR_ESTADO = {'seleccionado': 'seleccionadas', 'descartado': 'descartadas'}
+
+# Lo que de una postulación afecta a los resúmenes
+Foto = namedtuple('Foto', 'vacante_id fecha_postulacion estado fecha_decision')
+
+
+def foto(postulacion):
+    return Foto(postulacion.vacante_id, postulacion.fecha_postulacion, postulacion.estado, postulacion.fecha_decision)
+
+
+def aportes(foto):
+    """``[((vacante_id, fecha), {campo: valor})]`` con lo que suma una postulación."""
+    if foto is None:
+        return []
+    creacion = {'postulaciones': 1, 'postulaciones_seleccionadas': int(foto.estado == 'seleccionado')}
+    resultado = [((foto.vacante_id, timezone.localdate(foto.fecha_postulacion)), creacion)]
+    if foto.fecha_decision is not None:
+        decision = {
+            'decisiones': 1,
+            'segundos_decision': int((foto.fecha_decision - foto.fecha_postulacion).total_seconds()),
+        }
+        if foto.estado in CAMPO_POR_ESTADO:
+            decision[CAMPO_POR_ESTADO[foto.estado]] = 1
+        resultado.append(((foto.vacante_id, timezone.localdate(foto.fecha_decision)), decision))
+    return resultado
+
+
+def registrar(cambios):
+    """Aplica ``cambios``: pares ``(antes, después)`` de ``Foto`` (None al crear o eliminar)."""
+    deltas = defaultdict(Counter)
+    for antes, despues in cambios:
+        for clave, valores in aportes(despues):
+            deltas[clave].update(valores)
+        for clave, valores in aportes(antes):
+            deltas[clave].subtract(valores)
+    deltas = {clave: {c: v for c, v in d.items() if v} for clave, d in deltas.items()}
+    deltas = {clave: d for clave, d in deltas.items() if d}
+    if not deltas:
+        return
+    EstadisticaDiaria.objects.bulk_create(
+        [EstadisticaDiaria(vacante_id=v, fecha=f) for v, f in deltas], ignore_conflicts=True
+    )
+    for (vacante_id, fecha), d in deltas.items():
+        EstadisticaDiaria.objects.filter(vacante_id=vacante_id, fecha=fecha).update(
+            **{c: F(c) + valor for c, valor in d.items()}
+        )
+
+
+def _inicio(fecha):
+    return timezone.make_aware(datetime.combine(fecha, time.min))
+
+
+def agregar(desde, hasta, vacantes=None):
+    """Agregación en vivo: ``{(vacante_id, fecha): {campo: valor}}`` para los días de ``desde`` a ``hasta``."""
+    inicio, fin = _inicio(desde), _inicio(hasta + timedelta(days=1))
+    postulaciones = Postulacion.objects.order_by()
+    if vacantes is not None:
+        postulaciones = postulaciones.filter(vacante__in=vacantes)
+
+    resultado = defaultdict(lambda: dict.fromkeys(CAMPOS, 0))
+    creadas = (
+        postulaciones.filter(fecha_postulacion__gte=inicio, fecha_postulacion__lt=fin)
+        .values('vacante_id', dia=TruncDate('fecha_postulacion'))
+        .annotate(total=Count('id'), seleccionadas=Count('id', filter=Q(estado='seleccionado')))
+    )
+    for fila in creadas:
+        valores = resultado[(fila['vacante_id'], fila['dia'])]
+        valores['postulaciones'] = fila['total']
+        valores['postulaciones_seleccionadas'] = fila['seleccionadas']
+
+    decididas = (
+        postulaciones.filter(fecha_decision__gte=inicio, fecha_decision__lt=fin)
+        .values('vacante_id', dia=TruncDate('fecha_decision'))
+        .annotate(
+            decisiones=Count('id'),
+            seleccionadas=Count('id', filter=Q(estado='seleccionado')),
+            descartadas=Count('id', filter=Q(estado='descartado')),
+            duracion=Sum(F('fecha_decision') - F('fecha_postulacion'), output_field=DurationField()),
+        )
+    )
+    for fila in decididas:
+        valores = resultado[(fila['vacante_id'], fila['dia'])]
+        for campo in ('decisiones', 'seleccionadas', 'descartadas'):
+            valores[campo] = fila[campo]
+        valores['segundos_decision'] = int(fila['duracion'].total_seconds()) if fila['duracion'] else 0
+    return dict(resultado)
+
+
+@transaction.atomic
+def compactar(desde, hasta):
+    """Reemplaza los resúmenes de ``desde`` a ``hasta`` por la agregación exacta; devuelve las filas escritas."""
+    EstadisticaDiaria.objects.filter(fecha__gte=desde, fecha__lte=hasta).delete()
+    filas = [
+        EstadisticaDiaria(vacante_id=vacante_id, fecha=fecha, **valores)
+        for (vacante_id, fecha), valores in agregar(desde, hasta).items()
+    ]
+    EstadisticaDiaria.objects.bulk_create(filas, batch_size=1000)
+    return len(filas)
@@ -0,0 +1,162 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from usuarios.models import Usuario
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+from estadisticas.models import EstadisticaDiaria
+from estadisticas.rollups import compactar
+
+CAMPOS = ("postulaciones", "decisiones", "seleccionadas", "descartadas", "segundos_decision",
+          "postulaciones_seleccionadas")
+
+
+@pytest.fixture
+def reclutador(db):
+    return Usuario.objects.create(username="reclu_est", rol="reclutador")
+
+
+def crear_vacante(reclutador, titulo="Backend"):
+    return Vacante.objects.create(
+        titulo=titulo, descripcion="APIs", requisitos="Python",
+        tipo_contrato="Indefinido", reclutador=reclutador
+    )
+
+
+def postularse(vacante, username):
+    client = APIClient()
+    client.force_authenticate(user=Usuario.objects.create(username=username, rol="candidato"))
+    return client.post(reverse("postulaciones-list"), {"vacante": vacante.id}).data["postulacion"]["id"]
+
+
+def resumenes():
+    return {
+        (r.vacante_id, r.fecha): tuple(getattr(r, c) for c in CAMPOS)
+        for r in EstadisticaDiaria.objects.all()
+        if any(getattr(r, c) for c in CAMPOS)
+    }
+
+
+@pytest.mark.django_db
+def test_resumen_incremental_coincide_con_la_compactacion(reclutador):
+    vacante = crear_vacante(reclutador)
+    ids = [postularse(vacante, f"cand_inc_{i}") for i in range(5)]
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    client.patch(reverse("postulaciones-detail", args=[ids[0]]), {"estado": "seleccionado"})
+    client.patch(reverse("postulaciones-detail", args=[ids[1]]), {"estado": "descartado"})
+    client.patch(reverse("postulaciones-detail", args=[ids[1]]), {"estado": "en revision"})
+    client.post(reverse("postulaciones-estado-lote"), {"ids": ids[2:4], "estado": "descartado"}, format="json")
+    client.post(reverse("postulaciones-estado-lote"), {"ids": ids[3:4], "estado": "seleccionado"}, format="json")
+    Postulacion.objects.filter(pk=ids[4]).delete()  # fuera de las vistas: lo corrige la compactación
+
+    hoy = timezone.localdate()
+    incremental = resumenes()[(vacante.id, hoy)]
+    compactar(hoy, hoy)
+    compactado = resumenes()[(vacante.id, hoy)]
+
+    assert compactado[:4] == (4, 3, 2, 1)
+    assert compactado[5] == 2
+    assert incremental == (5,) + compactado[1:]
+
+
+@pytest.mark.django_db
+def test_fecha_decision_sigue_la_primera_decision(reclutador):
+    vacante = crear_vacante(reclutador)
+    pk = postularse(vacante, "cand_fecha")
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    url = reverse("postulaciones-detail", args=[pk])
+
+    client.patch(url, {"estado": "descartado"})
+    primera = Postulacion.objects.get(pk=pk).fecha_decision
+    client.patch(url, {"estado": "seleccionado"})
+    assert Postulacion.objects.get(pk=pk).fecha_decision == primera
+    client.patch(url, {"estado": "en revision", "fecha_decision": "2020-01-01T00:00:00Z"})
+    assert Postulacion.objects.get(pk=pk).fecha_decision is None
+
+
+@pytest.mark.django_db
+def test_estadisticas_combinan_resumenes_y_dia_en_curso(reclutador, django_assert_max_num_queries):
+    vacante = crear_vacante(reclutador)
+    otra = crear_vacante(Usuario.objects.create(username="reclu_ajeno", rol="reclutador"), "Ajena")
+    hoy = timezone.localdate()
+    ahora = timezone.now()
+
+    # Dos postulaciones de hace 3 días: una seleccionada a las 48 h
+    antiguas = [postularse(vacante, f"cand_old_{i}") for i in range(2)]
+    Postulacion.objects.filter(pk__in=antiguas).update(fecha_postulacion=ahora - timedelta(days=3))
+    Postulacion.objects.filter(pk=antiguas[0]).update(
+        estado="seleccionado", fecha_decision=ahora - timedelta(days=1)
+    )
+    postularse(otra, "cand_ajeno")
+    compactar(hoy - timedelta(days=10), hoy - timedelta(days=1))
+    postularse(vacante, "cand_hoy")
+
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    with django_assert_max_num_queries(3):
+        response = client.get(reverse("estadisticas"), {"desde": str(hoy - timedelta(days=7))})
+
+    assert response.status_code == 200
+    totales = response.data["totales"]
+    assert (totales["postulaciones"], totales["decisiones"], totales["seleccionadas"]) == (3, 1, 1)
+    assert totales["tasa_seleccion"] == round(1 / 3, 4)
+    assert totales["horas_hasta_decision"] == 48.0
+    assert [(d["fecha"], d["postulaciones"], d["tasa_seleccion"]) for d in response.data["por_dia"]] == [
+        (hoy - timedelta(days=3), 2, 0.5), (hoy - timedelta(days=1), 0, None), (hoy, 1, 0.0),
+    ]
+    assert [v["vacante"] for v in response.data["por_vacante"]] == [vacante.id]
+
+
+@pytest.mark.django_db
+def test_tasa_de_seleccion_usa_la_cohorte_de_postulaciones(reclutador):
+    vacante = crear_vacante(reclutador)
+    hoy = timezone.localdate()
+    ahora = timezone.now()
+    # Postulada hace 20 días y seleccionada hoy: fuera de la cohorte de la última semana
+    antigua = postularse(vacante, "cand_cohorte_vieja")
+    Postulacion.objects.filter(pk=antigua).update(fecha_postulacion=ahora - timedelta(days=20))
+    compactar(hoy - timedelta(days=30), hoy - timedelta(days=1))
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    client.patch(reverse("postulaciones-detail", args=[antigua]), {"estado": "seleccionado"})
+    postularse(vacante, "cand_cohorte_nueva")
+
+    semana = client.get(reverse("estadisticas"), {"desde": str(hoy - timedelta(days=6))}).data["totales"]
+    mes = client.get(reverse("estadisticas"), {"desde": str(hoy - timedelta(days=29))}).data["totales"]
+
+    assert (semana["postulaciones"], semana["seleccionadas"], semana["tasa_seleccion"]) == (1, 1, 0.0)
+    assert (mes["postulaciones"], mes["postulaciones_seleccionadas"], mes["tasa_seleccion"]) == (2, 1, 0.5)
+
+
+@pytest.mark.django_db
+def test_compactar_estadisticas_por_comando(reclutador, capsys):
+    vacante = crear_vacante(reclutador)
+    pk = postularse(vacante, "cand_cmd")
+    ayer = timezone.localdate() - timedelta(days=1)
+    Postulacion.objects.filter(pk=pk).update(fecha_postulacion=timezone.now() - timedelta(days=1))
+    EstadisticaDiaria.objects.all().delete()
+
+    call_command("compactar_estadisticas")
+
+    assert EstadisticaDiaria.objects.get(vacante=vacante, fecha=ayer).postulaciones == 1
+    assert "1 filas" in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+def test_estadisticas_validan_rol_y_fechas(reclutador):
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    url = reverse("estadisticas")
+
+    assert client.get(url, {"desde": "2026-13-01"}).status_code == 400
+    assert client.get(url, {"desde": "2026-02-01", "hasta": "2026-01-01"}).status_code == 400
+    assert client.get(url, {"desde": "2020-01-01", "hasta": "2026-01-01"}).status_code == 400
+
+    client.force_authenticate(user=Usuario.objects.create(username="cand_est", rol="candidato"))
+    assert client.get(url).status_code == 403
@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import EstadisticasView
+
+
+urlpatterns = [
+    path('estadisticas/', EstadisticasView.as_view(), name='estadisticas'),
+]
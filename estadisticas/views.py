@@ -0,0 +1,98 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.utils import timezone
+from rest_framework import permissions, serializers
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from empleos.models import Vacante
+from .models import EstadisticaDiaria
+from .rollups import CAMPOS, agregar
+
+MAX_DIAS = 366
+
+
+def _resumen(valores):
+    """Agrega a los conteos la tasa de selección y el tiempo medio de decisión.
+
+    La tasa divide las postulaciones seleccionadas entre las postulaciones
+    del mismo periodo, ambas por día de postulación; ``seleccionadas`` va
+    por día de decisión y no sirve de numerador.
+    """
+    resumen = {c: valores[c] for c in CAMPOS if c != 'segundos_decision'}
+    resumen['tasa_seleccion'] = (
+        round(valores['postulaciones_seleccionadas'] / valores['postulaciones'], 4)
+        if valores['postulaciones'] else None
+    )
+    resumen['horas_hasta_decision'] = (
+        round(valores['segundos_decision'] / valores['decisiones'] / 3600, 2) if valores['decisiones'] else None
+    )
+    return resumen
+
+
+class EstadisticasView(APIView):
+    """
+    Estadísticas del reclutador: ``GET /api/estadisticas/?desde=&hasta=&vacante=``.
+
+    Los días anteriores a hoy salen de ``EstadisticaDiaria``; solo el día en
+    curso se agrega en vivo desde las postulaciones.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def rango(self, request):
+        hoy = timezone.localdate()
+        try:
+            hasta = date.fromisoformat(request.query_params['hasta']) if 'hasta' in request.query_params else hoy
+            desde = (
+                date.fromisoformat(request.query_params['desde']) if 'desde' in request.query_params
+                else hasta - timedelta(days=29)
+            )
+        except ValueError:
+            raise serializers.ValidationError({"fecha": "Usa el formato AAAA-MM-DD."})
+        if desde > hasta:
+            raise serializers.ValidationError({"desde": "Debe ser anterior o igual a 'hasta'."})
+        if (hasta - desde).days >= MAX_DIAS:
+            raise serializers.ValidationError({"desde": f"El rango máximo es de {MAX_DIAS} días."})
+        return desde, hasta, hoy
+
+    def get(self, request):
+        if request.user.rol != 'reclutador':
+            raise PermissionDenied("Solo los reclutadores tienen estadísticas.")
+        desde, hasta, hoy = self.rango(request)
+        vacantes = Vacante.objects.filter(reclutador=request.user)
+        if request.query_params.get('vacante'):
+            try:
+                vacantes = vacantes.filter(pk=int(request.query_params['vacante']))
+            except ValueError:
+                raise serializers.ValidationError({"vacante": "El ID de la vacante no es válido."})
+
+        filas = {}
+        if desde < hoy:
+            resumenes = EstadisticaDiaria.objects.filter(
+                vacante__in=vacantes, fecha__gte=desde, fecha__lte=min(hasta, hoy - timedelta(days=1))
+            ).values('vacante_id', 'fecha', *CAMPOS)
+            for fila in resumenes:
+                filas[(fila.pop('vacante_id'), fila.pop('fecha'))] = fila
+        if desde <= hoy <= hasta:
+            filas.update(agregar(hoy, hoy, vacantes=vacantes))
+
+        totales = dict.fromkeys(CAMPOS, 0)
+        por_vacante = defaultdict(lambda: dict.fromkeys(CAMPOS, 0))
+        por_dia = []
+        for (vacante_id, fecha), valores in sorted(filas.items(), key=lambda item: (item[0][1], item[0][0])):
+            if not any(valores.values()):
+                continue
+            for campo in CAMPOS:
+                totales[campo] += valores[campo]
+                por_vacante[vacante_id][campo] += valores[campo]
+            por_dia.append({'fecha': fecha, 'vacante': vacante_id, **_resumen(valores)})
+
+        return Response({
+            'desde': desde,
+            'hasta': hasta,
+            'totales': _resumen(totales),
+            'por_vacante': [{'vacante': v, **_resumen(valores)} for v, valores in sorted(por_vacante.items())],
+            'por_dia': por_dia,
+        })
@@ -0,0 +1,15 @@
+"""
+Configuración de gunicorn (``Procfile``).
+
+``SERVIDOR=asgi`` sirve ``jobconnect_api.asgi`` con workers de uvicorn, que
+es lo que necesitan las vistas de ``/api/async/``; por defecto se sirve la
+aplicación WSGI. Comparar ambos con ``manage.py prueba_carga`` antes de
+cambiarlo: el número de workers sale de ``WEB_CONCURRENCY`` en los dos casos.
+"""
+import os
+
+if os.environ.get('SERVIDOR', 'wsgi') == 'asgi':
+    wsgi_app = 'jobconnect_api.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'jobconnect_api.wsgi'
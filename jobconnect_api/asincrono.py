@@ -0,0 +1,131 @@
+"""
+Variantes asíncronas de los endpoints de lectura, servidas bajo ``/api/async/``.
+
+``vista_async(Clase, 'list')`` construye una vista ``async def`` a partir de
+la vista de DRF existente: reutiliza sus permisos, negociación de contenido,
+``get_queryset``/``filter_queryset``, serializers y manejo de errores, y solo
+cambia lo que toca la base de datos:
+
+- La autenticación usa ``aauthenticate`` del autenticador si lo tiene
+  (``CachedJWTAuthentication``), que con la caché caliente no consulta nada.
+- El método de la vista es su versión con prefijo ``a`` (``alist``,
+  ``aretrieve``, ``aget``), que lee con el ORM asíncrono. ``LecturaAsyncMixin``
+  aporta ``alist`` y ``aretrieve`` a las vistas con ``ConditionalGetMixin``,
+  con los mismos ``ETag`` y respuestas 304 que la versión síncrona.
+- Lo que no tiene versión asíncrona (paginación por cursor, conteo
+  estimado, ``?search=``) se resuelve con la vista síncrona en un hilo.
+
+Los serializers trabajan sobre filas ya cargadas con ``optimizar``, así que
+no consultan desde el bucle de eventos. En Django 5.2 el ORM asíncrono aún
+ejecuta cada consulta en un hilo; lo que se gana es no retener un hilo por
+petición mientras tanto.
+"""
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404, HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import MethodNotAllowed
+from rest_framework.response import Response
+
+from .instrumentacion import medir
+
+
+class LecturaAsyncMixin:
+    """``alist``/``aretrieve`` para vistas con ``ConditionalGetMixin``."""
+
+    # Parámetros que obligan a usar la vista síncrona (p. ej. ``search``)
+    parametros_sincronos = ()
+
+    def requiere_sincrono(self, request):
+        if any(p in request.query_params for p in self.parametros_sincronos):
+            return True
+        return self.paginator is not None and not self.paginator.admite_async(request)
+
+    async def alist(self, request, *args, **kwargs):
+        if self.requiere_sincrono(request):
+            return await sync_to_async(self.list)(request, *args, **kwargs)
+        queryset, plan = self.plan_listado(self.filter_queryset(self.get_queryset()))
+        if self.paginator is not None:
+            filas = await self.paginator.apaginate_queryset(queryset, request, view=self)
+        else:
+            filas = [fila async for fila in queryset]
+        etag = self.etag_filas(request, filas)
+        if self.no_modificado(request, etag, None):
+            return self.respuesta_condicional(request, etag, None, None)
+
+        with medir('serializacion'):
+            datos = self.serializar_filas(filas, plan)
+        if self.paginator is not None:
+            response = self.get_paginated_response(datos)
+        else:
+            response = Response(datos)
+        return self.con_validadores(response, etag, None)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        instancia = await queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}).afirst()
+        if instancia is None:
+            raise Http404
+        self.check_object_permissions(request, instancia)
+        etag, modificado = self.validadores_instancia(request, instancia)
+        return self.respuesta_condicional(
+            request, etag, modificado, lambda: self.get_serializer(instancia).data
+        )
+
+
+async def autenticar(request):
+    """Equivalente asíncrono de ``Request._authenticate``."""
+    for autenticador in request.authenticators:
+        aauthenticate = getattr(autenticador, 'aauthenticate', None)
+        try:
+            if aauthenticate is not None:
+                resultado = await aauthenticate(request)
+            else:
+                resultado = await sync_to_async(autenticador.authenticate)(request)
+        except Exception:
+            request.user, request.auth = AnonymousUser(), None
+            raise
+        if resultado is not None:
+            request._authenticator = autenticador
+            request.user, request.auth = resultado
+            return
+    request.user, request.auth = AnonymousUser(), None
+
+
+def _plana(response):
+    """Copia ya renderizada de la respuesta.
+
+    Django renderiza en un hilo cualquier respuesta con ``render()``; la de
+    DRF se renderiza aquí y se devuelve como ``HttpResponse`` para ahorrarse
+    ese salto.
+    """
+    response.render()
+    plana = HttpResponse(response.content, status=response.status_code)
+    for cabecera, valor in response.items():
+        plana[cabecera] = valor
+    return plana
+
+
+def vista_async(clase, accion, **initkwargs):
+    metodo = f'a{accion}'
+
+    async def vista(request, *args, **kwargs):
+        self = clase(**initkwargs)
+        self.action_map = {'get': accion, 'head': accion}
+        self.args, self.kwargs = args, kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            if request.method not in ('GET', 'HEAD'):
+                raise MethodNotAllowed(request.method)
+            await autenticar(request)
+            self.initial(request, *args, **kwargs)
+            response = await getattr(self, metodo)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        return _plana(self.finalize_response(request, response, *args, **kwargs))
+
+    vista.__name__ = vista.__qualname__ = f'{clase.__name__}_{metodo}'
+    return csrf_exempt(vista)
@@ -0,0 +1,68 @@
+"""
+``DATABASES`` a partir de variables de entorno.
+
+- ``DATABASE_URL``: base principal (por defecto ``db.sqlite3`` en la raíz).
+- ``DATABASE_REPLICA_URLS``: réplicas de lectura separadas por comas. Cada
+  una queda como alias ``replica_1``, ``replica_2``… y en los tests es espejo
+  de ``default``. Ver ``jobconnect_api/replicas.py`` para el enrutado.
+- ``DATABASE_CONN_MAX_AGE`` (600 s) y ``DATABASE_CONN_HEALTH_CHECKS`` (1):
+  conexiones persistentes por hilo, verificadas antes de reutilizarse en una
+  petición nueva.
+- ``DATABASE_POOL=1`` (solo PostgreSQL con psycopg 3): el pool nativo de
+  Django, con ``DATABASE_POOL_MIN_SIZE``, ``DATABASE_POOL_MAX_SIZE`` y
+  ``DATABASE_POOL_TIMEOUT``. Está activo por defecto con ``SERVIDOR=asgi``,
+  donde las conexiones persistentes no se reutilizan entre peticiones. El
+  pool no admite ``CONN_MAX_AGE``; la verificación la hace el pool al
+  prestar cada conexión.
+
+Con gunicorn cada worker tiene su propio pool: ``DATABASE_POOL_MAX_SIZE``
+por el número de workers no debe pasar de ``max_connections`` del servidor.
+
+Este módulo lo importa ``settings.py``, así que no importa nada de
+``django.db``.
+"""
+import os
+
+import dj_database_url
+
+PREFIJO_REPLICA = 'replica_'
+
+
+def _activo(entorno, nombre, defecto):
+    return entorno.get(nombre, defecto) == '1'
+
+
+def _pool(entorno):
+    from psycopg_pool import ConnectionPool
+
+    return {
+        'min_size': int(entorno.get('DATABASE_POOL_MIN_SIZE', '2')),
+        'max_size': int(entorno.get('DATABASE_POOL_MAX_SIZE', '10')),
+        'timeout': float(entorno.get('DATABASE_POOL_TIMEOUT', '10')),
+        'check': ConnectionPool.check_connection,
+    }
+
+
+def configurar(url, entorno):
+    """Configuración de una base de datos a partir de su URL."""
+    config = dj_database_url.parse(
+        url,
+        conn_max_age=int(entorno.get('DATABASE_CONN_MAX_AGE', '600')),
+        conn_health_checks=_activo(entorno, 'DATABASE_CONN_HEALTH_CHECKS', '1'),
+    )
+    pool_por_defecto = '1' if entorno.get('SERVIDOR') == 'asgi' else '0'
+    if config['ENGINE'] == 'django.db.backends.postgresql' and _activo(entorno, 'DATABASE_POOL', pool_por_defecto):
+        config['OPTIONS'] = {**config.get('OPTIONS', {}), 'pool': _pool(entorno)}
+        config['CONN_MAX_AGE'] = 0
+        config['CONN_HEALTH_CHECKS'] = False
+    return config
+
+
+def bases_de_datos(ruta_sqlite, entorno=os.environ):
+    bases = {'default': configurar(entorno.get('DATABASE_URL') or f'sqlite:///{ruta_sqlite}', entorno)}
+    urls = [u.strip() for u in entorno.get('DATABASE_REPLICA_URLS', '').split(',') if u.strip()]
+    for numero, url in enumerate(urls, start=1):
+        replica = configurar(url, entorno)
+        replica['TEST'] = {'MIRROR': 'default'}
+        bases[f'{PREFIJO_REPLICA}{numero}'] = replica
+    return bases
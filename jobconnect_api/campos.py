@@ -0,0 +1,85 @@
+"""
+Respuestas a medida con ``?fields=`` y ``?expand=``.
+
+- ``?fields=id,nombre,estado`` deja solo esos campos. Un punto baja a un
+  serializer anidado (``vacante.titulo``); nombrar el anidado sin más lo
+  incluye entero. Los nombres que no existen se ignoran.
+- ``?expand=candidato`` cambia un campo que por defecto es un ID por el
+  objeto anidado, según ``Meta.expandibles`` del serializer. También con
+  puntos: ``expand=vacante.reclutador``.
+
+Solo se aplica en lecturas (``GET``/``HEAD``) y lo lee el serializer raíz de
+la respuesta, que le pasa a cada anidado con ``CamposDinamicosMixin`` su
+parte de la forma. ``EagerLoadingMixin`` trabaja sobre el serializer ya
+recortado: los joins siguen a la forma pedida y, con ``?fields=``, el
+``SELECT`` solo trae las columnas que se van a serializar (ver
+``eager_loading.columnas``).
+"""
+from rest_framework import serializers
+
+PARAMETRO_CAMPOS = 'fields'
+PARAMETRO_EXPANDIR = 'expand'
+METODOS_LECTURA = ('GET', 'HEAD')
+
+
+def arbol(valor):
+    """``'a,b.c,b.d'`` -> ``{'a': {}, 'b': {'c': {}, 'd': {}}}``; None si no vino el parámetro."""
+    if valor is None:
+        return None
+    raiz = {}
+    for ruta in valor.split(','):
+        nodo = raiz
+        for parte in ruta.strip().split('.'):
+            if parte:
+                nodo = nodo.setdefault(parte, {})
+    return raiz
+
+
+def _es_raiz(serializer):
+    padre = serializer.parent
+    return padre is None or (isinstance(padre, serializers.ListSerializer) and padre.parent is None)
+
+
+class CamposDinamicosMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.forma_asignada = None  # (campos, expandir) que le pasa el serializer padre
+
+    def forma(self):
+        """``(campos, expandir)``: árboles de ``arbol()``; ``campos`` es None si van todos."""
+        if self.forma_asignada is not None:
+            return self.forma_asignada
+        request = self.context.get('request')
+        if not _es_raiz(self) or request is None or request.method not in METODOS_LECTURA:
+            return None, {}
+        params = request.query_params
+        return arbol(params.get(PARAMETRO_CAMPOS)) or None, arbol(params.get(PARAMETRO_EXPANDIR)) or {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        campos, expandir = self.forma()
+        expandibles = getattr(self.Meta, 'expandibles', {})
+        for nombre in expandir:
+            if nombre in expandibles and nombre in fields:
+                fields[nombre] = expandibles[nombre](read_only=True)
+        if campos is not None:
+            fields = {nombre: campo for nombre, campo in fields.items() if nombre in campos}
+        for nombre, campo in fields.items():
+            hijo = campo.child if isinstance(campo, serializers.ListSerializer) else campo
+            if isinstance(hijo, CamposDinamicosMixin):
+                hijo.forma_asignada = ((campos or {}).get(nombre) or None, expandir.get(nombre, {}))
+        return fields
+
+
+def es_parcial(serializer):
+    """Si el serializer (raíz) viene recortado con ``?fields=``."""
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    return isinstance(serializer, CamposDinamicosMixin) and serializer.forma()[0] is not None
+
+
+def a_medida(serializer):
+    """Si la forma del serializer (raíz) depende de ``?fields=`` o ``?expand=``."""
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    return isinstance(serializer, CamposDinamicosMixin) and serializer.forma() != (None, {})
@@ -0,0 +1,130 @@
+"""
+GET condicional (``ETag`` / ``Last-Modified``) para vistas de DRF.
+
+La versión de una fila es su ``fecha_actualizacion`` (``auto_now``) más la de
+las relaciones anidadas que declare la vista en ``version_related``. Cuando
+cambia algo que se serializa anidado sin pasar por esos modelos (el perfil
+del reclutador o del candidato), las señales de cada app actualizan la
+``fecha_actualizacion`` de las filas afectadas.
+
+- ``retrieve``: compara contra la fila ya cargada, antes de serializar.
+- ``list``: compara contra una huella agregada de la página (ids y versiones
+  de sus filas, más el total del paginador), antes de serializar. Se calcula
+  sobre la página y no sobre todo el queryset para que un listado por cursor
+  no pague un ``COUNT``/``MAX`` sobre la tabla completa. Solo lleva
+  ``ETag``: borrar una fila o que salga de la página no sube la fecha más
+  reciente, así que ``Last-Modified``/``If-Modified-Since`` darían 304
+  falsos.
+
+El ETag incluye la query string y el formato de salida, porque ambos cambian
+la representación.
+
+``list`` usa el serializer compilado a ``.values()`` cuando se puede (ver
+``proyeccion.py``): las filas son dicts con las columnas de versión y del
+cursor, y la respuesta es la misma, ETag incluido.
+"""
+import hashlib
+
+from django.conf import settings
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+from . import proyeccion
+from .instrumentacion import medir
+
+
+class ConditionalGetMixin:
+    version_field = 'fecha_actualizacion'
+    version_related = ()
+    serializacion_rapida = True  # listados con proyeccion.compilar si el serializer lo admite
+
+    def _campos_version(self):
+        return [self.version_field] + [f'{r}__{self.version_field}' for r in self.version_related]
+
+    def _etag(self, request, material):
+        crudo = '|'.join([
+            getattr(request.accepted_renderer, 'format', ''),
+            request.get_full_path(),
+            *(str(m) for m in material),
+        ])
+        return '"%s"' % hashlib.sha256(crudo.encode()).hexdigest()[:32]
+
+    def validadores_instancia(self, request, instancia):
+        marcas = [proyeccion.leer(instancia, campo) for campo in self._campos_version()]
+        fechas = [m for m in marcas if m is not None]
+        return self._etag(request, [proyeccion.leer(instancia, 'pk'), *marcas]), max(fechas) if fechas else None
+
+    def etag_filas(self, request, filas):
+        material = []
+        pagina = getattr(self.paginator, 'page', None)
+        if pagina is not None:
+            material.append(pagina.paginator.count)
+        for fila in filas:
+            material.append(self.validadores_instancia(request, fila)[0])
+        return self._etag(request, material)
+
+    def no_modificado(self, request, etag, modificado):
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match:
+            etags = parse_etags(if_none_match)
+            return '*' in etags or etag in etags
+        desde = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+        return bool(desde and modificado and int(modificado.timestamp()) <= desde)
+
+    def con_validadores(self, response, etag, modificado):
+        response['ETag'] = etag
+        if modificado:
+            response['Last-Modified'] = http_date(modificado.timestamp())
+        # Los datos dependen del usuario: el navegador guarda la copia y revalida
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Authorization'])
+        return response
+
+    def respuesta_condicional(self, request, etag, modificado, datos):
+        """Devuelve 304 si el cliente ya tiene la versión, o ``datos`` si no."""
+        if self.no_modificado(request, etag, modificado):
+            return self.con_validadores(Response(status=status.HTTP_304_NOT_MODIFIED), etag, modificado)
+        if callable(datos):
+            with medir('serializacion'):
+                datos = datos()
+        return self.con_validadores(Response(datos), etag, modificado)
+
+    def retrieve(self, request, *args, **kwargs):
+        instancia = self.get_object()
+        etag, modificado = self.validadores_instancia(request, instancia)
+        return self.respuesta_condicional(
+            request, etag, modificado, lambda: self.get_serializer(instancia).data
+        )
+
+    def plan_listado(self, queryset):
+        """``(queryset, plan)``: con plan, el queryset da dicts listos para ``plan.serializar``."""
+        if not (self.serializacion_rapida and getattr(settings, 'SERIALIZACION_RAPIDA', True)):
+            return queryset, None
+        plan = proyeccion.compilar(self.get_serializer(many=True), queryset)
+        if plan is None:
+            return queryset, None
+        keyset = [c.lstrip('-') for c in getattr(self, 'keyset_ordering', ())]
+        return plan.proyectar(queryset, ['pk', *self._campos_version(), *keyset]), plan
+
+    def serializar_filas(self, filas, plan):
+        if plan is not None:
+            return plan.serializar(filas)
+        return self.get_serializer(filas, many=True).data
+
+    def list(self, request, *args, **kwargs):
+        queryset, plan = self.plan_listado(self.filter_queryset(self.get_queryset()))
+        pagina = self.paginate_queryset(queryset)
+        filas = pagina if pagina is not None else list(queryset)
+        etag = self.etag_filas(request, filas)
+        if self.no_modificado(request, etag, None):
+            return self.respuesta_condicional(request, etag, None, None)
+
+        with medir('serializacion'):
+            datos = self.serializar_filas(filas, plan)
+        if pagina is not None:
+            response = self.get_paginated_response(datos)
+        else:
+            response = Response(datos)
+        return self.con_validadores(response, etag, None)
@@ -0,0 +1,195 @@
+"""
+Carga anticipada guiada por los serializers.
+
+Cada serializer anuncia las relaciones que necesita y las vistas aplican el
+``select_related`` / ``prefetch_related`` correspondiente, evitando N+1:
+
+- Los serializers anidados y los campos con ``source`` punteado
+  (``source='candidato.first_name'``) se detectan solos.
+- Lo que no se puede deducir (p. ej. un ``SerializerMethodField``) se declara
+  en ``Meta.select_related`` o ``Meta.prefetch_related``, con rutas relativas
+  al modelo del serializer.
+
+Las relaciones de un serializer anidado se prefijan con su ``source``, de
+modo que ``PostulacionSerializer`` hereda ``vacante__reclutador__perfil_reclutador``
+de ``VacanteSerializer``.
+
+Con ``?fields=`` (ver ``jobconnect_api/campos.py``) además se restringe el
+``SELECT`` con ``only()`` a las columnas que usa el serializer recortado,
+más las que necesita la vista (versión para el ETag, orden del cursor). Si
+algún campo no se puede traducir a columnas (un ``SerializerMethodField`` o
+una propiedad) se cargan todas, salvo que el serializer las declare en
+``Meta.columnas`` (``{campo: [rutas]}``).
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+from .campos import a_medida, es_parcial
+
+_cache = {}
+
+
+def _es_multiple(modelo, ruta):
+    """Indica si algún tramo de ``ruta`` es una relación a muchos."""
+    for parte in ruta.split('__'):
+        try:
+            campo = modelo._meta.get_field(parte)
+        except FieldDoesNotExist:
+            return False
+        if campo.many_to_many or campo.one_to_many:
+            return True
+        modelo = campo.related_model
+    return False
+
+
+def _es_relacion(modelo, ruta):
+    for parte in ruta.split('__'):
+        try:
+            campo = modelo._meta.get_field(parte)
+        except FieldDoesNotExist:
+            return False
+        if not campo.is_relation:
+            return False
+        modelo = campo.related_model
+    return True
+
+
+def _es_columna(modelo, ruta):
+    """Campo concreto al final de relaciones a uno (``candidato__first_name``)."""
+    *relaciones_, ultimo = ruta.split('__')
+    for parte in relaciones_:
+        try:
+            campo = modelo._meta.get_field(parte)
+        except FieldDoesNotExist:
+            return False
+        if not campo.is_relation or campo.many_to_many or campo.one_to_many:
+            return False
+        modelo = campo.related_model
+    try:
+        return modelo._meta.get_field(ultimo).concrete
+    except FieldDoesNotExist:
+        return False
+
+
+def columnas(serializer, prefijo=''):
+    """Rutas para ``only()`` con lo que lee ``serializer``, o None si no se puede saber."""
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    meta = getattr(serializer, 'Meta', None)
+    modelo = getattr(meta, 'model', None)
+    if modelo is None:
+        return None
+    declaradas = getattr(meta, 'columnas', {})
+    resultado = {f'{prefijo}{modelo._meta.pk.name}'}
+    for nombre, campo in serializer.fields.items():
+        if campo.write_only:
+            continue
+        if nombre in declaradas:
+            resultado |= {f'{prefijo}{ruta}' for ruta in declaradas[nombre]}
+            continue
+        if campo.source == '*':
+            return None
+        ruta = '__'.join(campo.source_attrs)
+        if isinstance(campo, serializers.BaseSerializer):
+            if not _es_relacion(modelo, ruta) or _es_multiple(modelo, ruta):
+                return None
+            hijas = columnas(campo, prefijo=f'{prefijo}{ruta}__')
+            if hijas is None:
+                return None
+            resultado |= hijas
+        elif _es_columna(modelo, ruta):
+            resultado.add(f'{prefijo}{ruta}')
+        else:
+            return None
+    return resultado
+
+
+def relaciones(serializer, prefijo=''):
+    """Devuelve ``(select_related, prefetch_related)`` para un serializer."""
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    meta = getattr(serializer, 'Meta', None)
+    modelo = getattr(meta, 'model', None)
+    select, prefetch = set(), set()
+    if modelo is None:
+        return select, prefetch
+
+    def agregar(ruta):
+        destino = prefetch if _es_multiple(modelo, ruta) else select
+        destino.add(f'{prefijo}{ruta}')
+
+    for ruta in getattr(meta, 'select_related', ()):
+        agregar(ruta)
+    for ruta in getattr(meta, 'prefetch_related', ()):
+        prefetch.add(f'{prefijo}{ruta}')
+
+    for campo in serializer.fields.values():
+        if campo.write_only or campo.source == '*':
+            continue
+        ruta = '__'.join(campo.source_attrs)
+        if isinstance(campo, serializers.BaseSerializer):
+            if not _es_relacion(modelo, ruta):
+                continue
+            agregar(ruta)
+            hijo_select, hijo_prefetch = relaciones(campo, prefijo=f'{prefijo}{ruta}__')
+            # Lo que cuelga de una relación múltiple también se precarga
+            if _es_multiple(modelo, ruta):
+                prefetch |= hijo_select | hijo_prefetch
+            else:
+                select |= hijo_select
+                prefetch |= hijo_prefetch
+        elif isinstance(campo, serializers.PrimaryKeyRelatedField):
+            # Solo usa el ``<campo>_id`` local
+            continue
+        elif isinstance(campo, serializers.RelatedField) and _es_relacion(modelo, ruta):
+            agregar(ruta)
+        elif len(campo.source_attrs) > 1:
+            ruta = '__'.join(campo.source_attrs[:-1])
+            if _es_relacion(modelo, ruta):
+                agregar(ruta)
+    return select, prefetch
+
+
+def optimizar(queryset, serializer, requeridas=()):
+    """
+    Aplica al queryset las relaciones que requiere ``serializer``. Si viene
+    recortado con ``?fields=``, también ``only()`` con sus columnas más
+    ``requeridas``.
+    """
+    clave = type(serializer.child if isinstance(serializer, serializers.ListSerializer) else serializer)
+    if a_medida(serializer):
+        # Una forma por combinación de parámetros: no se guarda en _cache
+        select, prefetch = relaciones(serializer)
+        select, prefetch = sorted(select), sorted(prefetch)
+    else:
+        if clave not in _cache:
+            select, prefetch = relaciones(serializer)
+            _cache[clave] = (sorted(select), sorted(prefetch))
+        select, prefetch = _cache[clave]
+    cargar = columnas(serializer) if es_parcial(serializer) else None
+    if cargar is not None:
+        cargar |= set(requeridas)
+        # Lo que la vista pidiera con select_related y el serializer ya no usa quedaría sin columnas
+        select = sorted(set(select) | {c.rsplit('__', 1)[0] for c in cargar if '__' in c})
+        queryset = queryset.select_related(None).only(*cargar)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
+class EagerLoadingMixin:
+    """Mixin de vista: carga las relaciones (y con ``?fields=``, solo las columnas) del serializer de la acción."""
+
+    def columnas_requeridas(self):
+        """Columnas que la vista lee de cada fila además de las del serializer."""
+        requeridas = set()
+        if hasattr(self, '_campos_version'):
+            requeridas.update(self._campos_version())
+        requeridas.update(c.lstrip('-') for c in getattr(self, 'keyset_ordering', ()))
+        return requeridas
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        return optimizar(queryset, self.get_serializer(), self.columnas_requeridas())
@@ -0,0 +1,228 @@
+"""
+Métricas por petición: consultas SQL, tiempos por fase y tamaño de respuesta.
+
+``InstrumentacionMiddleware`` abre una ``Medicion`` por petición y la deja en
+una ``ContextVar``, así la ven también los hilos de ``sync_to_async`` y las
+vistas asíncronas. Se alimenta de:
+
+- Un ``execute_wrapper`` instalado en cada conexión, que cuenta las
+  consultas, suma su tiempo y guarda las más lentas y las repetidas (mismo
+  SQL con distintos parámetros: el rastro de un N+1). Solo el texto con
+  ``%s``; los parámetros nunca se guardan.
+- ``medir(fase)``, que usan la autenticación (``auth``), el ``.data`` de
+  cualquier serializer de DRF y la proyección de ``ConditionalGetMixin``
+  (``serializacion``), y ``JSONRendererMedido`` (``render``; también
+  ``JSONRendererRapido``, ver ``json_rapido.py``). Las fases se solapan:
+  ``db`` incluye las consultas hechas durante ``auth`` o ``serializacion``;
+  una fase abierta dentro de sí misma se cuenta una sola vez.
+
+``.data`` se mide envolviendo una vez ``Serializer.data`` y
+``ListSerializer.data`` al crear el middleware, así toda vista de DRF
+registra ``serializacion`` sin tocarla. Las respuestas de DRF que no
+pasan por un serializer (``/api/estadisticas/``, la exportación a CSV) la
+registran en 0, para que el desglose por fases se compare entre endpoints.
+
+Medir es barato; lo que cuesta es escribir. Por eso la cabecera
+``Server-Timing`` y la línea de log (JSON) solo se emiten en una fracción
+``INSTRUMENTACION_MUESTREO`` de las peticiones, y siempre en las que superan
+``INSTRUMENTACION_UMBRAL_LENTO_MS``, que se registran como ``WARNING`` con
+el SQL responsable.
+"""
+import heapq
+import json
+import logging
+import random
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+_actual = ContextVar('medicion', default=None)
+
+FASES = ('auth', 'serializacion', 'render')
+
+
+class Medicion:
+    def __init__(self, max_lentas=5):
+        self.inicio = time.perf_counter()
+        self.fases = defaultdict(float)
+        self.abiertas = set()
+        self.consultas = 0
+        self.sql_ms = 0.0
+        self.max_lentas = max_lentas
+        self.lentas = []  # montículo de (ms, sql) con las más lentas
+        self.repetidas = Counter()
+
+    def registrar_sql(self, sql, ms):
+        self.consultas += 1
+        self.sql_ms += ms
+        self.repetidas[sql] += 1
+        if len(self.lentas) < self.max_lentas:
+            heapq.heappush(self.lentas, (ms, sql))
+        elif ms > self.lentas[0][0]:
+            heapq.heapreplace(self.lentas, (ms, sql))
+
+    def total_ms(self):
+        return (time.perf_counter() - self.inicio) * 1000
+
+
+@contextmanager
+def medir(fase):
+    medicion = _actual.get()
+    if medicion is None or fase in medicion.abiertas:
+        yield
+        return
+    medicion.abiertas.add(fase)
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        medicion.abiertas.discard(fase)
+        medicion.fases[fase] += (time.perf_counter() - inicio) * 1000
+
+
+def registrar_sql(execute, sql, params, many, context):
+    medicion = _actual.get()
+    if medicion is None:
+        return execute(sql, params, many, context)
+    inicio = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        medicion.registrar_sql(sql, (time.perf_counter() - inicio) * 1000)
+
+
+def instalar(connection, **kwargs):
+    if registrar_sql not in connection.execute_wrappers:
+        connection.execute_wrappers.append(registrar_sql)
+
+
+def _data_medida(data):
+    def medida(self):
+        with medir('serializacion'):
+            return data(self)
+    medida.medida = True
+    return property(medida)
+
+
+def instalar_serializacion():
+    """Envuelve ``.data`` de los serializers de DRF con ``medir('serializacion')``."""
+    for clase in (serializers.Serializer, serializers.ListSerializer):
+        if not getattr(clase.data.fget, 'medida', False):
+            clase.data = _data_medida(clase.data.fget)
+
+
+class JSONRendererMedido(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with medir('render'):
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+def _ms(valor):
+    return round(valor, 2)
+
+
+def server_timing(medicion, total):
+    partes = [f'db;dur={_ms(medicion.sql_ms)};desc="{medicion.consultas} consultas"']
+    partes += [f'{fase};dur={_ms(medicion.fases[fase])}' for fase in FASES if fase in medicion.fases]
+    partes.append(f'total;dur={_ms(total)}')
+    return ', '.join(partes)
+
+
+def _tamano(response):
+    if response.streaming:
+        return None
+    return len(response.content)
+
+
+def _opcion(nombre, defecto):
+    return getattr(settings, f'INSTRUMENTACION_{nombre}', defecto)
+
+
+def _recortar(sql, largo=1000):
+    return sql if len(sql) <= largo else sql[:largo] + '…'
+
+
+class InstrumentacionMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.es_async = iscoroutinefunction(get_response)
+        if self.es_async:
+            markcoroutinefunction(self)
+        connection_created.connect(instalar, dispatch_uid='instrumentacion_sql')
+        for connection in connections.all(initialized_only=True):
+            instalar(connection)
+        instalar_serializacion()
+
+    def __call__(self, request):
+        if self.es_async:
+            return self.__acall__(request)
+        if not _opcion('ACTIVA', True):
+            return self.get_response(request)
+        medicion = Medicion(_opcion('SQL_LENTAS', 5))
+        token = _actual.set(medicion)
+        try:
+            response = self.get_response(request)
+        finally:
+            _actual.reset(token)
+        return self.cerrar(request, response, medicion)
+
+    async def __acall__(self, request):
+        if not _opcion('ACTIVA', True):
+            return await self.get_response(request)
+        medicion = Medicion(_opcion('SQL_LENTAS', 5))
+        token = _actual.set(medicion)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _actual.reset(token)
+        return self.cerrar(request, response, medicion)
+
+    def cerrar(self, request, response, medicion):
+        if isinstance(response, Response):
+            medicion.fases.setdefault('serializacion', 0.0)
+        total = medicion.total_ms()
+        lenta = total >= _opcion('UMBRAL_LENTO_MS', 500)
+        if not lenta and random.random() >= _opcion('MUESTREO', 0.05):
+            return response
+
+        if _opcion('SERVER_TIMING', True):
+            response['Server-Timing'] = server_timing(medicion, total)
+        coincidencia = request.resolver_match
+        datos = {
+            'metodo': request.method,
+            'ruta': request.path,
+            'patron': coincidencia.route if coincidencia else None,
+            'estado': response.status_code,
+            'total_ms': _ms(total),
+            'consultas': medicion.consultas,
+            'sql_ms': _ms(medicion.sql_ms),
+            **{f'{fase}_ms': _ms(medicion.fases[fase]) for fase in FASES if fase in medicion.fases},
+            'bytes': _tamano(response),
+        }
+        if not lenta:
+            logger.info(json.dumps(datos, ensure_ascii=False))
+            return response
+
+        datos['sql_lentas'] = [
+            {'ms': _ms(ms), 'sql': _recortar(sql)} for ms, sql in sorted(medicion.lentas, reverse=True)
+        ]
+        datos['sql_repetidas'] = [
+            {'veces': veces, 'sql': _recortar(sql)}
+            for sql, veces in medicion.repetidas.most_common(_opcion('SQL_LENTAS', 5)) if veces > 1
+        ]
+        logger.warning(json.dumps(datos, ensure_ascii=False))
+        return response
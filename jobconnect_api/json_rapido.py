@@ -0,0 +1,90 @@
+"""
+JSON de las respuestas y de los cuerpos de las peticiones con orjson.
+
+``JSONRendererRapido`` y ``JSONParserRapido`` (ver ``REST_FRAMEWORK`` en
+``settings.py``) usan orjson si está instalado y ``JSON_RAPIDO`` está activo;
+si no, hacen exactamente lo de ``JSONRenderer``/``JSONParser`` de DRF con el
+``json`` de la biblioteca estándar.
+
+Lo que orjson no sabe escribir pasa por ``CodificadorJSON.default``, el mismo
+encoder que usa la ruta estándar, así las dos producen lo mismo:
+
+- ``Decimal`` como número, igual que el encoder de DRF (los ``DecimalField``
+  de los serializers ya llegan como texto).
+- ``datetime`` con zona en la zona actual (``TIME_ZONE``, America/Bogota),
+  como lo escribe ``DateTimeField``; orjson los entrega a ``default`` con
+  ``OPT_PASSTHROUGH_DATETIME``. Las fechas sueltas, en ISO.
+- Textos perezosos (``gettext_lazy``) ya traducidos.
+
+orjson solo escribe JSON compacto en UTF-8: con ``indent`` (``Accept:
+application/json; indent=4`` o la API navegable), con ``UNICODE_JSON`` o
+``COMPACT_JSON`` desactivados o si orjson rechaza los datos (enteros de más
+de 64 bits) se usa la ruta estándar. Los floats pueden cambiar de notación
+(``1e16`` frente a ``1e+16``), no de valor, y un ``NaN`` sale como ``null``.
+
+``manage.py medir_json`` compara las dos rutas con páginas de los
+serializers reales.
+"""
+import codecs
+import datetime
+import io
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from .instrumentacion import JSONRendererMedido, medir
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+OPCIONES_ORJSON = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+
+def disponible():
+    return orjson is not None and getattr(settings, 'JSON_RAPIDO', True)
+
+
+class CodificadorJSON(JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, datetime.datetime) and timezone.is_aware(obj):
+            obj = timezone.localtime(obj)
+        return super().default(obj)
+
+
+_codificador = CodificadorJSON()
+
+
+class JSONRendererRapido(JSONRendererMedido):
+    encoder_class = CodificadorJSON
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (data is None or not disponible() or self.ensure_ascii or not self.compact
+                or self.get_indent(accepted_media_type, renderer_context or {}) is not None):
+            return super().render(data, accepted_media_type, renderer_context)
+        with medir('render'):
+            try:
+                contenido = orjson.dumps(data, default=_codificador.default, option=OPCIONES_ORJSON)
+            except orjson.JSONEncodeError:
+                return JSONRenderer.render(self, data, accepted_media_type, renderer_context)
+            # Como DRF: sin U+2028/U+2029 literales, para que siga siendo JavaScript válido
+            return contenido.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class JSONParserRapido(JSONParser):
+    renderer_class = JSONRendererRapido
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        if not disponible() or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+        contenido = stream.read()
+        try:
+            return orjson.loads(contenido)
+        except orjson.JSONDecodeError:
+            # El mensaje de error (o el entero enorme que orjson no admite) queda como en DRF
+            return super().parse(io.BytesIO(contenido), media_type, parser_context)
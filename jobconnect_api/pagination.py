@@ -0,0 +1,215 @@
+"""
+Paginación del API.
+
+``PaginacionHibrida`` conserva la paginación por número de página de DRF y
+añade dos modos que se eligen por petición:
+
+- ``?paginacion=cursor`` (o cualquier ``?cursor=``): paginación por keyset
+  sobre el ``keyset_ordering`` de la vista, p. ej.
+  ``('-fecha_publicacion', '-id')``. Cada página es un ``WHERE`` sobre el
+  índice en lugar de ``COUNT(*)`` + ``OFFSET``, así que su coste no depende
+  de la profundidad. En este modo el orden del keyset prevalece sobre
+  ``?ordering=`` y sobre el ranking de ``?search=``.
+- ``?conteo=estimado``: evita el ``COUNT(*)`` exacto. En PostgreSQL se usa
+  la estimación del planificador; en otros motores, o si la estimación no
+  llega hasta unas páginas después de la solicitada, un conteo acotado.
+
+Las filas pueden ser instancias o dicts de ``.values()`` (ver ``proyeccion.py``).
+"""
+import base64
+import binascii
+import json
+from functools import partial
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .proyeccion import leer
+
+
+def contar_estimado(queryset, limite):
+    """Cuenta aproximada de ``queryset`` que nunca se queda por debajo de ``min(filas, limite)``.
+
+    La estimación de PostgreSQL puede quedarse corta (estadísticas viejas,
+    filtros correlacionados); si no llega a ``limite`` se cuentan las filas
+    hasta ``limite``. Así la página pedida no da 404 ni pierde el ``next``
+    mientras queden filas.
+    """
+    if connections[queryset.db].vendor == 'postgresql':
+        plan = json.loads(queryset.order_by().explain(format='json'))
+        estimado = int(plan[0]['Plan']['Plan Rows'])
+        if estimado >= limite:
+            return estimado
+    return queryset.order_by()[:limite].count()
+
+
+class PaginadorEstimado(Paginator):
+    """``Paginator`` cuyo ``count`` no recorre toda la tabla."""
+
+    def __init__(self, object_list, per_page, limite, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.limite = limite
+
+    @cached_property
+    def count(self):
+        return contar_estimado(self.object_list, self.limite)
+
+
+class PaginadorContado(Paginator):
+    """``Paginator`` con el ``count`` ya calculado (con ``acount()`` en las vistas asíncronas)."""
+
+    def __init__(self, object_list, per_page, conteo, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count = conteo
+
+
+class PaginacionHibrida(PageNumberPagination):
+    modo_query_param = 'paginacion'
+    cursor_query_param = 'cursor'
+    conteo_query_param = 'conteo'
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    invalid_cursor_message = 'Cursor inválido.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.keyset = getattr(view, 'keyset_ordering', None)
+        self.usa_cursor = bool(self.keyset) and (
+            request.query_params.get(self.modo_query_param) == 'cursor'
+            or self.cursor_query_param in request.query_params
+        )
+        self.conteo_estimado = request.query_params.get(self.conteo_query_param) == 'estimado'
+
+        if self.usa_cursor:
+            return self.paginar_por_cursor(queryset, request)
+
+        if self.conteo_estimado:
+            # Basta con contar hasta unas páginas más allá de la solicitada
+            try:
+                pagina = int(request.query_params.get(self.page_query_param, 1))
+            except ValueError:
+                pagina = 1
+            limite = max(pagina + 10, getattr(settings, 'PAGINACION_PAGINAS_ESTIMADAS', 100))
+            limite *= self.get_page_size(request) or 1
+            self.django_paginator_class = partial(PaginadorEstimado, limite=limite)
+        return super().paginate_queryset(queryset, request, view)
+
+    def admite_async(self, request):
+        """El cursor y el conteo estimado solo tienen versión síncrona."""
+        return not (
+            request.query_params.get(self.modo_query_param) == 'cursor'
+            or self.cursor_query_param in request.query_params
+            or request.query_params.get(self.conteo_query_param) == 'estimado'
+        )
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Paginación por número de página con el ORM asíncrono (``acount`` y ``async for``)."""
+        self.request = request
+        self.usa_cursor = self.conteo_estimado = False
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return [fila async for fila in queryset]
+
+        paginador = PaginadorContado(queryset, page_size, await queryset.acount())
+        numero = self.get_page_number(request, paginador)
+        try:
+            self.page = paginador.page(numero)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=numero, message=str(exc)))
+        self.page.object_list = [fila async for fila in self.page.object_list]
+        return list(self.page)
+
+    def get_paginated_response(self, data):
+        if self.usa_cursor:
+            respuesta = {
+                'next': self.siguiente,
+                'previous': self.anterior,
+                'results': data,
+            }
+            if self.conteo_estimado:
+                respuesta = {'count': self.conteo, 'count_estimado': True, **respuesta}
+            return Response(respuesta)
+
+        respuesta = super().get_paginated_response(data)
+        if self.conteo_estimado:
+            respuesta.data['count_estimado'] = True
+        return respuesta
+
+    # -- Keyset ------------------------------------------------------------
+
+    def paginar_por_cursor(self, queryset, request):
+        page_size = self.get_page_size(request)
+        campos = list(self.keyset)
+        modelo = queryset.model
+        valores, hacia_atras = self.decodificar_cursor(request, modelo, campos)
+
+        if self.conteo_estimado:
+            self.conteo = contar_estimado(queryset, page_size * 100)
+
+        orden = [self.invertir(c) for c in campos] if hacia_atras else campos
+        if valores is not None:
+            queryset = queryset.filter(self.filtro_posterior(orden, valores))
+        filas = list(queryset.order_by(*orden)[:page_size + 1])
+        hay_mas = len(filas) > page_size
+        filas = filas[:page_size]
+        if hacia_atras:
+            filas.reverse()
+
+        if hacia_atras:
+            self.siguiente = self.enlace(filas[-1], campos, False) if filas else None
+            self.anterior = self.enlace(filas[0], campos, True) if filas and hay_mas else None
+        else:
+            self.siguiente = self.enlace(filas[-1], campos, False) if filas and hay_mas else None
+            self.anterior = self.enlace(filas[0], campos, True) if filas and valores is not None else None
+        return filas
+
+    @staticmethod
+    def invertir(campo):
+        return campo[1:] if campo.startswith('-') else f'-{campo}'
+
+    @staticmethod
+    def filtro_posterior(orden, valores):
+        """Filas estrictamente posteriores a ``valores`` según ``orden``.
+
+        Para ``('-fecha', '-id')`` produce ``fecha < f OR (fecha = f AND id < i)``.
+        """
+        condicion = Q()
+        for i, campo in enumerate(orden):
+            operador = 'lt' if campo.startswith('-') else 'gt'
+            paso = Q(**{f'{campo.lstrip("-")}__{operador}': valores[i]})
+            for previo, valor in zip(orden[:i], valores):
+                paso &= Q(**{previo.lstrip('-'): valor})
+            condicion |= paso
+        return condicion
+
+    def enlace(self, fila, campos, hacia_atras):
+        valores = []
+        for campo in campos:
+            valor = leer(fila, campo.lstrip('-'))
+            valores.append(valor.isoformat() if hasattr(valor, 'isoformat') else valor)
+        crudo = json.dumps({'v': valores, 'a': hacia_atras}, separators=(',', ':'))
+        cursor = base64.urlsafe_b64encode(crudo.encode()).decode()
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decodificar_cursor(self, request, modelo, campos):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        try:
+            datos = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            valores = [
+                modelo._meta.get_field(campo.lstrip('-')).to_python(valor)
+                for campo, valor in zip(campos, datos['v'], strict=True)
+            ]
+            return valores, bool(datos['a'])
+        except (binascii.Error, ValueError, KeyError, TypeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
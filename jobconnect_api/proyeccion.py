@@ -0,0 +1,252 @@
+"""
+Listados sin instanciar modelos: el serializer compilado a ``.values()``.
+
+``compilar(serializer, queryset)`` recorre una vez el árbol de campos del
+serializer (ya recortado con ``?fields=``/``?expand=``) y devuelve un
+``Plan``: las rutas para ``.values()`` y una función que convierte cada fila
+en el mismo dict que produciría el serializer. ``ConditionalGetMixin.list``
+lo usa solo en los listados: pagina y calcula el ETag sobre los dicts, y se
+ahorra crear las instancias y recorrerlas campo a campo con DRF.
+
+Solo se compila lo que se puede reproducir exactamente:
+
+- Campos que leen una columna, también a través de relaciones a uno
+  (``source='candidato.first_name'``), o una anotación del queryset. El
+  valor pasa por el ``to_representation`` del propio campo, salvo en los
+  tipos en los que sería la identidad (texto, enteros, booleanos). Los
+  ``DateTimeField`` en ISO 8601 se convierten aquí, con la zona horaria
+  resuelta una vez por listado en lugar de una por valor.
+- ``PrimaryKeyRelatedField`` sobre una FK: el ``<fk>_id``.
+- Serializers anidados por relaciones a uno: ``None`` si la fila
+  relacionada no existe (su pk llega ``NULL`` del ``LEFT JOIN``), igual que
+  DRF.
+
+Con cualquier otra cosa (``SerializerMethodField``, relaciones a muchos, un
+``to_representation`` propio, una FK nullable en mitad de una ruta, que DRF
+omite en lugar de devolver ``None``, o un queryset con ``prefetch_related``)
+``compilar`` devuelve None y el listado usa el serializer.
+
+Los planes se guardan por clase de serializer y anotaciones del queryset,
+salvo los de ``?fields=``/``?expand=``, que se compilan en cada petición
+(como en ``eager_loading.optimizar``). Por eso los campos compilados no
+deben depender de ``self.context``. ``SERIALIZACION_RAPIDA = False``
+desactiva todo; ``serializacion_rapida = False`` en una vista, solo esa.
+"""
+import operator
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.relations import PKOnlyObject
+from rest_framework.settings import api_settings
+
+from .campos import a_medida
+
+_planes = {}
+
+# Zona de los DateTimeField mientras corre Plan.serializar
+_zona = ContextVar('zona_serializacion', default=None)
+
+# to_representation que devuelven tal cual lo que da .values() para esas columnas
+_IDENTIDAD = (
+    (serializers.CharField.to_representation, (models.CharField, models.TextField)),
+    (serializers.IntegerField.to_representation, (models.IntegerField,)),
+    (serializers.BooleanField.to_representation, (models.BooleanField,)),
+    (serializers.ReadOnlyField.to_representation, (models.Field,)),
+)
+
+# Campos de DRF que leen algo distinto del valor de la columna (o el contexto)
+_NO_COMPILABLES = (
+    serializers.RelatedField, serializers.ManyRelatedField, serializers.SerializerMethodField,
+    serializers.HiddenField, serializers.FileField,
+)
+
+
+class Plan:
+    def __init__(self, rutas, transformar):
+        self.rutas = rutas
+        self.transformar = transformar
+
+    def proyectar(self, queryset, requeridas=()):
+        """``queryset`` como dicts con las rutas del plan más ``requeridas`` (``pk``, versión, cursor)."""
+        return queryset.values(*dict.fromkeys([*self.rutas, *requeridas]))
+
+    def serializar(self, filas):
+        transformar = self.transformar
+        token = _zona.set(timezone.get_current_timezone() if settings.USE_TZ else None)
+        try:
+            return [transformar(fila) for fila in filas]
+        finally:
+            _zona.reset(token)
+
+
+def leer(fila, ruta):
+    """Valor de ``ruta`` (``vacante__fecha_actualizacion``) en una instancia o en un dict de ``.values()``."""
+    if isinstance(fila, dict):
+        return fila.get(ruta)
+    for parte in ruta.split('__'):
+        fila = getattr(fila, parte, None)
+    return fila
+
+
+def _recorrer(modelo, partes, ultima_nullable=False):
+    """Modelo al final de ``partes`` si todas son relaciones a uno que se pueden seguir con un join."""
+    for i, parte in enumerate(partes):
+        try:
+            campo = modelo._meta.get_field(parte)
+        except FieldDoesNotExist:
+            return None
+        if not campo.is_relation or campo.many_to_many or campo.one_to_many or campo.related_model is None:
+            return None
+        if campo.concrete and campo.null and not (ultima_nullable and i == len(partes) - 1):
+            return None
+        modelo = campo.related_model
+    return modelo
+
+
+def _columna(modelo, partes, anotaciones):
+    """Campo de modelo que lee ``partes``, ``True`` si es una anotación, o None."""
+    if len(partes) == 1 and partes[0] in anotaciones:
+        return True
+    modelo = _recorrer(modelo, partes[:-1])
+    if modelo is None:
+        return None
+    try:
+        campo = modelo._meta.get_field(partes[-1])
+    except FieldDoesNotExist:
+        return None
+    return campo if campo.concrete and not campo.is_relation else None
+
+
+def _es_identidad(campo, columna):
+    metodo = type(campo).to_representation
+    if isinstance(campo, serializers.ChoiceField):
+        return (
+            metodo is serializers.ChoiceField.to_representation and isinstance(columna, models.CharField)
+            and all(isinstance(valor, str) for valor in campo.choice_strings_to_values.values())
+        )
+    return any(metodo is base and isinstance(columna, tipos) for base, tipos in _IDENTIDAD)
+
+
+def _valor(ruta, convertir):
+    if convertir is None:
+        return operator.itemgetter(ruta)
+
+    def paso(fila):
+        valor = fila[ruta]
+        return None if valor is None else convertir(valor)
+    return paso
+
+
+def _es_fecha_iso(campo):
+    return (
+        type(campo).to_representation is serializers.DateTimeField.to_representation
+        and type(campo).enforce_timezone is serializers.DateTimeField.enforce_timezone
+        and not hasattr(campo, 'timezone')
+        and str(getattr(campo, 'format', api_settings.DATETIME_FORMAT)).lower() == ISO_8601
+    )
+
+
+def _fecha_iso(ruta, campo):
+    """``DateTimeField.to_representation`` en ISO 8601 con la zona de ``_zona``."""
+    convertir = campo.to_representation
+
+    def paso(fila):
+        valor = fila[ruta]
+        if valor is None:
+            return None
+        zona = _zona.get()
+        if zona is None or valor.tzinfo is None:
+            return convertir(valor)
+        texto = valor.astimezone(zona).isoformat()
+        return texto[:-6] + 'Z' if texto.endswith('+00:00') else texto
+    return paso
+
+
+def _pk(campo):
+    return lambda valor: campo.to_representation(PKOnlyObject(valor))
+
+
+def _anidado(centinela, transformar):
+    def paso(fila):
+        return None if fila[centinela] is None else transformar(fila)
+    return paso
+
+
+def _transformador(pasos):
+    def transformar(fila):
+        return {nombre: paso(fila) for nombre, paso in pasos}
+    return transformar
+
+
+def _compilar(serializer, modelo, prefijo='', anotaciones=()):
+    """``(rutas, transformar)`` para ``serializer`` sobre ``modelo``, o None si no se puede."""
+    if type(serializer).to_representation is not serializers.Serializer.to_representation:
+        return None
+    rutas, pasos = [], []
+    for nombre, campo in serializer.fields.items():
+        if campo.write_only:
+            continue
+        if campo.source == '*':
+            return None
+        ruta = prefijo + '__'.join(campo.source_attrs)
+        if isinstance(campo, serializers.BaseSerializer):
+            meta = getattr(campo, 'Meta', None)
+            relacionado = _recorrer(modelo, campo.source_attrs, ultima_nullable=True)
+            if isinstance(campo, serializers.ListSerializer) or relacionado is None \
+                    or getattr(meta, 'model', None) is not relacionado:
+                return None
+            hijo = _compilar(campo, relacionado, f'{ruta}__')
+            if hijo is None:
+                return None
+            centinela = f'{ruta}__{relacionado._meta.pk.name}'
+            rutas += [centinela, *hijo[0]]
+            pasos.append((nombre, _anidado(centinela, hijo[1])))
+        elif isinstance(campo, serializers.PrimaryKeyRelatedField):
+            *camino, fk = campo.source_attrs
+            destino = _recorrer(modelo, camino)
+            try:
+                columna_fk = destino._meta.get_field(fk) if destino is not None else None
+            except FieldDoesNotExist:
+                columna_fk = None
+            if columna_fk is None or not (columna_fk.concrete and columna_fk.is_relation) or columna_fk.many_to_many:
+                return None
+            identidad = (type(campo).to_representation is serializers.PrimaryKeyRelatedField.to_representation
+                         and campo.pk_field is None)
+            rutas.append(ruta)
+            pasos.append((nombre, _valor(ruta, None if identidad else _pk(campo))))
+        elif isinstance(campo, _NO_COMPILABLES):
+            return None
+        else:
+            columna = _columna(modelo, campo.source_attrs, anotaciones)
+            if columna is None:
+                return None
+            rutas.append(ruta)
+            if _es_fecha_iso(campo):
+                pasos.append((nombre, _fecha_iso(ruta, campo)))
+            else:
+                pasos.append((nombre, _valor(ruta, None if _es_identidad(campo, columna) else campo.to_representation)))
+    return rutas, _transformador(pasos)
+
+
+def compilar(serializer, queryset):
+    """``Plan`` para listar ``queryset`` con ``serializer``, o None si hay que usar el serializer."""
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    meta = getattr(serializer, 'Meta', None)
+    if getattr(meta, 'model', None) is not queryset.model or queryset._prefetch_related_lookups \
+            or queryset._fields is not None:
+        return None
+    anotaciones = frozenset(queryset.query.annotations)
+    if a_medida(serializer):
+        # Una forma por combinación de parámetros: no se guarda en _planes
+        compilado = _compilar(serializer, queryset.model, anotaciones=anotaciones)
+        return Plan(*compilado) if compilado else None
+    clave = (type(serializer), anotaciones)
+    if clave not in _planes:
+        compilado = _compilar(serializer, queryset.model, anotaciones=anotaciones)
+        _planes[clave] = Plan(*compilado) if compilado else None
+    return _planes[clave]
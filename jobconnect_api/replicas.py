@@ -0,0 +1,164 @@
+"""
+Lecturas en réplicas, escrituras en la principal.
+
+``ReplicasMiddleware`` marca las peticiones ``GET``/``HEAD``/``OPTIONS``
+(listados, detalles, estadísticas) y ``RouterReplicas`` manda sus lecturas a
+una de las réplicas de ``DATABASE_REPLICAS``, elegida al azar. Todo lo demás
+lee de la principal:
+
+- peticiones que modifican, comandos y el trabajador de ``tareas``;
+- lecturas dentro de un ``transaction.atomic()`` o con
+  ``select_for_update()``;
+- el resto de una petición de lectura a partir de su primera escritura;
+- las peticiones de un usuario que escribió hace menos de
+  ``REPLICAS_VENTANA_PRIMARIA`` segundos, para que vea lo que acaba de
+  escribir aunque la réplica vaya atrasada. El middleware deja la marca en la
+  caché (``REPLICAS_CACHE_ALIAS``, compartida entre procesos) al terminar una
+  petición que escribió, y la autenticación la consulta con ``identificar()``
+  antes de leer al usuario. El registro, que escribe sin usuario autenticado,
+  marca al usuario nuevo con ``fijar_primaria()``.
+
+Lo que un usuario escribe sobre otro (un cambio de estado que ve el
+candidato) sí puede tardar lo que tarde la réplica.
+
+``en_replica()`` permite marcar a mano un bloque de solo lectura fuera de una
+petición (un informe desde un comando, por ejemplo).
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+
+METODOS_LECTURA = ('GET', 'HEAD', 'OPTIONS')
+PREFIJO = 'replicas:primaria'
+
+_estado = ContextVar('peticion_replicas', default=None)
+
+
+class Peticion:
+    def __init__(self, lectura):
+        self.lectura = lectura  # puede leer de réplicas
+        self.escribio = False
+
+
+def replicas():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def _cache():
+    return caches[getattr(settings, 'REPLICAS_CACHE_ALIAS', 'default')]
+
+
+def _ventana():
+    return getattr(settings, 'REPLICAS_VENTANA_PRIMARIA', 10)
+
+
+def clave(user_id):
+    return f'{PREFIJO}:{user_id}'
+
+
+def fijar_primaria(user_id):
+    """Lleva a la principal las lecturas del usuario durante la ventana."""
+    if replicas():
+        _cache().set(clave(user_id), True, timeout=_ventana())
+
+
+def _consultar(estado):
+    return estado is not None and estado.lectura and bool(replicas())
+
+
+def identificar(user_id):
+    """Llamada al autenticar: si el usuario escribió hace poco, lee de la principal."""
+    estado = _estado.get()
+    if _consultar(estado) and _cache().get(clave(user_id)):
+        estado.lectura = False
+
+
+async def aidentificar(user_id):
+    estado = _estado.get()
+    if _consultar(estado) and await _cache().aget(clave(user_id)):
+        estado.lectura = False
+
+
+@contextmanager
+def en_replica():
+    token = _estado.set(Peticion(lectura=True))
+    try:
+        yield
+    finally:
+        _estado.reset(token)
+
+
+class RouterReplicas:
+    def db_for_read(self, model, **hints):
+        disponibles = replicas()
+        if not disponibles:
+            return None
+        estado = _estado.get()
+        if (estado is None or not estado.lectura or estado.escribio
+                or connections[DEFAULT_DB_ALIAS].in_atomic_block):
+            return DEFAULT_DB_ALIAS
+        return random.choice(disponibles)
+
+    def db_for_write(self, model, **hints):
+        estado = _estado.get()
+        if estado is not None:
+            estado.escribio = True
+        # Explícito: sin router Django escribiría donde se leyó la instancia
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        bases = {DEFAULT_DB_ALIAS, *replicas()}
+        if obj1._state.db in bases and obj2._state.db in bases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in replicas()
+
+
+def _fijar_si_escribio(request, estado):
+    # ``request.user`` lo deja la autenticación de DRF; solo se mira si hubo escritura
+    if estado.escribio and getattr(request, 'user', None) is not None and request.user.is_authenticated:
+        fijar_primaria(request.user.pk)
+
+
+class ReplicasMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.es_async = iscoroutinefunction(get_response)
+        if self.es_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.es_async:
+            return self.__acall__(request)
+        if not replicas():
+            return self.get_response(request)
+        estado = Peticion(lectura=request.method in METODOS_LECTURA)
+        token = _estado.set(estado)
+        try:
+            response = self.get_response(request)
+        finally:
+            _estado.reset(token)
+        _fijar_si_escribio(request, estado)
+        return response
+
+    async def __acall__(self, request):
+        if not replicas():
+            return await self.get_response(request)
+        estado = Peticion(lectura=request.method in METODOS_LECTURA)
+        token = _estado.set(estado)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _estado.reset(token)
+        await sync_to_async(_fijar_si_escribio)(request, estado)
+        return response
@@ -10,12 +10,13 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+from importlib.util import find_spec
 from pathlib import Path
-import dj_database_url
 import os
-import sys
 from dotenv import load_dotenv
 
+from .basedatos import PREFIJO_REPLICA, bases_de_datos
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -54,9 +55,15 @@ INSTALLED_APPS = [
     'empleos',
     'postulaciones',
     'usuarios',
+    'rendimiento',
+    'recomendaciones',
+    'estadisticas',
+    'tareas',
 ]
 
 MIDDLEWARE = [
+    'jobconnect_api.instrumentacion.InstrumentacionMiddleware',
+    'jobconnect_api.replicas.ReplicasMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -91,20 +98,34 @@ WSGI_APPLICATION = 'jobconnect_api.wsgi.application'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
 load_dotenv() # Load environment variables from .env file
-if 'pytest' in sys.argv[0]:
-    DATABASES = {
-        'default': {
-            'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': ':memory:',
-        }
-    }
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+# DATABASE_URL, réplicas, conexiones persistentes y pool (ver jobconnect_api/basedatos.py)
+DATABASES = bases_de_datos(BASE_DIR / 'db.sqlite3')
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith(PREFIJO_REPLICA)]
+DATABASE_ROUTERS = ['jobconnect_api.replicas.RouterReplicas']
+# Tras escribir, el usuario lee de la principal durante estos segundos (ver jobconnect_api/replicas.py)
+REPLICAS_VENTANA_PRIMARIA = int(os.environ.get('REPLICAS_VENTANA_PRIMARIA', '10'))
+REPLICAS_CACHE_ALIAS = 'default'
+
+
+# Password hashing: 'auto' (argon2 si está argon2-cffi, si no scrypt), 'argon2',
+# 'scrypt' o 'pbkdf2'. El primero hashea; el resto solo verifica hashes
+# existentes, que se rehacen al iniciar sesión (ver usuarios/hashers.py)
+HASHERS_CONTRASENA = {
+    'argon2': 'usuarios.hashers.Argon2Ajustado',
+    'scrypt': 'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
 }
+PASSWORD_HASHER = os.environ.get('PASSWORD_HASHER', 'auto')
+if PASSWORD_HASHER == 'auto':
+    PASSWORD_HASHER = 'argon2' if find_spec('argon2') else 'scrypt'
+PASSWORD_HASHERS = [HASHERS_CONTRASENA[PASSWORD_HASHER]] + [
+    ruta for nombre, ruta in HASHERS_CONTRASENA.items()
+    if nombre != PASSWORD_HASHER and (nombre != 'argon2' or find_spec('argon2'))
+]
 
+# Hash del registro en un pool del worker: '', 'hilos' o 'procesos'
+REGISTRO_HASH_EJECUTOR = os.environ.get('REGISTRO_HASH_EJECUTOR', '')
+REGISTRO_HASH_TRABAJADORES = int(os.environ.get('REGISTRO_HASH_TRABAJADORES', '2'))
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -151,7 +172,7 @@ AUTH_USER_MODEL = 'usuarios.Usuario'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'usuarios.authentication.CachedJWTAuthentication',
     ),
 
     'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.coreapi.AutoSchema',
@@ -161,12 +182,82 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_RENDERER_CLASSES': [
+        'jobconnect_api.json_rapido.JSONRendererRapido',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'jobconnect_api.json_rapido.JSONParserRapido',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'jobconnect_api.pagination.PaginacionHibrida',
     'PAGE_SIZE': 10,
 }
 
+# JSON con orjson si está instalado; '0' vuelve al json estándar (ver jobconnect_api/json_rapido.py)
+JSON_RAPIDO = os.environ.get('JSON_RAPIDO', '1') == '1'
+# Listados con el serializer compilado a .values() (ver jobconnect_api/proyeccion.py)
+SERIALIZACION_RAPIDA = os.environ.get('SERIALIZACION_RAPIDA', '1') == '1'
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'jobconnect'),
+    }
+}
+
+# Caché de respuestas de /api/vacantes/ (ver empleos/cache.py)
+VACANTES_CACHE_ACTIVA = os.environ.get('VACANTES_CACHE_ACTIVA', '1') == '1'
+VACANTES_CACHE_ALIAS = 'default'
+VACANTES_CACHE_TIMEOUT = 300
+
+# Búsqueda de vacantes: 'auto', 'sqlite_fts5', 'postgres' o 'simple' (ver empleos/search.py)
+SEARCH_BACKEND = os.environ.get('SEARCH_BACKEND', 'auto')
+
+# Recomendaciones vacante/candidato (ver recomendaciones/motor.py)
+RECOMENDACIONES_TIEMPO_REAL = os.environ.get('RECOMENDACIONES_TIEMPO_REAL', '1') == '1'
+RECOMENDACIONES_TOP_K = 50
+RECOMENDACIONES_TERMINOS_CONSULTA = 20
+RECOMENDACIONES_POSTINGS_POR_TERMINO = 250
+
 SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_OBTAIN_SERIALIZER": "usuarios.authentication.TokenConRolSerializer",
+}
+
+# Cola de tareas en base de datos (ver tareas/cola.py), en segundos
+TAREAS_VENTANA_AGRUPACION = 60
+TAREAS_BACKOFF_BASE = 30
+TAREAS_BACKOFF_MAXIMO = 3600
+TAREAS_DURACION_RESERVA = 300
+
+# Notificaciones de postulaciones (ver postulaciones/tareas.py)
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'JobConnect <no-responder@jobconnect.com>')
+NOTIFICACIONES_WEBHOOK_URL = os.environ.get('NOTIFICACIONES_WEBHOOK_URL', '')
+NOTIFICACIONES_WEBHOOK_TIMEOUT = 10
+
+# Usuario autenticado en caché (ver usuarios/authentication.py)
+AUTH_USUARIO_CACHE_ALIAS = 'default'
+AUTH_USUARIO_CACHE_TIMEOUT = 60
+
+# Métricas por petición (ver jobconnect_api/instrumentacion.py)
+INSTRUMENTACION_ACTIVA = os.environ.get('INSTRUMENTACION_ACTIVA', '1') == '1'
+INSTRUMENTACION_MUESTREO = float(os.environ.get('INSTRUMENTACION_MUESTREO', '0.05'))
+INSTRUMENTACION_UMBRAL_LENTO_MS = float(os.environ.get('INSTRUMENTACION_UMBRAL_LENTO_MS', '500'))
+INSTRUMENTACION_SQL_LENTAS = 5
+INSTRUMENTACION_SERVER_TIMING = os.environ.get('INSTRUMENTACION_SERVER_TIMING', '1') == '1'
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'consola': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'jobconnect_api.instrumentacion': {'handlers': ['consola'], 'level': 'INFO', 'propagate': False},
+    },
 }
 
 # CORS settings
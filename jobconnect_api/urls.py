@@ -44,6 +44,7 @@ urlpatterns = [
     path('api/', include('usuarios.urls')),
     path('api/', include('empleos.urls')),
     path('api/', include('postulaciones.urls')),
+    path('api/', include('estadisticas.urls')),
 
     # Autenticación
     path('api/login/', TokenObtainPairView.as_view(), name='login'),
@@ -98,6 +98,14 @@ function MisVacantes({ vacantes, onActualizar, expandida, setExpandida }) {
                                 }}>
                                     <strong>Tipo de contrato:</strong> {vacante.tipo_contrato}
                                 </p>
+                                <p style={{ 
+                                    color: "#4a5568",
+                                    fontSize: "0.95rem",
+                                    marginBottom: "0.5rem"
+                                }}>
+                                    <strong>Postulantes:</strong> {vacante.postulaciones_total ?? 0}
+                                    {' '}({vacante.postulaciones_en_revision ?? 0} en revisión, {vacante.postulaciones_seleccionado ?? 0} seleccionados, {vacante.postulaciones_descartado ?? 0} descartados)
+                                </p>
                             </div>
 
                             <div style={{ 
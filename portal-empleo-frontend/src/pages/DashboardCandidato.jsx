@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from "react";
 import api from "../api/jobconnect.api";
-import { FaMapMarkerAlt, FaCalendarAlt, FaFilter, FaEye, FaBuilding, FaUser, FaLink } from 'react-icons/fa';
+import { FaMapMarkerAlt, FaCalendarAlt, FaFilter, FaEye, FaBuilding, FaUser } from 'react-icons/fa';
 import { useNavigate } from "react-router-dom";
 import { ToastContainer, toast } from 'react-toastify';
 
@@ -32,36 +32,11 @@ function DashboardCandidato() {
 
             const res = await api.get(`/vacantes/?${params.toString()}`);
             
-            // Mapear datos de reclutador y empresa
-            const vacantesConDetalles = res.data.results.map(vacante => {
-                // Extraer datos del reclutador
-                const reclutador = vacante.reclutador || {
-                    id: null,
-                    first_name: 'Reclutador',
-                    last_name: 'no especificado',
-                    email: 'No disponible',
-                    perfil_reclutador: {
-                        empresa: 'Empresa no especificada',
-                        sitio_web: null,
-                        cargo: 'No especificado'
-                    }
-                };
-
-                return {
-                    ...vacante,
-                    reclutador: {
-                        id: reclutador.id,
-                        nombre: `${reclutador.first_name} ${reclutador.last_name}`.trim(),
-                        correo: reclutador.email,
-                        perfil_reclutador: reclutador.perfil_reclutador
-                    },
-                    empresa: {
-                        nombre: reclutador.perfil_reclutador?.empresa || 'Empresa no especificada',
-                        sitio_web: reclutador.perfil_reclutador?.sitio_web || null,
-                        cargo: reclutador.perfil_reclutador?.cargo || 'No especificado'
-                    }
-                };
-            });
+            // El listado trae la tarjeta compacta: empresa y resumen de la descripción
+            const vacantesConDetalles = res.data.results.map(vacante => ({
+                ...vacante,
+                empresa: { nombre: vacante.empresa || 'Empresa no especificada' }
+            }));
 
             setVacantes(vacantesConDetalles);
             setTotalPaginas(Math.ceil(res.data.count / 10));
@@ -274,17 +249,6 @@ function DashboardCandidato() {
                                                     {v.empresa.nombre || 'Empresa no especificada'}
                                                 </span>
                                             </div>
-                                            <div style={{ 
-                                                display: "flex", 
-                                                alignItems: "center", 
-                                                gap: "0.5rem",
-                                                color: "#718096"
-                                            }}>
-                                                <FaUser />
-                                                <span>
-                                                    {v.reclutador.nombre || 'Reclutador no especificado'}
-                                                </span>
-                                            </div>
                                             <div style={{ 
                                                 display: "flex", 
                                                 alignItems: "center", 
@@ -324,7 +288,7 @@ function DashboardCandidato() {
                                                 WebkitLineClamp: 3,
                                                 WebkitBoxOrient: "vertical"
                                             }}>
-                                                {v.descripcion}
+                                                {v.resumen}
                                             </p>
                                             
                                             <div style={{ 
@@ -343,26 +307,6 @@ function DashboardCandidato() {
                                                 </span>
                                                 
                                                 <div style={{ display: "flex", gap: "0.5rem" }}>
-                                                    {v.reclutador.perfil_reclutador.sitio_web && (
-                                                        <a 
-                                                            href={v.reclutador.perfil_reclutador.sitio_web} 
-                                                            target="_blank" 
-                                                            rel="noopener noreferrer"
-                                                            style={{
-                                                                backgroundColor: "#2ecc71",
-                                                                color: "white",
-                                                                border: "none",
-                                                                padding: "0.5rem",
-                                                                borderRadius: "50%",
-                                                                display: "flex",
-                                                                alignItems: "center",
-                                                                justifyContent: "center",
-                                                                cursor: "pointer"
-                                                            }}
-                                                        >
-                                                            <FaLink />
-                                                        </a>
-                                                    )}
                                                     <button
                                                         onClick={() => navigate(`/detalle-vacante/${v.id}`)}
                                                         className="transform hover:scale-105 active:scale-95 transition-all duration-200"
@@ -47,36 +47,34 @@ function DetalleVacantePage (){
                 // Procesar datos de postulantes
                 const datosPostulantes = postulantesRes.data.results || postulantesRes.data;
                 
-                // Obtener detalles completos de cada postulación
-                const postulantesConDetalles = await Promise.all(
-                    datosPostulantes.map(async (postulacion) => {
-                        try {
-                            // Obtener detalles específicos de la postulación
-                            const detallePostulacion = await api.get(`/postulaciones/${postulacion.id}/`);
-                            
-                            // Logging detallado para verificar estructura del correo
-                            console.log('Detalle de postulación:', detallePostulacion.data);
-                            console.log('Perfil candidato:', detallePostulacion.data.perfil_candidato);
-                            console.log('Estructura completa:', JSON.stringify(detallePostulacion.data, null, 2));
-
-                            // Obtener correo directamente de la postulación
-                            let correo = detallePostulacion.data.email || 'Sin Correo';
-
-                            return {
-                                ...detallePostulacion.data,
-                                candidato: {
-                                    id: detallePostulacion.data.candidato,
-                                    first_name: detallePostulacion.data.nombre,
-                                    last_name: detallePostulacion.data.apellido,
-                                    email: correo
-                                }
-                            };
-                        } catch (error) {
-                            console.error(`Error al obtener detalles de postulación ${postulacion.id}:`, error);
-                            return postulacion;
-                        }
-                    })
+                // Obtener detalles completos de las postulaciones en lotes (máx. 100 IDs por petición)
+                const ids = datosPostulantes.map((postulacion) => postulacion.id);
+                const lotes = [];
+                for (let i = 0; i < ids.length; i += 100) {
+                    lotes.push(ids.slice(i, i + 100));
+                }
+                const respuestasLote = await Promise.all(
+                    lotes.map((lote) => api.post('/postulaciones/lote/', { ids: lote }))
                 );
+                const detallesPorId = new Map(
+                    respuestasLote.flatMap((res) => res.data.resultados).map((detalle) => [detalle.id, detalle])
+                );
+
+                const postulantesConDetalles = datosPostulantes.map((postulacion) => {
+                    const detalle = detallesPorId.get(postulacion.id);
+                    if (!detalle) {
+                        return postulacion;
+                    }
+                    return {
+                        ...detalle,
+                        candidato: {
+                            id: detalle.candidato,
+                            first_name: detalle.nombre,
+                            last_name: detalle.apellido,
+                            email: detalle.email || 'Sin Correo'
+                        }
+                    };
+                });
 
                 setPostulantes(postulantesConDetalles);
                 setTotalPaginas(Math.ceil(datosPostulantes.length / 10)); // Asumiendo 10 items por página
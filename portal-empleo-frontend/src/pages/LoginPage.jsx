@@ -72,9 +72,9 @@ function LoginPage() {
 
             await cargarUsuario(); // 
 
-            // Obtener datos del usuario autenticado
-            const userRes = await api.get("/perfil-usuario/");
-            const rol = userRes.data.usuario.rol;
+            // El token de acceso ya trae el rol: no hace falta pedir el perfil otra vez
+            const claims = JSON.parse(atob(access.split(".")[1].replace(/-/g, "+").replace(/_/g, "/")));
+            const rol = claims.rol;
 
             if (rol === "candidato") {
                 navigate("/candidato");
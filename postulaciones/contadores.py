@@ -0,0 +1,103 @@
+"""
+Contadores de postulaciones por estado guardados en ``Vacante``.
+
+Las vistas que crean, cambian de estado o eliminan postulaciones llaman a
+``ajustar()`` dentro de la misma transacción; el ajuste es un ``UPDATE`` con
+``F()``, así que dos peticiones simultáneas no se pisan. Lo que no pasa por
+las vistas (admin, borrados en cascada, cargas masivas) deja los contadores
+desfasados hasta que los corrige ``reconciliar()`` (comando
+``reconciliar_contadores``); las restas se topan en cero mientras tanto.
+
+Un cambio de contador invalida el detalle cacheado de la vacante pero no los
+listados públicos: ahí los conteos pueden tardar hasta
+``VACANTES_CACHE_TIMEOUT`` en refrescarse. La invalidación espera al commit
+de la transacción de la vista (``cache.invalidar`` usa ``on_commit``): antes
+de eso, un detalle leído en paralelo con los contadores viejos quedaría
+guardado bajo la versión nueva. Los reclutadores, que son quienes
+los usan, no pasan por esa caché.
+"""
+from collections import Counter, defaultdict
+
+from django.db.models import Count, F, Q
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from empleos import cache
+from empleos.models import Vacante
+from .models import Postulacion
+
+ESTADOS = [valor for valor, _ in Postulacion._meta.get_field('estado').choices]
+
+
+def campo(estado):
+    return f"postulaciones_{estado.replace(' ', '_')}"
+
+
+CAMPOS = ['postulaciones_total'] + [campo(e) for e in ESTADOS]
+
+
+def ajustar(vacante_id, total=0, estados=None):
+    """
+    Suma ``total`` y los deltas de ``estados`` ({estado: delta}) a los
+    contadores de una vacante. Devuelve si la vacante existe.
+    """
+    cambios = {'postulaciones_total': total}
+    for estado, delta in (estados or {}).items():
+        cambios[campo(estado)] = cambios.get(campo(estado), 0) + delta
+    # Greatest(): una postulación creada fuera de las vistas no sumó, y restarla no debe dejar negativos
+    cambios = {c: F(c) + d if d > 0 else Greatest(F(c) + d, 0) for c, d in cambios.items() if d}
+    if not cambios:
+        return True
+    if not Vacante.objects.filter(pk=vacante_id).update(fecha_actualizacion=timezone.now(), **cambios):
+        return False
+    # Se aplica al confirmar la transacción de la vista, no aquí
+    cache.invalidar([vacante_id], listados=False)
+    return True
+
+
+def registrar_alta(postulacion):
+    return ajustar(postulacion.vacante_id, total=1, estados={postulacion.estado: 1})
+
+
+def registrar_baja(postulacion):
+    ajustar(postulacion.vacante_id, total=-1, estados={postulacion.estado: -1})
+
+
+def registrar_cambios(cambios):
+    """``cambios``: iterable de ``(vacante_id, estado_anterior, estado_nuevo)``; un UPDATE por vacante."""
+    por_vacante = defaultdict(Counter)
+    for vacante_id, anterior, nuevo in cambios:
+        if anterior != nuevo:
+            por_vacante[vacante_id][anterior] -= 1
+            por_vacante[vacante_id][nuevo] += 1
+    for vacante_id, deltas in por_vacante.items():
+        ajustar(vacante_id, estados=deltas)
+
+
+def reconciliar(lote=500):
+    """Recalcula los contadores por lotes de vacantes; devuelve cuántas se corrigieron."""
+    corregidas = 0
+    ultimo_id = 0
+    while True:
+        vacantes = list(Vacante.objects.filter(pk__gt=ultimo_id).order_by('pk').only('pk', *CAMPOS)[:lote])
+        if not vacantes:
+            return corregidas
+        ultimo_id = vacantes[-1].pk
+        conteos = {
+            fila.pop('vacante_id'): fila
+            for fila in Postulacion.objects.filter(vacante_id__in=[v.pk for v in vacantes])
+            .order_by().values('vacante_id')
+            .annotate(postulaciones_total=Count('id'), **{campo(e): Count('id', filter=Q(estado=e)) for e in ESTADOS})
+        }
+        desactualizadas = []
+        for vacante in vacantes:
+            reales = conteos.get(vacante.pk, {})
+            if any(getattr(vacante, c) != reales.get(c, 0) for c in CAMPOS):
+                for c in CAMPOS:
+                    setattr(vacante, c, reales.get(c, 0))
+                vacante.fecha_actualizacion = timezone.now()
+                desactualizadas.append(vacante)
+        if desactualizadas:
+            Vacante.objects.bulk_update(desactualizadas, CAMPOS + ['fecha_actualizacion'])
+            cache.invalidar([v.pk for v in desactualizadas])
+            corregidas += len(desactualizadas)
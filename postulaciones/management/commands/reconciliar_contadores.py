@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from postulaciones.contadores import reconciliar
+
+
+class Command(BaseCommand):
+    help = "Recalcula los contadores de postulaciones de cada vacante y corrige los desfasados."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lote', type=int, default=500, help='Vacantes por lote.')
+
+    def handle(self, *args, **options):
+        corregidas = reconciliar(lote=options['lote'])
+        self.stdout.write(self.style.SUCCESS(f'Vacantes corregidas: {corregidas}'))
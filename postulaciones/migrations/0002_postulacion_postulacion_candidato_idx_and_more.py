@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2026-10-18 10:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('empleos', '0002_vacante_vacante_fecha_idx_and_more'),
+        ('postulaciones', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='postulacion',
+            index=models.Index(fields=['candidato', '-fecha_postulacion'], name='postulacion_candidato_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postulacion',
+            index=models.Index(fields=['vacante', '-fecha_postulacion'], name='postulacion_vacante_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postulacion',
+            index=models.Index(fields=['vacante', 'estado', '-fecha_postulacion'], name='postulacion_vac_estado_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postulacion',
+            index=models.Index(condition=models.Q(('estado', 'en revision')), fields=['vacante', '-fecha_postulacion'], name='postulacion_pendientes_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-18 11:28
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def fechar_decisiones(apps, schema_editor):
+    # Sin historial, la mejor aproximación para las ya decididas es su última actualización
+    Postulacion = apps.get_model('postulaciones', 'Postulacion')
+    Postulacion.objects.exclude(estado='en revision').update(fecha_decision=F('fecha_actualizacion'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('empleos', '0004_vacante_contadores_postulaciones'),
+        ('postulaciones', '0003_postulacion_fecha_actualizacion'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postulacion',
+            name='fecha_decision',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='postulacion',
+            index=models.Index(fields=['vacante', 'fecha_decision'], name='postulacion_vac_decision_idx'),
+        ),
+        migrations.RunPython(fechar_decisiones, migrations.RunPython.noop),
+    ]
@@ -12,6 +12,9 @@ class Postulacion(models.Model):
         Vacante, on_delete=models.CASCADE, related_name='postulaciones'
     )
     fecha_postulacion = models.DateTimeField(auto_now_add=True)
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+    # Cuándo salió de 'en revision'; None mientras siga en revisión
+    fecha_decision = models.DateTimeField(null=True, blank=True)
     estado = models.CharField(
         max_length=30,
         choices=[('en revision', 'En revisión'), ('descartado', 'Descartado'), ('seleccionado', 'Seleccionado')],
@@ -20,6 +23,30 @@ class Postulacion(models.Model):
 
     class Meta:
         unique_together = ['candidato', 'vacante']
+        indexes = [
+            # "Mis postulaciones" del candidato
+            models.Index(fields=['candidato', '-fecha_postulacion'], name='postulacion_candidato_idx'),
+            # Postulaciones recibidas / por vacante, con y sin filtro de estado
+            models.Index(fields=['vacante', '-fecha_postulacion'], name='postulacion_vacante_idx'),
+            models.Index(fields=['vacante', 'estado', '-fecha_postulacion'], name='postulacion_vac_estado_idx'),
+            # Bandeja de pendientes: solo las que siguen en revisión
+            models.Index(
+                fields=['vacante', '-fecha_postulacion'],
+                condition=models.Q(estado='en revision'),
+                name='postulacion_pendientes_idx',
+            ),
+            # Decisiones por día en las estadísticas del reclutador
+            models.Index(fields=['vacante', 'fecha_decision'], name='postulacion_vac_decision_idx'),
+        ]
+
+    @staticmethod
+    def nueva_fecha_decision(estado_anterior, fecha_anterior, estado_nuevo, ahora):
+        """La decisión se fecha la primera vez que deja 'en revision'; volver a revisión la borra."""
+        if estado_nuevo == 'en revision':
+            return None
+        if estado_anterior == 'en revision' or fecha_anterior is None:
+            return ahora
+        return fecha_anterior
 
     def __str__(self):
         return f"{self.candidato.username} - {self.vacante.titulo}"
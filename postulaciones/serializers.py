@@ -1,11 +1,12 @@
 from rest_framework import serializers
 from .models import Postulacion
 from empleos.serializers import VacanteSerializer
-from usuarios.models import PerfilCandidato
-from usuarios.serializers import PerfilCandidatoSerializer
+from jobconnect_api.campos import CamposDinamicosMixin
+from usuarios.serializers import PerfilCandidatoSerializer, UsuarioSerializer
 
-class PostulacionSerializer(serializers.ModelSerializer):
-    perfil_candidato = serializers.SerializerMethodField()
+class PostulacionSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
+    # None si el candidato no tiene perfil
+    perfil_candidato = PerfilCandidatoSerializer(source='candidato.perfil_candidato', read_only=True)
     nombre = serializers.CharField(source='candidato.first_name', read_only=True)
     apellido = serializers.CharField(source='candidato.last_name', read_only=True)
     email = serializers.CharField(source='candidato.email', read_only=True)
@@ -14,8 +15,5 @@ class PostulacionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Postulacion
         fields = '__all__'
-        read_only_fields = ['candidato', 'vacante', 'fecha_postulacion']
-        
-    def get_perfil_candidato(self, obj):
-        perfil = getattr(obj.candidato, 'perfil_candidato', None)
-        return PerfilCandidatoSerializer(perfil).data if perfil else None
\ No newline at end of file
+        read_only_fields = ['candidato', 'vacante', 'fecha_postulacion', 'fecha_decision']
+        expandibles = {'candidato': UsuarioSerializer}  # ?expand=candidato
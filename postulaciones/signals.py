@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from usuarios.models import PerfilCandidato, Usuario
+from .models import Postulacion
+
+
+def _nueva_version_postulaciones_de(candidato_id):
+    # Nombre, correo y perfil del candidato van en cada postulación serializada
+    Postulacion.objects.filter(candidato_id=candidato_id).update(fecha_actualizacion=timezone.now())
+
+
+@receiver([post_save, post_delete], sender=PerfilCandidato)
+def perfil_candidato_modificado(sender, instance, **kwargs):
+    _nueva_version_postulaciones_de(instance.user_id)
+
+
+@receiver(post_save, sender=Usuario)
+def candidato_modificado(sender, instance, created=False, **kwargs):
+    if instance.rol == Usuario.Rol.CANDIDATO and not created:
+        _nueva_version_postulaciones_de(instance.pk)
@@ -0,0 +1,86 @@
+"""
+Notificaciones de postulaciones, entregadas por la cola de ``tareas``.
+
+Al candidato se le avisa de los cambios de estado y al reclutador de las
+postulaciones nuevas. Las dos tareas son agrupables por destinatario: varios
+cambios dentro de la ventana de agrupación llegan en un solo correo. El
+contenido se arma con el estado vigente al entregar, no al encolar.
+"""
+import json
+import urllib.request
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db.models import CharField, Subquery, Value
+from django.db.models.functions import Cast, Coalesce
+
+from empleos.models import Vacante
+from tareas.cola import encolar, nueva, tarea
+from .models import Postulacion
+
+NOTIFICAR_CANDIDATO = 'postulaciones.notificar_candidato'
+NOTIFICAR_RECLUTADOR = 'postulaciones.notificar_reclutador'
+
+
+def avisar_postulacion(postulacion):
+    # El reclutador se resuelve en el mismo INSERT de la tarea, sin consultarlo antes
+    reclutador = Vacante.objects.filter(pk=postulacion.vacante_id).values('reclutador_id')
+    clave = Coalesce(Cast(Subquery(reclutador), CharField()), Value(''))
+    encolar(nueva(NOTIFICAR_RECLUTADOR, clave=clave, postulacion_id=postulacion.pk))
+
+
+def avisar_cambios(cambios):
+    """``cambios``: pares ``(postulacion_id, candidato_id)`` cuyo estado cambió."""
+    encolar(*(nueva(NOTIFICAR_CANDIDATO, clave=candidato_id, postulacion_id=pk) for pk, candidato_id in cambios))
+
+
+def _postulaciones(lote):
+    ids = {argumentos['postulacion_id'] for argumentos in lote}
+    return list(
+        Postulacion.objects.filter(id__in=ids)
+        .select_related('candidato', 'vacante__reclutador')
+        .order_by('vacante__titulo', 'id')
+    )
+
+
+def entregar(usuario, asunto, lineas, evento, datos):
+    """Correo al usuario y, si está configurado, un POST al webhook de notificaciones."""
+    if usuario.email:
+        send_mail(asunto, '\n'.join(lineas), None, [usuario.email])
+    url = getattr(settings, 'NOTIFICACIONES_WEBHOOK_URL', '')
+    if url:
+        cuerpo = json.dumps({'evento': evento, 'usuario': usuario.pk, 'datos': datos}).encode()
+        peticion = urllib.request.Request(url, data=cuerpo, headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(peticion, timeout=getattr(settings, 'NOTIFICACIONES_WEBHOOK_TIMEOUT', 10)):
+            pass
+
+
+@tarea(NOTIFICAR_CANDIDATO, agrupable=True)
+def notificar_candidato(lote):
+    postulaciones = _postulaciones(lote)
+    if not postulaciones:
+        return  # eliminadas antes de la entrega
+    candidato = postulaciones[0].candidato
+    lineas = [f"Hola {candidato.first_name or candidato.username}, hay novedades en tus postulaciones:", '']
+    lineas += [f"- {p.vacante.titulo}: {p.get_estado_display()}" for p in postulaciones]
+    entregar(
+        candidato, 'Actualización de tus postulaciones', lineas, 'estado_postulacion',
+        [{'postulacion': p.pk, 'vacante': p.vacante_id, 'estado': p.estado} for p in postulaciones],
+    )
+
+
+@tarea(NOTIFICAR_RECLUTADOR, agrupable=True)
+def notificar_reclutador(lote):
+    postulaciones = _postulaciones(lote)
+    if not postulaciones:
+        return
+    reclutador = postulaciones[0].vacante.reclutador
+    lineas = [f"Recibiste {len(postulaciones)} postulación(es) nueva(s):", '']
+    lineas += [
+        f"- {p.vacante.titulo}: {p.candidato.get_full_name() or p.candidato.username}"
+        for p in postulaciones
+    ]
+    entregar(
+        reclutador, 'Nuevas postulaciones', lineas, 'postulacion_recibida',
+        [{'postulacion': p.pk, 'vacante': p.vacante_id, 'candidato': p.candidato_id} for p in postulaciones],
+    )
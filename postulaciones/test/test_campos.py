@@ -0,0 +1,104 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+from usuarios.models import PerfilCandidato, PerfilReclutador, Usuario
+
+
+@pytest.fixture
+def postulacion(db):
+    reclutador = Usuario.objects.create(username="reclu_campos", rol="reclutador")
+    PerfilReclutador.objects.create(user=reclutador, empresa="Empresa C", cargo="CTO", telefono="1")
+    vacante = Vacante.objects.create(titulo="Backend", descripcion="APIs", requisitos="Python",
+                                     tipo_contrato="Indefinido", reclutador=reclutador)
+    candidato = Usuario.objects.create(username="cand_campos", first_name="Ana", rol="candidato")
+    PerfilCandidato.objects.create(user=candidato, telefono="300", ciudad="Cali")
+    return Postulacion.objects.create(candidato=candidato, vacante=vacante)
+
+
+def cliente(usuario):
+    client = APIClient()
+    client.force_authenticate(user=usuario)
+    return client
+
+
+def postulados(postulacion, **params):
+    client = cliente(postulacion.vacante.reclutador)
+    with CaptureQueriesContext(connection) as consultas:
+        response = client.get(reverse("postulaciones-por-vacante"), {"vacante": postulacion.vacante_id, **params})
+    assert response.status_code == 200
+    return response.data["results"], consultas.captured_queries[-1]["sql"]
+
+
+def test_fields_recorta_la_respuesta_y_el_select(postulacion):
+    [fila], sql = postulados(postulacion, fields="id,nombre,estado")
+
+    assert fila == {"id": postulacion.id, "nombre": "Ana", "estado": "en revision"}
+    assert "usuarios_perfilcandidato" not in sql
+    assert '"empleos_vacante"."titulo"' not in sql
+    assert '"email"' not in sql
+
+
+def test_fields_con_puntos_baja_a_los_anidados(postulacion):
+    [fila], sql = postulados(postulacion, fields="id,vacante.titulo,vacante.reclutador.perfil_reclutador.empresa")
+
+    assert fila == {"id": postulacion.id, "vacante": {
+        "titulo": "Backend", "reclutador": {"perfil_reclutador": {"empresa": "Empresa C"}},
+    }}
+    assert '"empleos_vacante"."descripcion"' not in sql
+
+
+def test_expand_cambia_el_id_por_el_objeto(postulacion):
+    [sin_expandir], _ = postulados(postulacion, fields="id,candidato")
+    [expandida], _ = postulados(postulacion, fields="id,candidato.username", expand="candidato")
+
+    assert sin_expandir["candidato"] == postulacion.candidato_id
+    assert expandida["candidato"] == {"username": "cand_campos"}
+
+
+def test_sin_parametros_la_respuesta_no_cambia(postulacion):
+    [fila], _ = postulados(postulacion)
+
+    assert fila["perfil_candidato"]["ciudad"] == "Cali"
+    assert fila["vacante"]["reclutador"]["perfil_reclutador"]["empresa"] == "Empresa C"
+    assert fila["candidato"] == postulacion.candidato_id
+
+
+def test_etag_distingue_cada_forma(postulacion):
+    client = cliente(postulacion.candidato)
+    url = reverse("mis-postulaciones")
+    etag = client.get(url, {"fields": "id"})["ETag"]
+
+    assert client.get(url, {"fields": "id,estado"}, HTTP_IF_NONE_MATCH=etag).status_code == 200
+    assert client.get(url, {"fields": "id"}, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+
+def test_listado_de_vacantes_expande_el_reclutador(postulacion, settings):
+    settings.VACANTES_CACHE_ACTIVA = False
+
+    [tarjeta] = APIClient().get(reverse("vacante-list"), {
+        "fields": "titulo,reclutador.perfil_reclutador.empresa", "expand": "reclutador",
+    }).data["results"]
+
+    assert tarjeta == {"titulo": "Backend", "reclutador": {"perfil_reclutador": {"empresa": "Empresa C"}}}
+
+
+def test_fields_no_afecta_a_las_escrituras(postulacion):
+    client = cliente(postulacion.vacante.reclutador)
+
+    response = client.post(reverse("vacante-list") + "?fields=id", {
+        "titulo": "Frontend", "descripcion": "React", "requisitos": "JS", "tipo_contrato": "Indefinido",
+    })
+
+    assert response.status_code == 201
+    assert response.data["vacante"]["titulo"] == "Frontend"
+
+
+def test_perfil_de_usuario_con_fields(postulacion):
+    response = cliente(postulacion.candidato).get(reverse("mi-perfil"), {"fields": "username,ciudad"})
+
+    assert response.data == {"usuario": {"username": "cand_campos"}, "perfil": {"ciudad": "Cali"}}
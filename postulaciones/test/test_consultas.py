@@ -0,0 +1,95 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from usuarios.models import Usuario, PerfilCandidato, PerfilReclutador
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+
+
+def crear_reclutador(username):
+    reclutador = Usuario.objects.create(username=username, email=f"{username}@test.com", rol="reclutador")
+    PerfilReclutador.objects.create(user=reclutador, empresa="Empresa X", cargo="Gerente", telefono="123")
+    return reclutador
+
+
+def poblar(reclutador, cantidad):
+    vacante = Vacante.objects.create(
+        titulo="Backend",
+        descripcion="APIs",
+        requisitos="Python",
+        tipo_contrato="Indefinido",
+        reclutador=reclutador
+    )
+    for i in range(cantidad):
+        candidato = Usuario.objects.create(username=f"{reclutador.username}_candi_{i}", rol="candidato")
+        PerfilCandidato.objects.create(user=candidato, telefono="300", ciudad="Pasto")
+        Postulacion.objects.create(candidato=candidato, vacante=vacante)
+    return vacante
+
+
+def contar_consultas(client, url, params=None):
+    with CaptureQueriesContext(connection) as consultas:
+        response = client.get(url, params)
+    assert response.status_code == 200
+    return len(consultas)
+
+
+def assert_consultas_constantes(url_por_tamano, usuario_por_tamano, tamanos=(1, 5, 10)):
+    """Comprueba que el número de consultas no crece con el tamaño de la página."""
+    conteos = {}
+    for tamano in tamanos:
+        client = APIClient()
+        client.force_authenticate(user=usuario_por_tamano[tamano])
+        url, params = url_por_tamano[tamano]
+        conteos[tamano] = contar_consultas(client, url, params)
+    assert len(set(conteos.values())) == 1, conteos
+
+
+@pytest.mark.django_db
+def test_postulaciones_recibidas_consultas_constantes():
+    reclutadores = {}
+    for tamano in (1, 5, 10):
+        reclutadores[tamano] = crear_reclutador(f"reclu_{tamano}")
+        poblar(reclutadores[tamano], tamano)
+
+    urls = {t: (reverse("postulaciones-recibidas"), None) for t in reclutadores}
+    assert_consultas_constantes(urls, reclutadores)
+
+
+@pytest.mark.django_db
+def test_postulaciones_por_vacante_consultas_constantes():
+    reclutadores, urls = {}, {}
+    for tamano in (1, 5, 10):
+        reclutadores[tamano] = crear_reclutador(f"reclu_vac_{tamano}")
+        vacante = poblar(reclutadores[tamano], tamano)
+        urls[tamano] = (reverse("postulaciones-por-vacante"), {"vacante": vacante.id})
+
+    assert_consultas_constantes(urls, reclutadores)
+
+
+@pytest.mark.django_db
+def test_listado_vacantes_consultas_constantes():
+    for i in range(10):
+        poblar(crear_reclutador(f"reclu_lista_{i}"), 0)
+
+    client = APIClient()
+    url = reverse("vacante-list")
+    conteos = {t: contar_consultas(client, url, {"page_size": t}) for t in (1, 5, 10)}
+
+    assert len(set(conteos.values())) == 1, conteos
+
+
+@pytest.mark.django_db
+def test_mis_postulaciones_async_coincide_con_la_sincrona():
+    vacante = poblar(crear_reclutador("reclu_async"), 3)
+    candidato = vacante.postulaciones.first().candidato
+    client = APIClient()
+    client.force_authenticate(user=candidato)
+
+    sincrona = client.get(reverse("mis-postulaciones")).json()
+    asincrona = client.get(reverse("mis-postulaciones-async")).json()
+
+    assert asincrona == sincrona
+    assert asincrona["count"] == 1
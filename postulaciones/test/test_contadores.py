@@ -0,0 +1,117 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+from usuarios.models import Usuario, PerfilReclutador
+from empleos import cache
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+
+
+@pytest.fixture
+def vacante(db):
+    reclutador = Usuario.objects.create(username="reclu_cont", rol="reclutador")
+    PerfilReclutador.objects.create(user=reclutador, empresa="Empresa X", cargo="Gerente", telefono="123")
+    return Vacante.objects.create(
+        titulo="Backend", descripcion="APIs", requisitos="Python",
+        tipo_contrato="Indefinido", reclutador=reclutador
+    )
+
+
+def contadores(vacante):
+    vacante.refresh_from_db()
+    return (
+        vacante.postulaciones_total, vacante.postulaciones_en_revision,
+        vacante.postulaciones_descartado, vacante.postulaciones_seleccionado,
+    )
+
+
+def postularse(vacante, username):
+    candidato = Usuario.objects.create(username=username, rol="candidato")
+    client = APIClient()
+    client.force_authenticate(user=candidato)
+    response = client.post(reverse("postulaciones-list"), {"vacante": vacante.id})
+    assert response.status_code == 201
+    return candidato, response.data["postulacion"]["id"]
+
+
+@pytest.mark.django_db
+def test_contadores_siguen_crear_actualizar_y_eliminar(vacante):
+    candidato, primera = postularse(vacante, "cand_1")
+    postularse(vacante, "cand_2")
+    assert contadores(vacante) == (2, 2, 0, 0)
+
+    client = APIClient()
+    client.force_authenticate(user=vacante.reclutador)
+    client.patch(reverse("postulaciones-detail", args=[primera]), {"estado": "seleccionado"})
+    assert contadores(vacante) == (2, 1, 0, 1)
+
+    client.force_authenticate(user=candidato)
+    assert client.delete(reverse("postulaciones-detail", args=[primera])).status_code == 204
+    assert contadores(vacante) == (1, 1, 0, 0)
+
+
+@pytest.mark.django_db
+def test_cache_del_detalle_se_invalida_al_confirmar(vacante, django_capture_on_commit_callbacks):
+    version = f"vacantes:detalle:{vacante.id}:ver"
+    antes = cache._version(version)
+
+    with django_capture_on_commit_callbacks() as al_confirmar:
+        postularse(vacante, "cand_commit")
+        assert cache._version(version) == antes
+    for callback in al_confirmar:
+        callback()
+
+    assert cache._version(version) > antes
+
+
+@pytest.mark.django_db
+def test_contadores_con_cambio_de_estado_en_lote(vacante):
+    ids = [postularse(vacante, f"cand_lote_{i}")[1] for i in range(3)]
+    client = APIClient()
+    client.force_authenticate(user=vacante.reclutador)
+
+    client.post(reverse("postulaciones-estado-lote"), {"ids": ids[:2], "estado": "descartado"}, format="json")
+    client.post(reverse("postulaciones-estado-lote"), {"ids": ids, "estado": "descartado"}, format="json")
+
+    assert contadores(vacante) == (3, 0, 3, 0)
+
+
+@pytest.mark.django_db
+def test_contadores_en_el_serializer_sin_consultas_extra(vacante, django_assert_num_queries):
+    postularse(vacante, "cand_ser")
+    client = APIClient()
+    client.force_authenticate(user=vacante.reclutador)
+
+    with django_assert_num_queries(2):
+        response = client.get(reverse("vacante-list"))
+
+    assert response.data["results"][0]["postulaciones_total"] == 1
+    assert response.data["results"][0]["postulaciones_en_revision"] == 1
+
+
+@pytest.mark.django_db
+def test_contadores_no_se_editan_por_la_api(vacante):
+    client = APIClient()
+    client.force_authenticate(user=vacante.reclutador)
+    client.patch(reverse("vacante-detail", args=[vacante.id]), {"postulaciones_total": 99})
+
+    assert contadores(vacante)[0] == 0
+
+
+@pytest.mark.django_db
+def test_reconciliar_contadores_corrige_desfases(vacante, capsys):
+    otra = Vacante.objects.create(
+        titulo="Frontend", descripcion="UI", requisitos="React",
+        tipo_contrato="Indefinido", reclutador=vacante.reclutador
+    )
+    for i, estado in enumerate(["en revision", "descartado", "descartado"]):
+        candidato = Usuario.objects.create(username=f"cand_rec_{i}", rol="candidato")
+        Postulacion.objects.create(candidato=candidato, vacante=vacante, estado=estado)
+    Vacante.objects.filter(pk=otra.pk).update(postulaciones_total=5, postulaciones_en_revision=5)
+
+    call_command("reconciliar_contadores", lote=1)
+
+    assert contadores(vacante) == (3, 1, 2, 0)
+    assert contadores(otra) == (0, 0, 0, 0)
+    assert "Vacantes corregidas: 2" in capsys.readouterr().out
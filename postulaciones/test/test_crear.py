@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+from tareas.models import Tarea
+from usuarios.models import Usuario
+
+
+@pytest.fixture
+def vacante(db):
+    reclutador = Usuario.objects.create(username="reclu_crear", rol="reclutador")
+    return Vacante.objects.create(titulo="Backend", descripcion="APIs", requisitos="Python",
+                                  tipo_contrato="Indefinido", reclutador=reclutador)
+
+
+def cliente(username):
+    candidato = Usuario.objects.create(username=username, rol="candidato")
+    client = APIClient()
+    client.force_authenticate(user=candidato)
+    return candidato, client
+
+
+def postular(client, vacante_id):
+    return client.post(reverse("postulaciones-list"), {"vacante": vacante_id})
+
+
+@pytest.mark.django_db
+def test_postular_no_consulta_antes_del_insert(vacante, django_capture_on_commit_callbacks):
+    _, client = cliente("cand_insert")
+
+    with CaptureQueriesContext(connection) as consultas, django_capture_on_commit_callbacks(execute=True):
+        response = postular(client, vacante.id)
+
+    assert response.status_code == 201
+    sql = [q["sql"] for q in consultas.captured_queries if not q["sql"].startswith(("SAVEPOINT", "RELEASE"))]
+    assert sql[0].startswith('INSERT INTO "postulaciones_postulacion"')
+    # INSERT, contadores, 2 del rollup diario, 4 SELECT de la respuesta y la tarea (antes 11)
+    assert len(sql) == 9
+    tarea = Tarea.objects.get()
+    assert tarea.clave == str(vacante.reclutador_id)
+
+
+@pytest.mark.django_db
+def test_vacante_inexistente_no_deja_rastro(vacante):
+    _, client = cliente("cand_sin_vacante")
+
+    response = postular(client, vacante.id + 1000)
+
+    assert response.status_code == 400
+    assert response.data["vacante"] == "La vacante no existe."
+    assert not Postulacion.objects.exists()
+
+
+# Hilos con conexiones propias: necesita transacciones reales y una base que admita
+# escrituras concurrentes (con SQLite, el archivo que configura conftest.py)
+@pytest.mark.django_db(transaction=True)
+def test_postulaciones_simultaneas_no_fallan(vacante):
+    clientes = [cliente(f"cand_hilo_{i}")[1] for i in range(4)]
+    intentos = [c for c in clientes for _ in range(3)]  # cada candidato lo intenta tres veces
+    barrera = threading.Barrier(len(intentos))
+    estados = []
+
+    def trabajar(client):
+        try:
+            barrera.wait()
+            estados.append(postular(client, vacante.id).status_code)
+        finally:
+            connections.close_all()
+
+    hilos = [threading.Thread(target=trabajar, args=(c,)) for c in intentos]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert sorted(estados) == [201] * 4 + [400] * 8
+    vacante.refresh_from_db()
+    assert Postulacion.objects.count() == vacante.postulaciones_total == 4
@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+
+import pytest
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from rest_framework.test import APIClient
+from usuarios.models import Usuario, PerfilCandidato, PerfilReclutador
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+
+
+@pytest.fixture
+def datos(db):
+    reclutador = Usuario.objects.create(username="reclu_export", rol="reclutador")
+    PerfilReclutador.objects.create(user=reclutador, empresa="Empresa X", cargo="Gerente", telefono="123")
+    vacantes = [
+        Vacante.objects.create(
+            titulo=f"Vacante {i}", descripcion="APIs", requisitos="Python",
+            tipo_contrato="Indefinido", reclutador=reclutador
+        )
+        for i in range(2)
+    ]
+    for i in range(6):
+        candidato = Usuario.objects.create(
+            username=f"cand_export_{i}", first_name="Ana", last_name="Díaz",
+            email=f"c{i}@test.com", rol="candidato"
+        )
+        PerfilCandidato.objects.create(user=candidato, telefono="300", ciudad="Pasto", habilidades="Django, SQL")
+        Postulacion.objects.create(
+            candidato=candidato, vacante=vacantes[i % 2],
+            estado="descartado" if i == 0 else "en revision"
+        )
+    return reclutador, vacantes
+
+
+def descargar(usuario, params):
+    client = APIClient()
+    client.force_authenticate(user=usuario)
+    response = client.get(reverse("postulaciones-exportar"), params)
+    assert response.status_code == 200
+    assert isinstance(response, StreamingHttpResponse)
+    return response, b"".join(response.streaming_content).decode("utf-8")
+
+
+@pytest.mark.django_db
+def test_exportar_csv_por_vacante(datos):
+    reclutador, vacantes = datos
+    response, contenido = descargar(reclutador, {"vacante": vacantes[0].id})
+
+    filas = list(csv.DictReader(io.StringIO(contenido.lstrip("﻿"))))
+    assert response["Content-Disposition"] == 'attachment; filename="postulaciones.csv"'
+    assert len(filas) == 3
+    assert {f["vacante"] for f in filas} == {"Vacante 0"}
+    assert filas[0]["habilidades"] == "Django, SQL"
+    assert filas[0]["apellido"] == "Díaz"
+
+
+@pytest.mark.django_db
+def test_exportar_jsonl_con_filtro_de_estado(datos):
+    reclutador, _ = datos
+    _, contenido = descargar(reclutador, {"formato": "jsonl", "estado": "en revision"})
+
+    filas = [json.loads(linea) for linea in contenido.splitlines()]
+    assert len(filas) == 5
+    assert all(f["estado"] == "en revision" for f in filas)
+    assert filas[0]["ciudad"] == "Pasto"
+
+
+@pytest.mark.django_db
+def test_exportar_usa_una_sola_consulta(datos, django_assert_num_queries):
+    reclutador, _ = datos
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    response = client.get(reverse("postulaciones-exportar"))
+
+    with django_assert_num_queries(1):
+        contenido = b"".join(response.streaming_content)
+    assert contenido.count(b"\n") == 7
+
+
+@pytest.mark.django_db
+def test_exportar_solo_postulaciones_propias_y_reclutadores(datos):
+    _, vacantes = datos
+    otro = Usuario.objects.create(username="reclu_otro_export", rol="reclutador")
+    _, contenido = descargar(otro, {"vacante": vacantes[0].id})
+    assert contenido.strip("﻿").strip().count("\n") == 0
+
+    client = APIClient()
+    client.force_authenticate(user=Usuario.objects.get(username="cand_export_0"))
+    assert client.get(reverse("postulaciones-exportar")).status_code == 403
+    client.force_authenticate(user=otro)
+    assert client.get(reverse("postulaciones-exportar"), {"formato": "xml"}).status_code == 400
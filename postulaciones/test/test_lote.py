@@ -0,0 +1,118 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from usuarios.models import Usuario, PerfilCandidato, PerfilReclutador
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+
+
+def crear_vacante(username, candidatos):
+    reclutador = Usuario.objects.create(username=username, rol="reclutador")
+    PerfilReclutador.objects.create(user=reclutador, empresa="Empresa X", cargo="Gerente", telefono="123")
+    vacante = Vacante.objects.create(
+        titulo="Backend", descripcion="APIs", requisitos="Python",
+        tipo_contrato="Indefinido", reclutador=reclutador
+    )
+    postulaciones = []
+    for i in range(candidatos):
+        candidato = Usuario.objects.create(username=f"{username}_candi_{i}", email=f"c{i}@test.com", rol="candidato")
+        PerfilCandidato.objects.create(user=candidato, telefono="300", ciudad="Pasto", habilidades="Django")
+        postulaciones.append(Postulacion.objects.create(candidato=candidato, vacante=vacante))
+    return reclutador, postulaciones
+
+
+@pytest.mark.django_db
+def test_lote_por_query_string_conserva_orden_y_trae_perfil():
+    reclutador, postulaciones = crear_vacante("reclu_lote", 3)
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    ids = [postulaciones[2].id, postulaciones[0].id]
+
+    response = client.get(reverse("postulaciones-lote"), {"ids": ",".join(map(str, ids))})
+
+    assert response.status_code == 200
+    assert [p["id"] for p in response.data["resultados"]] == ids
+    assert response.data["resultados"][0]["perfil_candidato"]["habilidades"] == "Django"
+    assert response.data["no_encontrados"] == []
+
+
+@pytest.mark.django_db
+def test_lote_por_post_con_consultas_acotadas(django_assert_max_num_queries):
+    reclutador, postulaciones = crear_vacante("reclu_post", 20)
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+
+    with django_assert_max_num_queries(2):
+        response = client.post(reverse("postulaciones-lote"), {"ids": [p.id for p in postulaciones]}, format="json")
+
+    assert response.status_code == 200
+    assert len(response.data["resultados"]) == 20
+
+
+@pytest.mark.django_db
+def test_lote_respeta_propiedad_del_reclutador():
+    reclutador, propias = crear_vacante("reclu_a", 1)
+    _, ajenas = crear_vacante("reclu_b", 1)
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+
+    response = client.get(reverse("postulaciones-lote"), {"ids": f"{propias[0].id},{ajenas[0].id},999999"})
+
+    assert [p["id"] for p in response.data["resultados"]] == [propias[0].id]
+    assert response.data["no_encontrados"] == [ajenas[0].id, 999999]
+
+
+@pytest.mark.django_db
+def test_lote_valida_ids():
+    reclutador, _ = crear_vacante("reclu_val", 0)
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    url = reverse("postulaciones-lote")
+
+    assert client.get(url).status_code == 400
+    assert client.get(url, {"ids": "1,abc"}).status_code == 400
+    assert client.post(url, {"ids": "1,2"}, format="json").status_code == 400
+    assert client.post(url, {"ids": list(range(1, 102))}, format="json").status_code == 400
+    assert APIClient().get(url, {"ids": "1"}).status_code == 401
+
+
+@pytest.mark.django_db
+def test_estado_lote_actualiza_solo_las_propias(django_assert_max_num_queries):
+    reclutador, propias = crear_vacante("reclu_estado", 3)
+    _, ajenas = crear_vacante("reclu_otro", 1)
+    propias[1].estado = "descartado"
+    propias[1].save()
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    ids = [propias[0].id, propias[1].id, propias[2].id, ajenas[0].id]
+
+    # SELECT ... FOR UPDATE, UPDATE de postulaciones, contadores de la vacante y resumen diario
+    # (INSERT + UPDATE), más el savepoint; no crece con el número de IDs
+    with django_assert_max_num_queries(7):
+        response = client.post(reverse("postulaciones-estado-lote"), {"ids": ids, "estado": "descartado"}, format="json")
+
+    assert response.status_code == 200
+    assert response.data["actualizadas"] == 2
+    assert response.data["resultados"] == {
+        str(propias[0].id): "actualizada",
+        str(propias[1].id): "sin_cambios",
+        str(propias[2].id): "actualizada",
+        str(ajenas[0].id): "no_encontrada",
+    }
+    assert set(Postulacion.objects.filter(id__in=ids).values_list("id", "estado")) == {
+        (propias[0].id, "descartado"), (propias[1].id, "descartado"),
+        (propias[2].id, "descartado"), (ajenas[0].id, "en revision"),
+    }
+
+
+@pytest.mark.django_db
+def test_estado_lote_valida_estado_y_rol():
+    reclutador, propias = crear_vacante("reclu_estado_val", 1)
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    url = reverse("postulaciones-estado-lote")
+
+    assert client.post(url, {"ids": [propias[0].id], "estado": "contratado"}, format="json").status_code == 400
+
+    client.force_authenticate(user=propias[0].candidato)
+    assert client.post(url, {"ids": [propias[0].id], "estado": "seleccionado"}, format="json").status_code == 403
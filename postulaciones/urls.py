@@ -1,5 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from jobconnect_api.asincrono import vista_async
 from .views import (
     PostulacionViewSet,
     PostulacionesDeMisVacantesView,
@@ -17,4 +18,5 @@ urlpatterns = [
     path('postulaciones-por-vacante/', PostulacionesPorVacanteView.as_view(), name='postulaciones-por-vacante'),
     path('postulaciones-recibidas/', PostulacionesDeMisVacantesView.as_view(), name='postulaciones-recibidas'), # Para el reclutador
     path('mis-postulaciones/', MisPostulacionesView.as_view(), name='mis-postulaciones'),
+    path('async/mis-postulaciones/', vista_async(MisPostulacionesView, 'list'), name='mis-postulaciones-async'),
 ]
@@ -1,14 +1,67 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, permissions, serializers, generics, status
+from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
 from .models import Postulacion
+from . import contadores, tareas
 from .serializers import PostulacionSerializer
 from empleos.models import Vacante
+from estadisticas import rollups
+from jobconnect_api.asincrono import LecturaAsyncMixin
+from jobconnect_api.conditional import ConditionalGetMixin
+from jobconnect_api.eager_loading import EagerLoadingMixin, optimizar
+
+# Columnas de la exportación: (nombre en el archivo, campo del queryset)
+COLUMNAS_EXPORTACION = [
+    ('id', 'id'),
+    ('fecha_postulacion', 'fecha_postulacion'),
+    ('estado', 'estado'),
+    ('vacante_id', 'vacante_id'),
+    ('vacante', 'vacante__titulo'),
+    ('candidato_id', 'candidato_id'),
+    ('nombre', 'candidato__first_name'),
+    ('apellido', 'candidato__last_name'),
+    ('email', 'candidato__email'),
+    ('telefono', 'candidato__perfil_candidato__telefono'),
+    ('ciudad', 'candidato__perfil_candidato__ciudad'),
+    ('experiencia', 'candidato__perfil_candidato__experiencia'),
+    ('formacion', 'candidato__perfil_candidato__formacion'),
+    ('habilidades', 'candidato__perfil_candidato__habilidades'),
+]
+
+
+class _Eco:
+    """Buffer de escritura que devuelve lo escrito, para usar csv.writer en streaming."""
+
+    def write(self, valor):
+        return valor
+
+
+def filas_csv(columnas, filas):
+    writer = csv.writer(_Eco())
+    yield '\ufeff'  # BOM para que Excel detecte UTF-8
+    yield writer.writerow(columnas)
+    for fila in filas:
+        yield writer.writerow(fila)
+
+
+def filas_jsonl(columnas, filas):
+    for fila in filas:
+        yield json.dumps(dict(zip(columnas, fila)), ensure_ascii=False, cls=DjangoJSONEncoder) + '\n'
+
 
 # Create your views here.
-class PostulacionViewSet(viewsets.ModelViewSet):
+class PostulacionViewSet(ConditionalGetMixin, EagerLoadingMixin, viewsets.ModelViewSet):
     serializer_class = PostulacionSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -16,6 +69,10 @@ class PostulacionViewSet(viewsets.ModelViewSet):
     filterset_fields = ['estado', 'vacante']  # 👈 puedes filtrar por estado o vacante ID
     search_fields = ['vacante__titulo', 'candidato__username']
     ordering_fields = ['fecha_postulacion']
+    keyset_ordering = ('-fecha_postulacion', '-id')  # ?paginacion=cursor
+    version_related = ('vacante',)  # la vacante va anidada en cada postulación
+    max_lote = 100
+    tamano_bloque_exportacion = 2000
 
     def get_queryset(self):
         user = self.request.user
@@ -39,15 +96,22 @@ class PostulacionViewSet(viewsets.ModelViewSet):
         except (ValueError, TypeError):
             raise serializers.ValidationError({"vacante": "El ID de la vacante no es válido."})
         
-        # Validar existencia de la vacante y duplicdos
-        if not Vacante.objects.filter(id=vacante_id).exists():
+        # Sin consultas previas: el INSERT choca con unique_together si ya se postuló,
+        # y el UPDATE de los contadores no encuentra la vacante si no existe
+        try:
+            with transaction.atomic():
+                postulacion = serializer.save(candidato=user, vacante_id=vacante_id)
+                if not contadores.registrar_alta(postulacion):
+                    raise Vacante.DoesNotExist
+                rollups.registrar([(None, rollups.foto(postulacion))])
+                tareas.avisar_postulacion(postulacion)
+        except Vacante.DoesNotExist:
             raise serializers.ValidationError({"vacante": "La vacante no existe."})
-        
-        # Validar que el candidato no se haya postulado antes (Postulación duplicada)
-        if Postulacion.objects.filter(candidato=user, vacante_id=vacante_id).exists():
+        except IntegrityError:
+            # Solo en el camino de error: con FK no diferidas la vacante inexistente llega aquí
+            if not Vacante.objects.filter(id=vacante_id).exists():
+                raise serializers.ValidationError({"vacante": "La vacante no existe."})
             raise serializers.ValidationError({"mensaje": ["Ya te postulaste a esta vacante."]})
-        
-        serializer.save(candidato=user, vacante_id=vacante_id)
     
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -68,9 +132,150 @@ class PostulacionViewSet(viewsets.ModelViewSet):
         
         return super().update(request, *args, **kwargs)
 
-class PostulacionesDeMisVacantesView(generics.ListAPIView):
+    @transaction.atomic
+    def perform_update(self, serializer):
+        # Estado vigente leído con bloqueo, por si otra petición lo cambió después de get_object()
+        instancia = serializer.instance
+        bloqueada = Postulacion.objects.select_for_update().filter(pk=instancia.pk)
+        antes = rollups.Foto(instancia.vacante_id, instancia.fecha_postulacion,
+                             *bloqueada.values_list('estado', 'fecha_decision').get())
+        estado = serializer.validated_data.get('estado', antes.estado)
+        postulacion = serializer.save(fecha_decision=Postulacion.nueva_fecha_decision(
+            antes.estado, antes.fecha_decision, estado, timezone.now()
+        ))
+        contadores.registrar_cambios([(postulacion.vacante_id, antes.estado, postulacion.estado)])
+        rollups.registrar([(antes, rollups.foto(postulacion))])
+        if postulacion.estado != antes.estado:
+            tareas.avisar_cambios([(postulacion.pk, postulacion.candidato_id)])
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        bloqueada = Postulacion.objects.select_for_update().filter(pk=instance.pk)
+        vigente = bloqueada.values_list('estado', 'fecha_decision').first()
+        if vigente is not None:
+            instance.estado, instance.fecha_decision = vigente
+            bloqueada.delete()
+            contadores.registrar_baja(instance)
+            rollups.registrar([(rollups.foto(instance), None)])
+
+    @action(detail=False, methods=['get', 'post'])
+    def lote(self, request):
+        """
+        Varias postulaciones en una sola respuesta: ``GET ?ids=1,2,3`` o
+        ``POST {"ids": [1, 2, 3]}``. Solo devuelve las que el usuario puede ver
+        según ``get_queryset``; el resto se reporta en ``no_encontrados``.
+        """
+        ids = self.ids_lote(request)
+        queryset = optimizar(self.get_queryset().filter(id__in=ids), self.get_serializer())
+        encontradas = {p.id: p for p in queryset}
+        return Response({
+            "resultados": self.get_serializer([encontradas[i] for i in ids if i in encontradas], many=True).data,
+            "no_encontrados": [i for i in ids if i not in encontradas],
+        })
+
+    @action(detail=False, methods=['post'], url_path='estado-lote')
+    def estado_lote(self, request):
+        """
+        Cambia el ``estado`` de varias postulaciones del reclutador con un solo
+        ``UPDATE``. Devuelve el resultado por ID: ``actualizada``,
+        ``sin_cambios`` o ``no_encontrada`` (inexistente o de otro reclutador).
+        """
+        user = request.user
+        if user.rol != 'reclutador':
+            raise PermissionDenied("Solo los reclutadores pueden actualizar postulaciones.")
+        ids = self.ids_lote(request)
+        estado = request.data.get('estado')
+        estados = dict(Postulacion._meta.get_field('estado').choices)
+        if estado not in estados:
+            raise serializers.ValidationError({"estado": f"Estado no válido. Opciones: {', '.join(estados)}."})
+
+        propias = Postulacion.objects.filter(id__in=ids, vacante__reclutador=user)
+        with transaction.atomic():
+            filas = propias.select_for_update(of=('self',)).values_list(
+                'id', 'candidato_id', 'vacante_id', 'fecha_postulacion', 'estado', 'fecha_decision'
+            )
+            actuales, candidatos = {}, {}
+            for i, candidato_id, *resto in filas:
+                actuales[i], candidatos[i] = rollups.Foto(*resto), candidato_id
+            pendientes = [i for i, f in actuales.items() if f.estado != estado]
+            if pendientes:
+                ahora = timezone.now()
+                if estado == 'en revision':
+                    fecha_decision = Value(None)
+                else:
+                    # Misma regla que Postulacion.nueva_fecha_decision, en un solo UPDATE
+                    fecha_decision = Case(
+                        When(Q(estado='en revision') | Q(fecha_decision__isnull=True), then=Value(ahora)),
+                        default=F('fecha_decision'),
+                    )
+                propias.filter(id__in=pendientes).update(
+                    estado=estado, fecha_decision=fecha_decision, fecha_actualizacion=ahora
+                )
+                antes = [actuales[i] for i in pendientes]
+                contadores.registrar_cambios((f.vacante_id, f.estado, estado) for f in antes)
+                rollups.registrar((f, f._replace(estado=estado, fecha_decision=Postulacion.nueva_fecha_decision(
+                    f.estado, f.fecha_decision, estado, ahora
+                ))) for f in antes)
+                tareas.avisar_cambios((i, candidatos[i]) for i in pendientes)
+
+        resultados = {}
+        for i in ids:
+            if i not in actuales:
+                resultados[str(i)] = 'no_encontrada'
+            else:
+                resultados[str(i)] = 'sin_cambios' if actuales[i].estado == estado else 'actualizada'
+        return Response({"estado": estado, "actualizadas": len(pendientes), "resultados": resultados})
+
+    @action(detail=False, methods=['get'])
+    def exportar(self, request):
+        """
+        Descarga las postulaciones del reclutador en CSV (``?formato=csv``, por
+        defecto) o JSON Lines (``?formato=jsonl``). Admite los mismos filtros que
+        el listado (``estado``, ``vacante``) y recorre el queryset con
+        ``iterator()``, así que la memoria no crece con el número de filas.
+        """
+        if request.user.rol != 'reclutador':
+            raise PermissionDenied("Solo los reclutadores pueden exportar postulaciones.")
+        formato = request.query_params.get('formato', 'csv')
+        if formato not in ('csv', 'jsonl'):
+            raise serializers.ValidationError({"formato": "Usa 'csv' o 'jsonl'."})
+
+        columnas = [nombre for nombre, _ in COLUMNAS_EXPORTACION]
+        filas = (
+            self.filter_queryset(self.get_queryset())
+            .values_list(*(campo for _, campo in COLUMNAS_EXPORTACION))
+            .iterator(chunk_size=self.tamano_bloque_exportacion)
+        )
+        if formato == 'csv':
+            contenido, tipo = filas_csv(columnas, filas), 'text/csv; charset=utf-8'
+        else:
+            contenido, tipo = filas_jsonl(columnas, filas), 'application/x-ndjson'
+        response = StreamingHttpResponse(contenido, content_type=tipo)
+        response['Content-Disposition'] = f'attachment; filename="postulaciones.{formato}"'
+        return response
+
+    def ids_lote(self, request):
+        if request.method == 'GET':
+            crudos = [v for valor in request.query_params.getlist('ids') for v in valor.split(',') if v.strip()]
+        else:
+            crudos = request.data.get('ids') if hasattr(request.data, 'get') else None
+            if not isinstance(crudos, list):
+                raise serializers.ValidationError({"ids": "Envía una lista de IDs."})
+        try:
+            ids = list(dict.fromkeys(int(v) for v in crudos))
+        except (ValueError, TypeError):
+            raise serializers.ValidationError({"ids": "Los IDs deben ser números enteros."})
+        if not ids:
+            raise serializers.ValidationError({"ids": "Indica al menos un ID."})
+        if len(ids) > self.max_lote:
+            raise serializers.ValidationError({"ids": f"Máximo {self.max_lote} IDs por petición."})
+        return ids
+
+class PostulacionesDeMisVacantesView(ConditionalGetMixin, EagerLoadingMixin, generics.ListAPIView):
     serializer_class = PostulacionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    keyset_ordering = ('-fecha_postulacion', '-id')
+    version_related = ('vacante',)
     
     def get_queryset(self):
         user = self.request.user
@@ -78,9 +283,11 @@ class PostulacionesDeMisVacantesView(generics.ListAPIView):
             return Postulacion.objects.none()
         return Postulacion.objects.filter(vacante__reclutador=user).select_related("candidato", "vacante").order_by('-fecha_postulacion')
 
-class PostulacionesPorVacanteView(generics.ListAPIView):
+class PostulacionesPorVacanteView(ConditionalGetMixin, EagerLoadingMixin, generics.ListAPIView):
     serializer_class = PostulacionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    keyset_ordering = ('-fecha_postulacion', '-id')
+    version_related = ('vacante',)
     
     def get_queryset(self):
         user = self.request.user
@@ -91,9 +298,11 @@ class PostulacionesPorVacanteView(generics.ListAPIView):
     
         return Postulacion.objects.filter(vacante__id=vacante_id, vacante__reclutador=user).select_related("candidato").order_by('-fecha_postulacion')
 
-class MisPostulacionesView(generics.ListAPIView):
+class MisPostulacionesView(LecturaAsyncMixin, ConditionalGetMixin, EagerLoadingMixin, generics.ListAPIView):
     serializer_class = PostulacionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    keyset_ordering = ('-fecha_postulacion', '-id')
+    version_related = ('vacante',)
     
     def get_queryset(self):
         user = self.request.user
@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from recomendaciones.motor import reconstruir
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye el índice de recomendaciones y las afinidades precalculadas "
+        "(IDF fresco). Las señales solo actualizan los documentos que cambian."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lote', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        inicio = time.perf_counter()
+        resumen = reconstruir(lote=options['lote'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Recomendaciones recalculadas en {time.perf_counter() - inicio:.1f}s: {resumen}"
+        ))
@@ -0,0 +1,54 @@
+# Generated by Django 5.2 on 2026-10-18 10:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('empleos', '0003_vacante_fecha_actualizacion'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Termino',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('texto', models.CharField(max_length=100, unique=True)),
+                ('documentos', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Posting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(choices=[('vacante', 'Vacante'), ('candidato', 'Candidato')], max_length=10)),
+                ('objeto_id', models.BigIntegerField()),
+                ('termino', models.CharField(max_length=100)),
+                ('frecuencia', models.PositiveIntegerField()),
+                ('peso', models.FloatField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['tipo', 'termino', '-peso'], name='posting_termino_peso_idx')],
+                'unique_together': {('tipo', 'objeto_id', 'termino')},
+            },
+        ),
+        migrations.CreateModel(
+            name='Afinidad',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('puntaje', models.FloatField()),
+                ('candidato', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='afinidades', to=settings.AUTH_USER_MODEL)),
+                ('vacante', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='afinidades', to='empleos.vacante')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['vacante', '-puntaje'], name='afinidad_vacante_idx'), models.Index(fields=['candidato', '-puntaje'], name='afinidad_candidato_idx')],
+                'unique_together': {('vacante', 'candidato')},
+            },
+        ),
+    ]
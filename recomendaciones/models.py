@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.db import models
+
+from empleos.models import Vacante
+
+
+class Termino(models.Model):
+    """Frecuencia de documento de cada raíz, para el IDF."""
+    texto = models.CharField(max_length=100, unique=True)
+    documentos = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.texto
+
+
+class Posting(models.Model):
+    """Entrada del índice invertido: un término dentro de una vacante o de un candidato."""
+    VACANTE = 'vacante'
+    CANDIDATO = 'candidato'
+    TIPOS = [(VACANTE, 'Vacante'), (CANDIDATO, 'Candidato')]
+
+    tipo = models.CharField(max_length=10, choices=TIPOS)
+    objeto_id = models.BigIntegerField()  # Vacante.id o Usuario.id del candidato
+    termino = models.CharField(max_length=100)
+    frecuencia = models.PositiveIntegerField()
+    peso = models.FloatField()  # TF-IDF normalizado (norma L2 = 1 por documento)
+
+    class Meta:
+        unique_together = ['tipo', 'objeto_id', 'termino']
+        indexes = [
+            # Listas de campeones: los postings de más peso de cada término
+            models.Index(fields=['tipo', 'termino', '-peso'], name='posting_termino_peso_idx'),
+        ]
+
+
+class Afinidad(models.Model):
+    """Puntaje precalculado (similitud coseno) entre una vacante y un candidato."""
+    vacante = models.ForeignKey(Vacante, on_delete=models.CASCADE, related_name='afinidades')
+    candidato = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='afinidades')
+    puntaje = models.FloatField()
+
+    class Meta:
+        unique_together = ['vacante', 'candidato']
+        indexes = [
+            # candidatos-recomendados de una vacante
+            models.Index(fields=['vacante', '-puntaje'], name='afinidad_vacante_idx'),
+            # vacantes recomendadas a un candidato
+            models.Index(fields=['candidato', '-puntaje'], name='afinidad_candidato_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.vacante_id} - {self.candidato_id}: {self.puntaje:.3f}"
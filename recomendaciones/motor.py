@@ -0,0 +1,220 @@
+"""
+Motor de recomendaciones vacante ↔ candidato.
+
+Cada vacante (``titulo``, ``requisitos``, ``descripcion``) y cada perfil de
+candidato (``habilidades``, ``formacion``, ``experiencia``) se convierte en un
+vector TF-IDF disperso sobre las raíces de ``empleos.search.terminos``, con
+norma L2 = 1. Los vectores se guardan como un índice invertido (``Posting``)
+y la similitud coseno entre los dos lados se precalcula en ``Afinidad``, así
+que servir una recomendación es leer un top-N por índice.
+
+Para puntuar un documento solo se recorren, por cada uno de sus términos de
+más peso, los ``RECOMENDACIONES_POSTINGS_POR_TERMINO`` postings de más peso
+del otro lado (listas de campeones). El resultado es aproximado, pero el
+costo de una actualización no crece con el número de perfiles.
+
+``indexar()`` actualiza un documento y sus afinidades (lo llaman las
+señales); ``reconstruir()`` recalcula todo con IDF fresco.
+"""
+import heapq
+import math
+from collections import Counter, defaultdict
+from itertools import islice
+from operator import itemgetter
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+
+from empleos.models import Vacante
+from empleos.search import terminos
+from usuarios.models import PerfilCandidato
+from .models import Afinidad, Posting, Termino
+
+# Campos de texto de cada lado y cuántas veces cuenta cada aparición
+CAMPOS = {
+    Posting.VACANTE: (('titulo', 3), ('requisitos', 2), ('descripcion', 1)),
+    Posting.CANDIDATO: (('habilidades', 3), ('formacion', 1), ('experiencia', 1)),
+}
+OPUESTO = {Posting.VACANTE: Posting.CANDIDATO, Posting.CANDIDATO: Posting.VACANTE}
+PUNTAJE_MINIMO = 0.01
+
+
+def _ajuste(nombre, defecto):
+    return getattr(settings, f'RECOMENDACIONES_{nombre}', defecto)
+
+
+def frecuencias(objeto, tipo):
+    frecuencia = Counter()
+    for campo, peso in CAMPOS[tipo]:
+        for termino in terminos(getattr(objeto, campo) or ''):
+            frecuencia[termino[:100]] += peso
+    return frecuencia
+
+
+def idf(documentos, total):
+    return math.log((1 + total) / (1 + documentos)) + 1
+
+
+def vectorizar(frecuencia, documentos, total):
+    """Vector TF-IDF (tf sublineal) normalizado; ``documentos`` es el df por término."""
+    pesos = {t: (1 + math.log(f)) * idf(documentos.get(t, 0), total) for t, f in frecuencia.items()}
+    norma = math.sqrt(sum(w * w for w in pesos.values())) or 1.0
+    return {t: w / norma for t, w in pesos.items()}
+
+
+def consulta(vector):
+    """Los términos de más peso del vector, que son los que se buscan en el otro lado."""
+    return dict(heapq.nlargest(_ajuste('TERMINOS_CONSULTA', 20), vector.items(), key=itemgetter(1)))
+
+
+def puntuar(vector, postings_por_termino):
+    """Producto punto contra ``{termino: [(objeto_id, peso), ...]}``."""
+    puntajes = defaultdict(float)
+    for termino, peso in consulta(vector).items():
+        for objeto_id, peso_objeto in postings_por_termino.get(termino, ()):
+            puntajes[objeto_id] += peso * peso_objeto
+    return puntajes
+
+
+def mejores(puntajes, cantidad):
+    return heapq.nlargest(cantidad, ((o, p) for o, p in puntajes.items() if p >= PUNTAJE_MINIMO),
+                          key=itemgetter(1))
+
+
+def _documento(tipo, objeto_id):
+    if tipo == Posting.VACANTE:
+        return Vacante.objects.filter(pk=objeto_id).first()
+    return PerfilCandidato.objects.filter(user_id=objeto_id).first()
+
+
+def total_documentos():
+    return Vacante.objects.count() + PerfilCandidato.objects.count()
+
+
+def _columnas(tipo):
+    """(campo propio, campo del otro lado) de ``Afinidad`` para un tipo de documento."""
+    if tipo == Posting.VACANTE:
+        return 'vacante_id', 'candidato_id'
+    return 'candidato_id', 'vacante_id'
+
+
+def _actualizar_documentos(agregados, quitados):
+    if agregados:
+        Termino.objects.bulk_create([Termino(texto=t) for t in agregados], ignore_conflicts=True)
+        Termino.objects.filter(texto__in=agregados).update(documentos=F('documentos') + 1)
+    if quitados:
+        Termino.objects.filter(texto__in=quitados).update(documentos=F('documentos') - 1)
+
+
+@transaction.atomic
+def indexar(tipo, objeto_id):
+    """Reindexa un documento y recalcula sus afinidades; no hace nada si su texto no cambió."""
+    documento = _documento(tipo, objeto_id)
+    actual = frecuencias(documento, tipo) if documento is not None else Counter()
+    postings = Posting.objects.filter(tipo=tipo, objeto_id=objeto_id)
+    anterior = dict(postings.values_list('termino', 'frecuencia'))
+    if actual == anterior:
+        return
+
+    _actualizar_documentos(actual.keys() - anterior.keys(), anterior.keys() - actual.keys())
+    postings.delete()
+    if not actual:
+        Afinidad.objects.filter(**{_columnas(tipo)[0]: objeto_id}).delete()
+        return
+
+    documentos = dict(Termino.objects.filter(texto__in=actual).values_list('texto', 'documentos'))
+    vector = vectorizar(actual, documentos, total_documentos())
+    Posting.objects.bulk_create([
+        Posting(tipo=tipo, objeto_id=objeto_id, termino=t, frecuencia=actual[t], peso=w)
+        for t, w in vector.items()
+    ])
+    recalcular_afinidades(tipo, objeto_id, vector)
+
+
+def campeones(tipo, terminos_consulta):
+    """Los postings de más peso de cada término, leídos por ``posting_termino_peso_idx``."""
+    limite = _ajuste('POSTINGS_POR_TERMINO', 250)
+    return {
+        termino: list(
+            Posting.objects.filter(tipo=tipo, termino=termino)
+            .order_by('-peso').values_list('objeto_id', 'peso')[:limite]
+        )
+        for termino in terminos_consulta
+    }
+
+
+def recalcular_afinidades(tipo, objeto_id, vector):
+    puntajes = puntuar(vector, campeones(OPUESTO[tipo], consulta(vector)))
+    propio, otro = _columnas(tipo)
+    filas = Afinidad.objects.filter(**{propio: objeto_id})
+    # Se conservan (con el puntaje nuevo) los pares que ya estaban en el top del otro lado
+    existentes = set(filas.values_list(otro, flat=True))
+    conservar = dict(mejores(puntajes, _ajuste('TOP_K', 50)))
+    conservar.update({o: puntajes[o] for o in existentes if puntajes.get(o, 0) >= PUNTAJE_MINIMO})
+    filas.delete()
+    Afinidad.objects.bulk_create([
+        Afinidad(**{propio: objeto_id, otro: o, 'puntaje': p}) for o, p in conservar.items()
+    ])
+
+
+def _insertar(modelo, columnas, filas, lote):
+    """INSERT con ``executemany``: con millones de filas, crear instancias para bulk_create domina el tiempo."""
+    qn = connection.ops.quote_name
+    sql = 'INSERT INTO %s (%s) VALUES (%s)' % (
+        qn(modelo._meta.db_table), ', '.join(qn(c) for c in columnas), ', '.join(['%s'] * len(columnas))
+    )
+    filas = iter(filas)
+    with connection.cursor() as cursor:
+        while bloque := list(islice(filas, lote)):
+            cursor.executemany(sql, bloque)
+
+
+@transaction.atomic
+def reconstruir(lote=5000):
+    """Recalcula índice, IDF y afinidades de todos los documentos."""
+    Afinidad.objects.all().delete()
+    Posting.objects.all().delete()
+    Termino.objects.all().delete()
+
+    frecuencias_por_documento = {}
+    vacantes = Vacante.objects.only(*(c for c, _ in CAMPOS[Posting.VACANTE]))
+    for vacante in vacantes.iterator(chunk_size=lote):
+        frecuencias_por_documento[(Posting.VACANTE, vacante.pk)] = frecuencias(vacante, Posting.VACANTE)
+    perfiles = PerfilCandidato.objects.only('user_id', *(c for c, _ in CAMPOS[Posting.CANDIDATO]))
+    for perfil in perfiles.iterator(chunk_size=lote):
+        frecuencias_por_documento[(Posting.CANDIDATO, perfil.user_id)] = frecuencias(perfil, Posting.CANDIDATO)
+
+    documentos = Counter(t for f in frecuencias_por_documento.values() for t in f)
+    total = len(frecuencias_por_documento)
+    Termino.objects.bulk_create([Termino(texto=t, documentos=n) for t, n in documentos.items()], batch_size=lote)
+
+    vectores = {
+        clave: vectorizar(f, documentos, total)
+        for clave, f in frecuencias_por_documento.items() if f
+    }
+    _insertar(Posting, ['tipo', 'objeto_id', 'termino', 'frecuencia', 'peso'], (
+        (tipo, objeto_id, t, frecuencias_por_documento[(tipo, objeto_id)][t], w)
+        for (tipo, objeto_id), vector in vectores.items() for t, w in vector.items()
+    ), lote)
+
+    # Índice invertido en memoria, recortado igual que campeones()
+    indice = {Posting.VACANTE: defaultdict(list), Posting.CANDIDATO: defaultdict(list)}
+    for (tipo, objeto_id), vector in vectores.items():
+        for termino, peso in vector.items():
+            indice[tipo][termino].append((objeto_id, peso))
+    limite = _ajuste('POSTINGS_POR_TERMINO', 250)
+    for postings in indice.values():
+        for termino, lista in postings.items():
+            postings[termino] = heapq.nlargest(limite, lista, key=itemgetter(1))
+
+    top_k = _ajuste('TOP_K', 50)
+    afinidades = {}
+    for (tipo, objeto_id), vector in vectores.items():
+        for otro_id, puntaje in mejores(puntuar(vector, indice[OPUESTO[tipo]]), top_k):
+            par = (objeto_id, otro_id) if tipo == Posting.VACANTE else (otro_id, objeto_id)
+            afinidades[par] = puntaje
+    _insertar(Afinidad, ['vacante_id', 'candidato_id', 'puntaje'], (
+        (v, c, p) for (v, c), p in afinidades.items()
+    ), lote)
+    return {'terminos': len(documentos), 'documentos': len(vectores), 'afinidades': len(afinidades)}
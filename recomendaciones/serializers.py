@@ -0,0 +1,25 @@
+from rest_framework import serializers
+from empleos.serializers import VacanteSerializer
+from usuarios.serializers import PerfilCandidatoSerializer
+from .models import Afinidad
+
+
+class CandidatoRecomendadoSerializer(serializers.ModelSerializer):
+    candidato_id = serializers.IntegerField(read_only=True)
+    nombre = serializers.CharField(source='candidato.first_name', read_only=True)
+    apellido = serializers.CharField(source='candidato.last_name', read_only=True)
+    email = serializers.CharField(source='candidato.email', read_only=True)
+    perfil_candidato = PerfilCandidatoSerializer(source='candidato.perfil_candidato', read_only=True)
+    ya_postulado = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = Afinidad
+        fields = ['candidato_id', 'puntaje', 'nombre', 'apellido', 'email', 'perfil_candidato', 'ya_postulado']
+
+
+class VacanteRecomendadaSerializer(serializers.ModelSerializer):
+    vacante = VacanteSerializer(read_only=True)
+
+    class Meta:
+        model = Afinidad
+        fields = ['puntaje', 'vacante']
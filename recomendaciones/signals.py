@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from empleos.models import Vacante
+from usuarios.models import PerfilCandidato
+from . import motor
+from .models import Posting
+
+
+def programar(tipo, objeto_id):
+    """Reindexa el documento cuando se confirma la transacción que lo modificó."""
+    if getattr(settings, 'RECOMENDACIONES_TIEMPO_REAL', True):
+        transaction.on_commit(lambda: motor.indexar(tipo, objeto_id))
+
+
+@receiver([post_save, post_delete], sender=Vacante)
+def indexar_vacante(sender, instance, **kwargs):
+    programar(Posting.VACANTE, instance.pk)
+
+
+@receiver([post_save, post_delete], sender=PerfilCandidato)
+def indexar_perfil(sender, instance, **kwargs):
+    programar(Posting.CANDIDATO, instance.user_id)
@@ -0,0 +1,126 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+from usuarios.models import Usuario, PerfilCandidato, PerfilReclutador
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+from recomendaciones.models import Afinidad, Posting, Termino
+
+
+@pytest.fixture
+def escenario(db, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        reclutador = Usuario.objects.create(username="reclu_reco", rol="reclutador")
+        PerfilReclutador.objects.create(user=reclutador, empresa="Empresa X", cargo="Gerente", telefono="123")
+        backend = Vacante.objects.create(
+            titulo="Desarrollador Backend Python", descripcion="Construirás APIs con Django.",
+            requisitos="Python, Django, PostgreSQL", tipo_contrato="Indefinido", reclutador=reclutador
+        )
+        contable = Vacante.objects.create(
+            titulo="Contador Público", descripcion="Manejo de nómina e impuestos.",
+            requisitos="Contabilidad, Excel avanzado", tipo_contrato="Indefinido", reclutador=reclutador
+        )
+        candidatos = {}
+        for username, habilidades, formacion in [
+            ("dev", "Python, Django, PostgreSQL, Docker", "Ingeniería de Sistemas"),
+            ("conta", "Contabilidad, Excel avanzado, nómina", "Contaduría"),
+        ]:
+            candidato = Usuario.objects.create(username=username, first_name=username.title(), rol="candidato")
+            PerfilCandidato.objects.create(
+                user=candidato, telefono="300", ciudad="Pasto", habilidades=habilidades, formacion=formacion
+            )
+            candidatos[username] = candidato
+    return reclutador, backend, contable, candidatos
+
+
+def obtener(usuario, url, params=None):
+    client = APIClient()
+    client.force_authenticate(user=usuario)
+    return client.get(url, params)
+
+
+@pytest.mark.django_db
+def test_candidatos_recomendados_ordenados_por_afinidad(escenario):
+    reclutador, backend, _, candidatos = escenario
+    Postulacion.objects.create(candidato=candidatos["dev"], vacante=backend)
+
+    response = obtener(reclutador, reverse("vacante-candidatos-recomendados", args=[backend.id]))
+
+    assert response.status_code == 200
+    assert response.data[0]["candidato_id"] == candidatos["dev"].id
+    assert response.data[0]["ya_postulado"] is True
+    assert response.data[0]["perfil_candidato"]["habilidades"].startswith("Python")
+    assert all(r["candidato_id"] != candidatos["conta"].id for r in response.data)
+
+
+@pytest.mark.django_db
+def test_vacantes_recomendadas_excluye_postulaciones(escenario):
+    _, backend, contable, candidatos = escenario
+
+    response = obtener(candidatos["conta"], reverse("vacante-recomendadas"))
+    assert [r["vacante"]["id"] for r in response.data] == [contable.id]
+    assert 0 < response.data[0]["puntaje"] <= 1
+
+    Postulacion.objects.create(candidato=candidatos["conta"], vacante=contable)
+    assert obtener(candidatos["conta"], reverse("vacante-recomendadas")).data == []
+
+
+@pytest.mark.django_db
+def test_cambiar_perfil_actualiza_afinidades(escenario, django_capture_on_commit_callbacks):
+    _, backend, contable, candidatos = escenario
+    perfil = candidatos["dev"].perfil_candidato
+
+    with django_capture_on_commit_callbacks(execute=True):
+        perfil.habilidades = "Contabilidad, nómina, impuestos"
+        perfil.formacion = "Contaduría"
+        perfil.save()
+
+    response = obtener(candidatos["dev"], reverse("vacante-recomendadas"))
+    assert response.data[0]["vacante"]["id"] == contable.id
+    assert not Afinidad.objects.filter(vacante=backend, candidato=candidatos["dev"]).exists()
+
+
+@pytest.mark.django_db
+def test_borrar_vacante_la_quita_del_indice(escenario, django_capture_on_commit_callbacks):
+    _, backend, _, _ = escenario
+    termino = Termino.objects.get(texto="postgresql")
+    assert termino.documentos == 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        backend.delete()
+
+    assert not Posting.objects.filter(tipo=Posting.VACANTE, objeto_id=backend.id).exists()
+    termino.refresh_from_db()
+    assert termino.documentos == 1
+
+
+@pytest.mark.django_db
+def test_reconstruir_coincide_con_el_indice_incremental(escenario):
+    antes = set(Afinidad.objects.values_list("vacante_id", "candidato_id"))
+    call_command("recalcular_recomendaciones", stdout=None)
+
+    assert set(Afinidad.objects.values_list("vacante_id", "candidato_id")) == antes
+    assert Termino.objects.get(texto="python").documentos == 2
+
+
+@pytest.mark.django_db
+def test_recomendaciones_consultas_constantes(escenario, django_assert_num_queries):
+    _, _, _, candidatos = escenario
+    client = APIClient()
+    client.force_authenticate(user=candidatos["dev"])
+
+    with django_assert_num_queries(1):
+        client.get(reverse("vacante-recomendadas"), {"limite": 50})
+
+
+@pytest.mark.django_db
+def test_permisos_de_recomendaciones(escenario):
+    _, backend, _, candidatos = escenario
+    otro = Usuario.objects.create(username="otro_reco", rol="reclutador")
+    url = reverse("vacante-candidatos-recomendados", args=[backend.id])
+
+    assert obtener(otro, url).status_code == 404
+    assert obtener(candidatos["dev"], url).status_code == 403
+    assert obtener(otro, reverse("vacante-recomendadas")).status_code == 403
+    assert APIClient().get(reverse("vacante-recomendadas")).status_code == 401
@@ -0,0 +1,330 @@
+"""
+Suite de benchmark: sesiones de uso guionizadas y sus métricas por endpoint.
+
+Cada flujo de ``FLUJOS`` devuelve los ``Paso``s de una sesión típica de su
+rol, con usuarios, vacantes y postulaciones tomados de la base de datos:
+
+- ``busqueda_candidato``: listado, búsqueda, filtro, detalle, recomendadas
+  y mis postulaciones.
+- ``triage_reclutador``: bandejas de postulaciones, cambios de estado
+  (uno a uno y en lote) y estadísticas.
+- ``registro_masivo``: alta de candidatos nuevos seguida de su login.
+
+Los flujos se pueden ejecutar de dos formas:
+
+- ``ejecutar_en_proceso``: con el cliente de pruebas de DRF, en serie, y
+  cuenta además las consultas SQL de cada petición.
+- ``ejecutar_en_vivo``: contra un servidor en marcha, con N usuarios
+  virtuales concurrentes (ver ``rendimiento/carga.py``).
+
+``informe()`` arma el JSON que guarda ``manage.py ejecutar_benchmark`` y
+``comparar()`` lista las regresiones frente a un informe anterior.
+"""
+import asyncio
+import itertools
+import json
+import subprocess
+import time
+import uuid
+from collections import defaultdict, namedtuple
+from urllib.parse import urlencode, urlsplit
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+from usuarios.authentication import TokenConRolSerializer
+from usuarios.models import Usuario
+from .carga import leer_respuesta, peticion_http, resumen_latencias
+from .consultas import host_local
+from .semillas import CARGOS, CIUDADES, HABILIDADES
+
+Paso = namedtuple('Paso', 'nombre metodo ruta datos token')
+CLAVE_REGISTRO = 'Benchmark-Clave-2025'
+ESTADOS = ['en revision', 'descartado', 'seleccionado']
+
+
+def ruta(nombre, *args, **params):
+    base = reverse(nombre, args=args)
+    return f'{base}?{urlencode(params)}' if params else base
+
+
+def _token(usuario):
+    return str(TokenConRolSerializer.get_token(usuario).access_token)
+
+
+class Contexto:
+    """Usuarios y objetos de los que se alimentan los flujos; se arma antes de medir."""
+
+    def __init__(self, rng, muestra=50):
+        self.rng = rng
+        self.candidatos = [
+            (u, _token(u)) for u in Usuario.objects.filter(rol='candidato', is_active=True)
+            .annotate(n=Count('postulaciones')).order_by('-n', 'id')[:muestra]
+        ]
+        self.reclutadores = []
+        for u in (Usuario.objects.filter(rol='reclutador', is_active=True)
+                  .annotate(n=Count('vacantes')).filter(n__gt=0).order_by('-n', 'id')[:muestra]):
+            vacantes = list(u.vacantes.order_by('-fecha_publicacion').values_list('id', flat=True)[:200])
+            postulaciones = list(
+                Postulacion.objects.filter(vacante__reclutador=u)
+                .order_by('-fecha_postulacion').values_list('id', flat=True)[:500]
+            )
+            self.reclutadores.append((u, _token(u), vacantes, postulaciones))
+        self.vacantes = list(Vacante.objects.order_by('-fecha_publicacion').values_list('id', flat=True)[:5000])
+        self.prefijo = f'bench_{uuid.uuid4().hex[:8]}'
+        self.contador = itertools.count()
+
+
+def busqueda_candidato(ctx):
+    _, token = ctx.rng.choice(ctx.candidatos)
+    termino = ctx.rng.choice(HABILIDADES + CARGOS).split()[0]
+    pasos = [
+        Paso('vacantes_listado', 'GET', ruta('vacante-list'), None, token),
+        Paso('vacantes_busqueda', 'GET', ruta('vacante-list', search=termino), None, token),
+        Paso('vacantes_ubicacion', 'GET', ruta('vacante-list', ubicacion=ctx.rng.choice(CIUDADES)), None, token),
+    ]
+    if ctx.vacantes:
+        pasos.append(Paso('vacante_detalle', 'GET', ruta('vacante-detail', ctx.rng.choice(ctx.vacantes)), None, token))
+    pasos += [
+        Paso('vacantes_recomendadas', 'GET', ruta('vacante-recomendadas'), None, token),
+        Paso('mis_postulaciones', 'GET', ruta('mis-postulaciones'), None, token),
+    ]
+    return pasos
+
+
+def triage_reclutador(ctx):
+    _, token, vacantes, postulaciones = ctx.rng.choice(ctx.reclutadores)
+    pasos = [
+        Paso('mis_vacantes', 'GET', ruta('vacante-list'), None, token),
+        Paso('postulaciones_recibidas', 'GET', ruta('postulaciones-recibidas'), None, token),
+        Paso('postulaciones_por_vacante', 'GET',
+             ruta('postulaciones-por-vacante', vacante=ctx.rng.choice(vacantes)), None, token),
+        Paso('postulaciones_pendientes', 'GET', ruta('postulaciones-list', estado='en revision'), None, token),
+    ]
+    if postulaciones:
+        pasos += [
+            Paso('cambiar_estado', 'PATCH', ruta('postulaciones-detail', ctx.rng.choice(postulaciones)),
+                 {'estado': ctx.rng.choice(ESTADOS)}, token),
+            Paso('estado_lote', 'POST', ruta('postulaciones-estado-lote'), {
+                'ids': ctx.rng.sample(postulaciones, min(10, len(postulaciones))),
+                'estado': ctx.rng.choice(ESTADOS),
+            }, token),
+        ]
+    pasos.append(Paso('estadisticas', 'GET', ruta('estadisticas'), None, token))
+    return pasos
+
+
+def registro_masivo(ctx):
+    username = f'{ctx.prefijo}_{next(ctx.contador)}'
+    return [
+        Paso('registro', 'POST', ruta('registro'), {
+            'username': username,
+            'email': f'{username}@ejemplo.com',
+            'password': CLAVE_REGISTRO,
+            'first_name': 'Ana',
+            'last_name': 'Prueba',
+            'rol': 'candidato',
+            'perfil_candidato': {
+                'telefono': '3001234567',
+                'ciudad': ctx.rng.choice(CIUDADES),
+                'habilidades': ', '.join(ctx.rng.sample(HABILIDADES, 4)),
+            },
+        }, None),
+        Paso('login', 'POST', ruta('login'), {'username': username, 'password': CLAVE_REGISTRO}, None),
+    ]
+
+
+# Flujo -> rol del que necesita usuarios en la base (None: ninguno)
+FLUJOS = {
+    'busqueda_candidato': (busqueda_candidato, 'candidatos'),
+    'triage_reclutador': (triage_reclutador, 'reclutadores'),
+    'registro_masivo': (registro_masivo, None),
+}
+
+
+def disponibles(nombres, ctx):
+    """Flujos ejecutables con los datos del contexto, y los que se omiten."""
+    flujos, omitidos = [], []
+    for nombre in nombres:
+        flujo, requisito = FLUJOS[nombre]
+        (flujos if not requisito or getattr(ctx, requisito) else omitidos).append((nombre, flujo))
+    return flujos, [nombre for nombre, _ in omitidos]
+
+
+class Metricas:
+    def __init__(self):
+        self.endpoints = defaultdict(lambda: {'latencias': [], 'consultas': [], 'errores': 0})
+
+    def registrar(self, nombre, ms, estado, consultas=None):
+        datos = self.endpoints[nombre]
+        datos['latencias'].append(ms)
+        if consultas is not None:
+            datos['consultas'].append(consultas)
+        if not isinstance(estado, int) or estado >= 400:
+            datos['errores'] += 1
+
+    @staticmethod
+    def _resumir(latencias, consultas, errores, duracion):
+        duracion = duracion if duracion is not None else sum(latencias) / 1000
+        resumen = {
+            'peticiones': len(latencias),
+            'errores': errores,
+            'rps': round(len(latencias) / duracion, 1) if duracion else 0.0,
+            **resumen_latencias(latencias),
+        }
+        if consultas:
+            resumen['consultas_media'] = round(sum(consultas) / len(consultas), 2)
+            resumen['consultas_max'] = max(consultas)
+        return resumen
+
+    def resumen(self, duracion=None):
+        """Métricas por endpoint y totales.
+
+        Con ``duracion`` (segundos de carga concurrente) los req/s son el
+        throughput observado; sin ella, la capacidad en serie según la suma
+        de latencias.
+        """
+        endpoints = {
+            nombre: self._resumir(d['latencias'], d['consultas'], d['errores'], duracion)
+            for nombre, d in sorted(self.endpoints.items())
+        }
+        todas = self.endpoints.values()
+        total = self._resumir(
+            [ms for d in todas for ms in d['latencias']],
+            [c for d in todas for c in d['consultas']],
+            sum(d['errores'] for d in todas),
+            duracion,
+        )
+        return {'endpoints': endpoints, 'total': total}
+
+
+def ejecutar_en_proceso(flujos, ctx, iteraciones, calentamiento=1):
+    """Ejecuta los flujos en serie; la primera(s) vuelta(s) solo calientan cachés."""
+    cliente = APIClient(HTTP_HOST=host_local())
+    metricas = Metricas()
+    consultas = 0
+
+    def contar(execute, *args):
+        nonlocal consultas
+        consultas += 1
+        return execute(*args)
+
+    with connection.execute_wrapper(contar):
+        for vuelta in range(calentamiento + iteraciones):
+            for _, flujo in flujos:
+                for paso in flujo(ctx):
+                    if paso.token:
+                        cliente.credentials(HTTP_AUTHORIZATION=f'Bearer {paso.token}')
+                    else:
+                        cliente.credentials()
+                    consultas = 0
+                    antes = time.perf_counter()
+                    response = cliente.generic(
+                        paso.metodo, paso.ruta,
+                        *([json.dumps(paso.datos), 'application/json'] if paso.datos is not None else []),
+                    )
+                    ms = (time.perf_counter() - antes) * 1000
+                    if vuelta >= calentamiento:
+                        metricas.registrar(paso.nombre, ms, response.status_code, consultas)
+    return metricas.resumen()
+
+
+async def _usuario_virtual(partes, flujo, ctx, fin, metricas):
+    lector = escritor = None
+    while time.perf_counter() < fin:
+        for paso in flujo(ctx):
+            if time.perf_counter() >= fin:
+                break
+            try:
+                if escritor is None:
+                    lector, escritor = await asyncio.open_connection(partes.hostname, partes.port or 80)
+                antes = time.perf_counter()
+                escritor.write(peticion_http(paso.metodo, paso.ruta, partes.netloc, paso.token, paso.datos))
+                estado, mantener = await leer_respuesta(lector)
+                metricas.registrar(paso.nombre, (time.perf_counter() - antes) * 1000, estado)
+                if not mantener:
+                    escritor.close()
+                    escritor = None
+            except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+                metricas.registrar(paso.nombre, (time.perf_counter() - antes) * 1000, type(exc).__name__)
+                if escritor is not None:
+                    escritor.close()
+                escritor = None
+                await asyncio.sleep(0.01)
+                break
+    if escritor is not None:
+        escritor.close()
+
+
+async def _en_vivo(url, flujos, ctx, concurrencia, duracion):
+    partes = urlsplit(url)
+    metricas = Metricas()
+    inicio = time.perf_counter()
+    fin = inicio + duracion
+    # Los usuarios virtuales se reparten entre los flujos por turnos
+    await asyncio.gather(*(
+        _usuario_virtual(partes, flujos[i % len(flujos)][1], ctx, fin, metricas)
+        for i in range(concurrencia)
+    ))
+    return metricas.resumen(time.perf_counter() - inicio)
+
+
+def ejecutar_en_vivo(url, flujos, ctx, concurrencia, duracion):
+    """Usuarios virtuales concurrentes contra ``url`` durante ``duracion`` segundos."""
+    return asyncio.run(_en_vivo(url, flujos, ctx, concurrencia, duracion))
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def informe(modo, resultados, parametros):
+    return {
+        'version': 1,
+        'fecha': timezone.now().isoformat(),
+        'commit': _commit(),
+        'modo': modo,
+        'motor': connection.vendor,
+        'datos': {
+            'usuarios': Usuario.objects.count(),
+            'vacantes': Vacante.objects.count(),
+            'postulaciones': Postulacion.objects.count(),
+        },
+        'parametros': parametros,
+        **resultados,
+    }
+
+
+def comparar(base, actual, umbral=20.0, tolerancia_ms=1.0):
+    """Regresiones de ``actual`` frente a ``base``, como líneas de texto.
+
+    La latencia cuenta si empeora más de ``umbral`` % y más de
+    ``tolerancia_ms``; el throughput si cae más de ``umbral`` %; las
+    consultas con cualquier aumento de la media.
+    """
+    regresiones = []
+    for nombre, nuevo in actual['endpoints'].items():
+        previo = base.get('endpoints', {}).get(nombre)
+        if previo is None:
+            continue
+        for campo in ('p50_ms', 'p90_ms'):
+            antes, ahora = previo[campo], nuevo[campo]
+            if ahora - antes > tolerancia_ms and ahora > antes * (1 + umbral / 100):
+                regresiones.append(f'{nombre}: {campo} {antes} -> {ahora}')
+        if previo['rps'] and nuevo['rps'] < previo['rps'] * (1 - umbral / 100):
+            regresiones.append(f"{nombre}: rps {previo['rps']} -> {nuevo['rps']}")
+        if 'consultas_media' in previo and nuevo.get('consultas_media', 0) > previo['consultas_media']:
+            regresiones.append(f"{nombre}: consultas {previo['consultas_media']} -> {nuevo['consultas_media']}")
+    return regresiones
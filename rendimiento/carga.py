@@ -0,0 +1,59 @@
+"""
+Utilidades para medir contra un servidor en marcha.
+
+Un cliente HTTP/1.1 mínimo sobre ``asyncio`` con conexiones keep-alive: con
+cientos de conexiones concurrentes desde un solo proceso, el generador de
+carga no debe ser el cuello de botella.
+"""
+import json
+import statistics
+
+
+def percentil(valores, p):
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+def resumen_latencias(latencias):
+    """Percentiles en milisegundos de una lista de latencias en milisegundos."""
+    return {
+        'p50_ms': round(percentil(latencias, 50), 2),
+        'p90_ms': round(percentil(latencias, 90), 2),
+        'p99_ms': round(percentil(latencias, 99), 2),
+        'media_ms': round(statistics.fmean(latencias), 2) if latencias else 0.0,
+    }
+
+
+def peticion_http(metodo, ruta, host, token=None, datos=None):
+    """Bytes de una petición HTTP/1.1 con cuerpo JSON opcional."""
+    cabeceras = [f'{metodo} {ruta} HTTP/1.1', f'Host: {host}', 'Accept: application/json']
+    if token:
+        cabeceras.append(f'Authorization: Bearer {token}')
+    cuerpo = b''
+    if datos is not None:
+        cuerpo = json.dumps(datos).encode()
+        cabeceras += ['Content-Type: application/json', f'Content-Length: {len(cuerpo)}']
+    return ('\r\n'.join(cabeceras) + '\r\n\r\n').encode() + cuerpo
+
+
+async def leer_respuesta(lector):
+    """Lee una respuesta HTTP/1.1 completa; devuelve el código y si la conexión sigue abierta."""
+    cabeceras = await lector.readuntil(b'\r\n\r\n')
+    lineas = cabeceras.decode('latin-1').split('\r\n')
+    estado = int(lineas[0].split()[1])
+    campos = {}
+    for linea in lineas[1:]:
+        if ':' in linea:
+            nombre, valor = linea.split(':', 1)
+            campos[nombre.strip().lower()] = valor.strip()
+    if 'content-length' in campos:
+        await lector.readexactly(int(campos['content-length']))
+    elif campos.get('transfer-encoding') == 'chunked':
+        while True:
+            tamano = int((await lector.readuntil(b'\r\n')).split(b';')[0], 16)
+            await lector.readexactly(tamano + 2)
+            if tamano == 0:
+                break
+    return estado, campos.get('connection', '').lower() != 'close'
@@ -0,0 +1,129 @@
+"""
+Registro de las consultas calientes del API y análisis de sus planes.
+
+Cada ``Escenario`` es una petición GET real a un endpoint, ejecutada en
+proceso con el usuario más representativo de su rol. ``capturar_sql()``
+devuelve el SQL que emitió la vista y ``escaneos_secuenciales()`` revisa el
+``EXPLAIN`` de cada sentencia buscando recorridos completos de tabla.
+"""
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import resolve
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from usuarios.models import Usuario
+
+
+class Escenario:
+    def __init__(self, nombre, url, params=None, rol=None):
+        self.nombre = nombre
+        self.url = url
+        self.params = params or {}
+        self.rol = rol
+
+    def resolver_url(self, contexto):
+        return self.url(contexto) if callable(self.url) else self.url
+
+    def resolver_params(self, contexto):
+        return {k: v(contexto) if callable(v) else v for k, v in self.params.items()}
+
+
+def _vacante_mas_postulada(contexto):
+    vacante = contexto['reclutador'].vacantes.annotate(n=Count('postulaciones')).order_by('-n').first()
+    return vacante.id if vacante else 0
+
+
+ESCENARIOS = [
+    Escenario('vacantes_publicas', '/api/vacantes/'),
+    Escenario('vacantes_cursor', '/api/vacantes/', {'paginacion': 'cursor'}),
+    Escenario('vacantes_busqueda', '/api/vacantes/', {'search': 'desarrollador python'}),
+    Escenario('vacantes_ubicacion', '/api/vacantes/', {'ubicacion': 'Bogotá'}),
+    Escenario('vacantes_tipo_contrato', '/api/vacantes/', {'tipo_contrato': 'Indefinido'}),
+    Escenario('vacantes_reclutador', '/api/vacantes/', rol='reclutador'),
+    Escenario('postulaciones_recibidas', '/api/postulaciones-recibidas/', rol='reclutador'),
+    Escenario('postulaciones_por_estado', '/api/postulaciones/', {'estado': 'en revision'}, rol='reclutador'),
+    Escenario(
+        'postulaciones_por_vacante', '/api/postulaciones-por-vacante/',
+        {'vacante': _vacante_mas_postulada}, rol='reclutador',
+    ),
+    Escenario('mis_postulaciones', '/api/mis-postulaciones/', rol='candidato'),
+    Escenario(
+        'candidatos_recomendados',
+        lambda contexto: f'/api/vacantes/{_vacante_mas_postulada(contexto)}/candidatos-recomendados/',
+        rol='reclutador',
+    ),
+    Escenario('vacantes_recomendadas', '/api/vacantes/recomendadas/', rol='candidato'),
+    Escenario('estadisticas_reclutador', '/api/estadisticas/', rol='reclutador'),
+]
+
+
+def usuarios_representativos():
+    """El reclutador con más vacantes y el candidato con más postulaciones."""
+    return {
+        'reclutador': Usuario.objects.filter(rol='reclutador')
+        .annotate(n=Count('vacantes')).order_by('-n').first(),
+        'candidato': Usuario.objects.filter(rol='candidato')
+        .annotate(n=Count('postulaciones')).order_by('-n').first(),
+    }
+
+
+def host_local():
+    hosts = [h for h in settings.ALLOWED_HOSTS if '*' not in h]
+    return hosts[0].lstrip('.') if hosts else 'localhost'
+
+
+def capturar_sql(escenario, contexto):
+    """Ejecuta el escenario y devuelve las sentencias SELECT que emitió."""
+    factory = APIRequestFactory()
+    url = escenario.resolver_url(contexto)
+    request = factory.get(url, escenario.resolver_params(contexto), HTTP_HOST=host_local())
+    usuario = contexto.get(escenario.rol) if escenario.rol else None
+    if usuario is not None:
+        force_authenticate(request, user=usuario)
+    match = resolve(url)
+    # Con la caché de respuestas activa no se vería el SQL real
+    with override_settings(VACANTES_CACHE_ACTIVA=False), CaptureQueriesContext(connection) as consultas:
+        response = match.func(request, *match.args, **match.kwargs)
+        response.render()
+    if response.status_code != 200:
+        raise RuntimeError(f'{escenario.nombre}: respuesta {response.status_code}')
+    return [
+        q['sql'] for q in consultas.captured_queries
+        if q['sql'].lstrip().upper().startswith('SELECT') and not _es_catalogo(q['sql'])
+    ]
+
+
+def _es_catalogo(sql):
+    """Consultas de introspección (p. ej. al detectar el índice de búsqueda)."""
+    return any(tabla in sql for tabla in ('sqlite_master', 'pg_catalog', 'pg_indexes'))
+
+
+def plan(sql):
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f'EXPLAIN {sql}')
+            return [fila[0] for fila in cursor.fetchall()]
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+        return [fila[-1] for fila in cursor.fetchall()]
+
+
+def escaneos_secuenciales(lineas):
+    """Tablas recorridas completas, sin índice, según un plan."""
+    if connection.vendor == 'postgresql':
+        return [m.group(1) for linea in lineas for m in [re.search(r'Seq Scan on (\w+)', linea)] if m]
+    tablas = []
+    for linea in lineas:
+        detalle = linea.strip()
+        if (detalle.startswith('SCAN ') and ' USING ' not in detalle
+                and 'VIRTUAL TABLE' not in detalle and 'CONSTANT ROW' not in detalle):
+            tablas.append(detalle.split()[1])
+    return tablas
+
+
+def es_conteo_completo(sql):
+    """``COUNT(*)`` de la paginación por páginas: recorre todo por definición."""
+    return sql.lstrip().upper().startswith('SELECT COUNT(*)')
@@ -0,0 +1,122 @@
+import contextlib
+import json
+import random
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from rendimiento.benchmark import (
+    FLUJOS,
+    Contexto,
+    comparar,
+    disponibles,
+    ejecutar_en_proceso,
+    ejecutar_en_vivo,
+    informe,
+)
+from rendimiento.semillas import sembrar
+
+
+class _Revertir(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Ejecuta los flujos de uso guionizados (en proceso o contra un servidor en marcha), "
+        "informa req/s, latencias y consultas por endpoint y compara con un informe anterior."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modo', choices=['proceso', 'vivo'], default='proceso',
+                            help='proceso: cliente de pruebas, revierte todo al final; vivo: servidor en --url.')
+        parser.add_argument('--url', default='http://127.0.0.1:8000')
+        parser.add_argument('--flujo', action='append', dest='flujos', choices=sorted(FLUJOS),
+                            help='Flujos a ejecutar (repetible); por defecto todos.')
+        parser.add_argument('--iteraciones', type=int, default=20, help='Vueltas por flujo (modo proceso).')
+        parser.add_argument('--concurrencia', type=int, default=50, help='Usuarios virtuales (modo vivo).')
+        parser.add_argument('--duracion', type=float, default=30, help='Segundos de carga (modo vivo).')
+        parser.add_argument('--muestra', type=int, default=50, help='Usuarios de cada rol que se turnan.')
+        parser.add_argument('--semilla', type=int, default=42)
+        parser.add_argument('--salida', help='Archivo JSON donde guardar el informe.')
+        parser.add_argument('--comparar', dest='base', help='Informe JSON anterior contra el que comparar.')
+        parser.add_argument('--umbral', type=float, default=20,
+                            help='Porcentaje de empeoramiento que cuenta como regresión.')
+        parser.add_argument('--sembrar', action='store_true',
+                            help='Siembra datos antes de medir (solo modo proceso; se revierten al final).')
+        parser.add_argument('--reclutadores', type=int, default=200)
+        parser.add_argument('--candidatos', type=int, default=5000)
+        parser.add_argument('--vacantes', type=int, default=20000)
+        parser.add_argument('--postulaciones', type=int, default=100000)
+
+    def handle(self, *args, **options):
+        if options['sembrar'] and options['modo'] == 'vivo':
+            raise CommandError('--sembrar solo aplica al modo proceso; usa sembrar_datos antes de levantar el servidor.')
+        base = None
+        if options['base']:
+            with open(options['base'], encoding='utf-8') as archivo:
+                base = json.load(archivo)
+
+        resultado = None
+        # En modo proceso todo lo escrito (semillas, registros, cambios de
+        # estado) se revierte para que dos ejecuciones midan lo mismo
+        en_proceso = options['modo'] == 'proceso'
+        try:
+            with transaction.atomic() if en_proceso else contextlib.nullcontext():
+                if options['sembrar']:
+                    resumen = sembrar(
+                        reclutadores=options['reclutadores'], candidatos=options['candidatos'],
+                        vacantes=options['vacantes'], postulaciones=options['postulaciones'],
+                        semilla=options['semilla'],
+                    )
+                    self.stdout.write(f'Datos sembrados: {resumen}')
+                resultado = self.medir(options)
+                if en_proceso:
+                    raise _Revertir
+        except _Revertir:
+            pass
+
+        self.mostrar(resultado)
+        if options['salida']:
+            with open(options['salida'], 'w', encoding='utf-8') as archivo:
+                json.dump(resultado, archivo, ensure_ascii=False, indent=2)
+
+        if base is not None:
+            regresiones = comparar(base, resultado, options['umbral'])
+            if regresiones:
+                for linea in regresiones:
+                    self.stdout.write(self.style.ERROR(f'  {linea}'))
+                raise CommandError(f'{len(regresiones)} regresión(es) frente a {options["base"]}')
+            self.stdout.write(self.style.SUCCESS(f'Sin regresiones frente a {options["base"]}.'))
+
+    def medir(self, options):
+        ctx = Contexto(random.Random(options['semilla']), options['muestra'])
+        flujos, omitidos = disponibles(options['flujos'] or sorted(FLUJOS), ctx)
+        for nombre in omitidos:
+            self.stdout.write(self.style.WARNING(f'{nombre}: sin usuarios para este flujo, se omite'))
+        if not flujos:
+            raise CommandError('No hay datos para ningún flujo; usa --sembrar o sembrar_datos.')
+
+        parametros = {'flujos': [nombre for nombre, _ in flujos], 'muestra': options['muestra'],
+                      'semilla': options['semilla']}
+        if options['modo'] == 'proceso':
+            parametros['iteraciones'] = options['iteraciones']
+            resultados = ejecutar_en_proceso(flujos, ctx, options['iteraciones'])
+        else:
+            parametros.update(url=options['url'], concurrencia=options['concurrencia'],
+                              duracion=options['duracion'])
+            resultados = ejecutar_en_vivo(options['url'], flujos, ctx,
+                                          options['concurrencia'], options['duracion'])
+        return informe(options['modo'], resultados, parametros)
+
+    def mostrar(self, resultado):
+        con_consultas = resultado['modo'] == 'proceso'
+        for nombre, datos in [*resultado['endpoints'].items(), ('TOTAL', resultado['total'])]:
+            linea = (
+                f"{nombre:<28} {datos['peticiones']:>6} pet  {datos['rps']:>8} req/s  "
+                f"p50 {datos['p50_ms']:>8} ms  p90 {datos['p90_ms']:>8} ms  p99 {datos['p99_ms']:>8} ms  "
+                f"errores {datos['errores']}"
+            )
+            if con_consultas:
+                linea += f"  consultas {datos.get('consultas_media', 0)} (máx {datos.get('consultas_max', 0)})"
+            self.stdout.write(linea)
@@ -0,0 +1,77 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from rendimiento.consultas import (
+    ESCENARIOS,
+    capturar_sql,
+    es_conteo_completo,
+    escaneos_secuenciales,
+    plan,
+    usuarios_representativos,
+)
+from rendimiento.semillas import sembrar
+
+
+class _Revertir(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Ejecuta EXPLAIN sobre las consultas de cada endpoint registrado y falla "
+        "si alguna recorre una tabla completa."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sembrar', action='store_true',
+                            help='Crea un conjunto de datos grande antes de analizar y lo revierte al final.')
+        parser.add_argument('--vacantes', type=int, default=20000)
+        parser.add_argument('--postulaciones', type=int, default=100000)
+        parser.add_argument('--candidatos', type=int, default=5000)
+        parser.add_argument('--reclutadores', type=int, default=200)
+        parser.add_argument('--escenario', action='append', dest='escenarios',
+                            help='Limita el análisis a los escenarios indicados.')
+
+    def handle(self, *args, **options):
+        escenarios = [e for e in ESCENARIOS if not options['escenarios'] or e.nombre in options['escenarios']]
+        fallos = []
+        try:
+            with transaction.atomic():
+                if options['sembrar']:
+                    resumen = sembrar(
+                        reclutadores=options['reclutadores'], candidatos=options['candidatos'],
+                        vacantes=options['vacantes'], postulaciones=options['postulaciones'],
+                    )
+                    self.stdout.write(f"Datos sembrados: {resumen}")
+                with connection.cursor() as cursor:
+                    cursor.execute('ANALYZE')
+                fallos = self.analizar(escenarios)
+                if options['sembrar']:
+                    raise _Revertir
+        except _Revertir:
+            pass
+
+        if fallos:
+            raise CommandError(f"Recorridos secuenciales en: {', '.join(fallos)}")
+        self.stdout.write(self.style.SUCCESS('Todas las consultas usan índices.'))
+
+    def analizar(self, escenarios):
+        contexto = usuarios_representativos()
+        fallos = []
+        for escenario in escenarios:
+            if escenario.rol and contexto.get(escenario.rol) is None:
+                self.stdout.write(self.style.WARNING(f'{escenario.nombre}: sin usuarios con rol {escenario.rol}'))
+                continue
+            self.stdout.write(self.style.MIGRATE_HEADING(escenario.nombre))
+            for sql in capturar_sql(escenario, contexto):
+                lineas = plan(sql)
+                tablas = escaneos_secuenciales(lineas)
+                self.stdout.write(f'  {sql[:160]}')
+                for linea in lineas:
+                    self.stdout.write(f'    {linea}')
+                if tablas and es_conteo_completo(sql):
+                    self.stdout.write(self.style.WARNING('    conteo completo (evitable con ?conteo=estimado)'))
+                elif tablas:
+                    self.stdout.write(self.style.ERROR(f"    recorrido secuencial: {', '.join(tablas)}"))
+                    fallos.append(escenario.nombre)
+        return fallos
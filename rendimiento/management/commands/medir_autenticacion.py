@@ -0,0 +1,56 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from usuarios.authentication import CachedJWTAuthentication, TokenConRolSerializer
+from usuarios.models import PerfilCandidato, Usuario
+
+
+class _Revertir(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara consultas y tiempo por petición autenticada entre JWTAuthentication "
+        "de simplejwt y la autenticación con el usuario en caché."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--peticiones', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                usuario = Usuario.objects.create(username='medir_autenticacion', rol='candidato')
+                PerfilCandidato.objects.create(user=usuario, telefono='3000000000', ciudad='Bogotá')
+                token = TokenConRolSerializer.get_token(usuario).access_token
+                for clase in (JWTAuthentication, CachedJWTAuthentication):
+                    consultas, ms = self.medir(clase(), str(token), options['peticiones'])
+                    self.stdout.write(f'{clase.__name__:<26} {consultas:6.2f} consultas/petición  {ms:8.4f} ms/petición')
+                raise _Revertir
+        except _Revertir:
+            pass
+
+    def medir(self, autenticacion, token, peticiones):
+        factory = APIRequestFactory()
+        peticion = factory.get('/api/perfil-usuario/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        # La primera petición llena la caché; se mide el estado estable
+        autenticacion.authenticate(Request(peticion))
+        consultas = 0
+
+        def contar(execute, *args):
+            nonlocal consultas
+            consultas += 1
+            return execute(*args)
+
+        with connection.execute_wrapper(contar):
+            inicio = time.perf_counter()
+            for _ in range(peticiones):
+                autenticacion.authenticate(Request(peticion))
+            transcurrido = time.perf_counter() - inicio
+        return consultas / peticiones, transcurrido * 1000 / peticiones
@@ -0,0 +1,70 @@
+import io
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from empleos.models import Vacante
+from jobconnect_api import json_rapido
+from jobconnect_api.eager_loading import optimizar
+from rendimiento.semillas import sembrar
+
+from .medir_serializacion import VARIANTES
+
+
+class _Revertir(Exception):
+    pass
+
+
+def _cronometrar(funcion, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) * 1000 / repeticiones, resultado
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara el render y el parseo en JSON de una página de cada serializer de VARIANTES "
+        "con el json estándar y con orjson (ver jobconnect_api/json_rapido.py)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--filas', type=int, default=100, help='Filas por página.')
+        parser.add_argument('--repeticiones', type=int, default=50)
+        parser.add_argument('--sembrar', action='store_true',
+                            help='Siembra datos de prueba dentro de una transacción que se revierte al terminar.')
+
+    def handle(self, *args, **options):
+        if json_rapido.orjson is None:
+            raise CommandError('orjson no está instalado.')
+        if options['filas'] < 1 or options['repeticiones'] < 1:
+            raise CommandError('--filas y --repeticiones deben ser al menos 1.')
+        try:
+            with transaction.atomic():
+                if options['sembrar']:
+                    sembrar(reclutadores=20, candidatos=200, vacantes=500, postulaciones=max(options['filas'], 1000))
+                if not Vacante.objects.exists():
+                    raise CommandError('No hay vacantes: usa --sembrar o sembrar_datos.')
+                for nombre, pagina in VARIANTES.items():
+                    self.comparar(nombre, *pagina(), options['filas'], options['repeticiones'])
+                raise _Revertir
+        except _Revertir:
+            pass
+
+    def comparar(self, nombre, queryset, clase, filas, repeticiones):
+        datos = clase(list(optimizar(queryset, clase(many=True))[:filas]), many=True).data
+        renderer, parser = json_rapido.JSONRendererRapido(), json_rapido.JSONParserRapido()
+        # La ruta estándar de JSONRendererRapido, sin pasar por orjson
+        render_json, estandar = _cronometrar(lambda: JSONRenderer.render(renderer, datos), repeticiones)
+        render_orjson, rapido = _cronometrar(lambda: renderer.render(datos), repeticiones)
+        parseo_json, _ = _cronometrar(lambda: JSONParser().parse(io.BytesIO(estandar)), repeticiones)
+        parseo_orjson, _ = _cronometrar(lambda: parser.parse(io.BytesIO(estandar)), repeticiones)
+        self.stdout.write(
+            f'{nombre:<20} {len(estandar) / 1024:7.1f} KiB  '
+            f'render {render_json:7.2f} -> {render_orjson:6.2f} ms (x{render_json / render_orjson:4.1f})  '
+            f'parseo {parseo_json:7.2f} -> {parseo_orjson:6.2f} ms (x{parseo_json / parseo_orjson:4.1f})  '
+            f'idéntico: {"sí" if rapido == estandar else "no"}'
+        )
@@ -0,0 +1,58 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+
+from usuarios.hashers import EJECUTORES
+from usuarios.serializers import RegistroUsuarioSerializer
+
+
+class _Revertir(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide registros por segundo con RegistroUsuarioSerializer (validación, hash y "
+        "alta del usuario con su perfil) para cada algoritmo de PASSWORD_HASHERS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--registros', type=int, default=50)
+        parser.add_argument('--ejecutor', choices=['', *EJECUTORES], default=None,
+                            help="Por defecto, REGISTRO_HASH_EJECUTOR.")
+
+    def handle(self, *args, **options):
+        if options['registros'] < 1:
+            raise CommandError('--registros debe ser al menos 1.')
+        ejecutor = settings.REGISTRO_HASH_EJECUTOR if options['ejecutor'] is None else options['ejecutor']
+        for ruta in settings.PASSWORD_HASHERS:
+            with override_settings(PASSWORD_HASHERS=[ruta], REGISTRO_HASH_EJECUTOR=ejecutor):
+                segundos = self.medir(options['registros'])
+            nombre = ruta.rsplit('.', 1)[-1]
+            self.stdout.write(
+                f'{nombre:<30} {options["registros"] / segundos:8.1f} registros/s  '
+                f'{segundos * 1000 / options["registros"]:8.2f} ms/registro'
+            )
+
+    def medir(self, registros):
+        datos = [{
+            'username': f'medir_registro_{i}',
+            'email': f'medir_registro_{i}@ejemplo.com',
+            'password': 'Medir-Registro-2025',
+            'rol': 'candidato',
+            'perfil_candidato': {'telefono': '3000000000', 'ciudad': 'Bogotá'},
+        } for i in range(registros)]
+        try:
+            with transaction.atomic():
+                inicio = time.perf_counter()
+                for dato in datos:
+                    serializer = RegistroUsuarioSerializer(data=dato)
+                    serializer.is_valid(raise_exception=True)
+                    serializer.save()
+                transcurrido = time.perf_counter() - inicio
+                raise _Revertir
+        except _Revertir:
+            return transcurrido
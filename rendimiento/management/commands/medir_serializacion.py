@@ -0,0 +1,93 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from empleos.models import Vacante
+from empleos.serializers import VacanteListaSerializer, VacanteSerializer
+from jobconnect_api.eager_loading import optimizar
+from jobconnect_api.proyeccion import compilar
+from postulaciones.models import Postulacion
+from postulaciones.serializers import PostulacionSerializer
+from rendimiento.semillas import sembrar
+
+
+class _Revertir(Exception):
+    pass
+
+
+def _vacantes():
+    return Vacante.objects.order_by('-fecha_publicacion')
+
+
+# Nombre -> (queryset, clase de serializer) de cada representación a comparar
+VARIANTES = {
+    'vacantes_completa': lambda: (_vacantes(), VacanteSerializer),
+    'vacantes_lista': lambda: (VacanteListaSerializer.preparar(_vacantes()), VacanteListaSerializer),
+    'postulaciones': lambda: (Postulacion.objects.order_by('-fecha_postulacion'), PostulacionSerializer),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara consulta, serialización y tamaño en JSON de una página de filas "
+        "con cada representación de VARIANTES, con el serializer y con su plan "
+        "compilado a .values() (ver jobconnect_api/proyeccion.py)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--filas', type=int, default=100, help='Filas por página.')
+        parser.add_argument('--repeticiones', type=int, default=20)
+        parser.add_argument('--sembrar', action='store_true',
+                            help='Siembra datos de prueba dentro de una transacción que se revierte al terminar.')
+
+    def handle(self, *args, **options):
+        if options['filas'] < 1 or options['repeticiones'] < 1:
+            raise CommandError('--filas y --repeticiones deben ser al menos 1.')
+        try:
+            with transaction.atomic():
+                if options['sembrar']:
+                    sembrar(reclutadores=20, candidatos=200, vacantes=max(options['filas'], 500),
+                            postulaciones=max(options['filas'], 1000))
+                if not Vacante.objects.exists():
+                    raise CommandError('No hay vacantes: usa --sembrar o sembrar_datos.')
+                for nombre, variante in VARIANTES.items():
+                    queryset, clase = variante()
+                    serializer, datos = self.medir(queryset, clase, options['filas'], options['repeticiones'])
+                    self.stdout.write(f'{nombre:<26} {serializer}')
+                    plan = compilar(clase(many=True), queryset)
+                    if plan is None:
+                        self.stdout.write(f'{nombre + " (values)":<26} no se puede compilar')
+                        continue
+                    valores, datos_plan = self.medir_plan(queryset, plan, options['filas'], options['repeticiones'])
+                    identico = 'sí' if JSONRenderer().render(datos_plan) == JSONRenderer().render(datos) else 'no'
+                    self.stdout.write(f'{nombre + " (values)":<26} {valores}  idéntico: {identico}')
+                raise _Revertir
+        except _Revertir:
+            pass
+
+    def medir(self, queryset, clase, filas, repeticiones):
+        queryset = optimizar(queryset, clase(many=True))
+        return self.cronometrar(lambda: list(queryset[:filas]), lambda pagina: clase(pagina, many=True).data,
+                                repeticiones)
+
+    def medir_plan(self, queryset, plan, filas, repeticiones):
+        queryset = plan.proyectar(queryset)
+        return self.cronometrar(lambda: list(queryset[:filas]), plan.serializar, repeticiones)
+
+    def cronometrar(self, consultar, serializar, repeticiones):
+        consulta = serializacion = 0.0
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            pagina = consultar()
+            medio = time.perf_counter()
+            datos = serializar(pagina)
+            consulta += medio - inicio
+            serializacion += time.perf_counter() - medio
+        tamano = len(JSONRenderer().render(datos))
+        resumen = (
+            f'{consulta * 1000 / repeticiones:8.2f} ms consulta  '
+            f'{serializacion * 1000 / repeticiones:8.2f} ms serialización  {tamano / 1024:8.1f} KiB'
+        )
+        return resumen, datos
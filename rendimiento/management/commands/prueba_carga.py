@@ -0,0 +1,99 @@
+import asyncio
+import json
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+from rendimiento.carga import leer_respuesta, peticion_http, resumen_latencias
+from usuarios.authentication import TokenConRolSerializer
+from usuarios.models import Usuario
+
+
+async def cliente(host, puerto, peticion, fin, latencias, errores):
+    """Una conexión keep-alive que repite la petición hasta ``fin``."""
+    lector = escritor = None
+    while time.perf_counter() < fin:
+        try:
+            if escritor is None:
+                lector, escritor = await asyncio.open_connection(host, puerto)
+            inicio = time.perf_counter()
+            escritor.write(peticion)
+            estado, mantener = await leer_respuesta(lector)
+            latencias.append((time.perf_counter() - inicio) * 1000)
+            if estado >= 400:
+                errores.append(estado)
+            if not mantener:
+                escritor.close()
+                escritor = None
+        except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+            errores.append(type(exc).__name__)
+            if escritor is not None:
+                escritor.close()
+            escritor = None
+            await asyncio.sleep(0.01)
+    if escritor is not None:
+        escritor.close()
+
+
+async def medir(url, token, concurrencia, duracion):
+    partes = urlsplit(url)
+    ruta = partes.path + (f'?{partes.query}' if partes.query else '')
+    peticion = peticion_http('GET', ruta, partes.netloc, token)
+
+    latencias, errores = [], []
+    inicio = time.perf_counter()
+    fin = inicio + duracion
+    await asyncio.gather(*(
+        cliente(partes.hostname, partes.port or 80, peticion, fin, latencias, errores)
+        for _ in range(concurrencia)
+    ))
+    transcurrido = time.perf_counter() - inicio
+    return {
+        'url': url,
+        'concurrencia': concurrencia,
+        'peticiones': len(latencias),
+        'errores': len(errores),
+        'rps': round(len(latencias) / transcurrido, 1),
+        **resumen_latencias(latencias),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Prueba de carga contra un servidor en marcha: mide throughput y latencia "
+        "p50/p90/p99 de cada ruta con N conexiones concurrentes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help='Servidor a probar.')
+        parser.add_argument('--ruta', action='append', dest='rutas', required=True,
+                            help='Ruta a medir, p. ej. /api/async/vacantes/ (repetible).')
+        parser.add_argument('--concurrencia', type=int, default=200)
+        parser.add_argument('--duracion', type=float, default=10, help='Segundos por ruta.')
+        parser.add_argument('--usuario', help='Username con el que firmar el token de acceso.')
+        parser.add_argument('--json', dest='salida', help='Archivo donde guardar los resultados.')
+
+    def handle(self, *args, **options):
+        token = None
+        if options['usuario']:
+            usuario = Usuario.objects.filter(username=options['usuario']).first()
+            if usuario is None:
+                raise CommandError(f"No existe el usuario {options['usuario']}")
+            token = str(TokenConRolSerializer.get_token(usuario).access_token)
+
+        resultados = []
+        for ruta in options['rutas']:
+            resultado = asyncio.run(medir(
+                options['url'].rstrip('/') + ruta, token, options['concurrencia'], options['duracion'],
+            ))
+            resultados.append(resultado)
+            self.stdout.write(
+                f"{ruta:<36} {resultado['rps']:>8} req/s  p50 {resultado['p50_ms']:>8} ms  "
+                f"p90 {resultado['p90_ms']:>8} ms  p99 {resultado['p99_ms']:>8} ms  "
+                f"errores {resultado['errores']}"
+            )
+
+        if options['salida']:
+            with open(options['salida'], 'w', encoding='utf-8') as archivo:
+                json.dump(resultados, archivo, ensure_ascii=False, indent=2)
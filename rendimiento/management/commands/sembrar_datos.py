@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from rendimiento.semillas import sembrar
+
+
+class Command(BaseCommand):
+    help = "Crea un conjunto de datos realista (reclutadores, candidatos, vacantes y postulaciones)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reclutadores', type=int, default=200)
+        parser.add_argument('--candidatos', type=int, default=5000)
+        parser.add_argument('--vacantes', type=int, default=20000)
+        parser.add_argument('--postulaciones', type=int, default=100000)
+        parser.add_argument('--dias', type=int, default=365, help='Antigüedad máxima de las fechas generadas.')
+        parser.add_argument('--semilla', type=int, default=42)
+        parser.add_argument('--prefijo', default='semilla',
+                            help='Prefijo de los usernames; cámbialo para sembrar más de una vez.')
+
+    def handle(self, *args, **options):
+        resumen = sembrar(
+            reclutadores=options['reclutadores'], candidatos=options['candidatos'],
+            vacantes=options['vacantes'], postulaciones=options['postulaciones'],
+            semilla=options['semilla'], dias=options['dias'], prefijo=options['prefijo'],
+        )
+        self.stdout.write(self.style.SUCCESS(f'Datos sembrados: {resumen}'))
@@ -0,0 +1,157 @@
+"""
+Generación de datos de prueba realistas para medir rendimiento.
+
+``sembrar()`` crea reclutadores, candidatos, vacantes y postulaciones con
+``bulk_create`` y fechas repartidas en el tiempo, de modo que los planes de
+consulta y los benchmarks se parezcan a los de producción.
+"""
+import random
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from empleos import cache
+from empleos.models import Vacante
+from estadisticas.rollups import compactar
+from postulaciones.contadores import reconciliar
+from postulaciones.models import Postulacion
+from usuarios.models import PerfilCandidato, PerfilReclutador, Usuario
+
+CARGOS = [
+    'Desarrollador Backend', 'Desarrolladora Frontend', 'Ingeniero de Datos',
+    'Analista de Información', 'Diseñador UX', 'Administrador de Sistemas',
+    'Contador Público', 'Auxiliar Administrativo', 'Asesor Comercial',
+    'Coordinador de Logística', 'Enfermero Jefe', 'Docente de Matemáticas',
+    'Ingeniera DevOps', 'Científico de Datos', 'Analista QA',
+]
+NIVELES = ['Junior', 'Semi Senior', 'Senior', 'Líder', 'Practicante']
+HABILIDADES = [
+    'Python', 'Django', 'React', 'SQL', 'PostgreSQL', 'Docker', 'AWS',
+    'Excel avanzado', 'Power BI', 'atención al cliente', 'negociación',
+    'contabilidad', 'inglés B2', 'metodologías ágiles', 'Scrum', 'Figma',
+    'Linux', 'Kubernetes', 'JavaScript', 'pruebas automatizadas',
+]
+CIUDADES = ['Bogotá', 'Medellín', 'Cali', 'Barranquilla', 'Pasto', 'Bucaramanga', 'Remoto']
+CONTRATOS = ['Indefinido', 'Término fijo', 'Prestación de servicios', 'Práctica']
+EMPRESAS = ['Andina Tech', 'Café Digital', 'Logística del Sur', 'Salud Total', 'Finanzas Co', 'EduMás']
+ESTADOS = ['en revision'] * 6 + ['descartado'] * 3 + ['seleccionado']
+FORMACION = ['Ingeniería de Sistemas', 'Administración de Empresas', 'Contaduría', 'Diseño Gráfico', 'Enfermería']
+
+
+@contextmanager
+def fechas_manuales(*campos):
+    """Desactiva temporalmente ``auto_now_add``/``auto_now`` para fijar fechas."""
+    originales = [(c, c.auto_now_add, c.auto_now) for c in campos]
+    for campo in campos:
+        campo.auto_now_add = campo.auto_now = False
+    try:
+        yield
+    finally:
+        for campo, auto_now_add, auto_now in originales:
+            campo.auto_now_add, campo.auto_now = auto_now_add, auto_now
+
+
+def _texto(rng, minimo, maximo):
+    return ', '.join(rng.sample(HABILIDADES, rng.randint(minimo, maximo)))
+
+
+def _usuarios(rng, prefijo, rol, cantidad, lote):
+    password = make_password(None)
+    usuarios = [
+        Usuario(
+            username=f'{prefijo}_{i}',
+            email=f'{prefijo}_{i}@ejemplo.com',
+            first_name=rng.choice(['Ana', 'Luis', 'Camila', 'Andrés', 'Valentina', 'Julián']),
+            last_name=rng.choice(['Gómez', 'Rodríguez', 'Martínez', 'López', 'Díaz']),
+            rol=rol,
+            password=password,
+        )
+        for i in range(cantidad)
+    ]
+    return Usuario.objects.bulk_create(usuarios, batch_size=lote)
+
+
+@transaction.atomic
+def sembrar(reclutadores=20, candidatos=500, vacantes=1000, postulaciones=5000,
+            semilla=42, dias=365, prefijo='semilla', lote=1000):
+    """Crea el conjunto de datos y devuelve un resumen con los conteos."""
+    rng = random.Random(semilla)
+    ahora = timezone.now()
+
+    def fecha_aleatoria(desde=None):
+        inicio = desde or ahora - timedelta(days=dias)
+        return inicio + (ahora - inicio) * rng.random()
+
+    lista_reclutadores = _usuarios(rng, f'{prefijo}_reclutador', 'reclutador', reclutadores, lote)
+    PerfilReclutador.objects.bulk_create([
+        PerfilReclutador(
+            user=r, empresa=rng.choice(EMPRESAS), cargo='Talento Humano',
+            telefono=f'3{rng.randint(100000000, 999999999)}',
+            sitio_web=f'https://{r.username}.ejemplo.com',
+        )
+        for r in lista_reclutadores
+    ], batch_size=lote)
+
+    lista_candidatos = _usuarios(rng, f'{prefijo}_candidato', 'candidato', candidatos, lote)
+    PerfilCandidato.objects.bulk_create([
+        PerfilCandidato(
+            user=c, telefono=f'3{rng.randint(100000000, 999999999)}',
+            ciudad=rng.choice(CIUDADES),
+            experiencia=f'{rng.randint(0, 15)} años de experiencia en {_texto(rng, 1, 3)}',
+            formacion=rng.choice(FORMACION),
+            habilidades=_texto(rng, 2, 6),
+        )
+        for c in lista_candidatos
+    ], batch_size=lote)
+
+    campo_fecha_vacante = Vacante._meta.get_field('fecha_publicacion')
+    with fechas_manuales(campo_fecha_vacante):
+        lista_vacantes = Vacante.objects.bulk_create([
+            Vacante(
+                reclutador=rng.choice(lista_reclutadores),
+                titulo=f'{rng.choice(CARGOS)} {rng.choice(NIVELES)}',
+                descripcion=(
+                    f'Buscamos talento para unirse a nuestro equipo en {rng.choice(CIUDADES)}. '
+                    f'Trabajarás con {_texto(rng, 2, 4)} en proyectos de alto impacto.'
+                ),
+                requisitos=f'Experiencia mínima de {rng.randint(0, 5)} años. Conocimientos en {_texto(rng, 2, 5)}.',
+                ubicacion=rng.choice(CIUDADES),
+                tipo_contrato=rng.choice(CONTRATOS),
+                fecha_publicacion=fecha_aleatoria(),
+            )
+            for _ in range(vacantes)
+        ], batch_size=lote)
+
+    pares = set()
+    maximo = len(lista_candidatos) * len(lista_vacantes)
+    while len(pares) < min(postulaciones, maximo):
+        pares.add((rng.randrange(len(lista_candidatos)), rng.randrange(len(lista_vacantes))))
+
+    def postulacion(c, v):
+        estado = rng.choice(ESTADOS)
+        fecha = fecha_aleatoria(lista_vacantes[v].fecha_publicacion)
+        return Postulacion(
+            candidato=lista_candidatos[c],
+            vacante=lista_vacantes[v],
+            estado=estado,
+            fecha_postulacion=fecha,
+            fecha_decision=None if estado == 'en revision' else fecha_aleatoria(fecha),
+        )
+
+    campo_fecha_postulacion = Postulacion._meta.get_field('fecha_postulacion')
+    with fechas_manuales(campo_fecha_postulacion):
+        Postulacion.objects.bulk_create([postulacion(c, v) for c, v in sorted(pares)], batch_size=lote)
+
+    # bulk_create no emite señales ni pasa por las vistas que mantienen contadores y resúmenes
+    reconciliar(lote=lote)
+    compactar(timezone.localdate(ahora - timedelta(days=dias)), timezone.localdate(ahora))
+    cache.invalidar()
+    return {
+        'reclutadores': len(lista_reclutadores),
+        'candidatos': len(lista_candidatos),
+        'vacantes': len(lista_vacantes),
+        'postulaciones': len(pares),
+    }
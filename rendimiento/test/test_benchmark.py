@@ -0,0 +1,46 @@
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from usuarios.models import Usuario
+
+
+def ejecutar(tmp_path, *extra):
+    salida = tmp_path / "informe.json"
+    call_command(
+        "ejecutar_benchmark", "--sembrar", "--iteraciones", "2", "--muestra", "5",
+        "--reclutadores", "3", "--candidatos", "20", "--vacantes", "40", "--postulaciones", "150",
+        "--salida", str(salida), *extra,
+    )
+    return json.loads(salida.read_text(encoding="utf-8"))
+
+
+@pytest.mark.django_db
+def test_benchmark_en_proceso_informa_cada_endpoint(tmp_path):
+    informe = ejecutar(tmp_path)
+
+    assert informe["modo"] == "proceso"
+    assert informe["datos"]["vacantes"] == 40
+    assert set(informe["parametros"]["flujos"]) == {"busqueda_candidato", "registro_masivo", "triage_reclutador"}
+    for nombre in ("vacantes_busqueda", "postulaciones_recibidas", "estado_lote", "registro", "login"):
+        datos = informe["endpoints"][nombre]
+        assert datos["peticiones"] == 2
+        assert datos["errores"] == 0
+        assert datos["p99_ms"] >= datos["p50_ms"] > 0
+        assert datos["consultas_media"] >= 1
+    assert informe["total"]["rps"] > 0
+    # Semillas y registros se revierten al terminar
+    assert not Usuario.objects.exists()
+
+
+@pytest.mark.django_db
+def test_benchmark_detecta_regresiones(tmp_path):
+    base = ejecutar(tmp_path)
+    for datos in base["endpoints"].values():
+        datos["consultas_media"] -= 1
+    archivo = tmp_path / "base.json"
+    archivo.write_text(json.dumps(base), encoding="utf-8")
+
+    with pytest.raises(CommandError, match="regresión"):
+        ejecutar(tmp_path, "--comparar", str(archivo), "--umbral", "1000")
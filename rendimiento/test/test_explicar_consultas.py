@@ -0,0 +1,25 @@
+import pytest
+from django.core.management import call_command
+from empleos.models import Vacante
+from rendimiento.semillas import sembrar
+
+
+@pytest.mark.django_db
+def test_sembrar_crea_datos_consistentes():
+    resumen = sembrar(reclutadores=3, candidatos=10, vacantes=20, postulaciones=50)
+
+    assert resumen == {"reclutadores": 3, "candidatos": 10, "vacantes": 20, "postulaciones": 50}
+    assert Vacante.objects.values("fecha_publicacion").distinct().count() > 1
+
+
+@pytest.mark.django_db
+def test_consultas_registradas_usan_indices(capsys):
+    call_command(
+        "explicar_consultas", "--sembrar",
+        "--reclutadores", "50", "--candidatos", "500",
+        "--vacantes", "2000", "--postulaciones", "10000",
+    )
+
+    assert "Todas las consultas usan índices." in capsys.readouterr().out
+    # Los datos sembrados se revierten al terminar
+    assert not Vacante.objects.exists()
@@ -0,0 +1,116 @@
+import json
+import logging
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from empleos.models import Vacante
+from jobconnect_api.instrumentacion import Medicion, _actual, medir
+from postulaciones.models import Postulacion
+from usuarios.authentication import TokenConRolSerializer
+from usuarios.models import Usuario
+
+LOGGER = "jobconnect_api.instrumentacion"
+
+
+@pytest.fixture(autouse=True)
+def propagar(monkeypatch):
+    """``LOGGING`` no lo propaga a la raíz, que es donde escucha ``caplog``."""
+    monkeypatch.setattr(logging.getLogger(LOGGER), "propagate", True)
+
+
+@pytest.fixture
+def reclutador(db):
+    reclutador = Usuario.objects.create(username="reclu_medido", rol="reclutador")
+    vacante = Vacante.objects.create(titulo="Backend", descripcion="d", requisitos="r",
+                                     ubicacion="Zipaquirá", tipo_contrato="Indefinido", reclutador=reclutador)
+    for i in range(3):
+        candidato = Usuario.objects.create(username=f"candi_medido_{i}", rol="candidato")
+        Postulacion.objects.create(candidato=candidato, vacante=vacante)
+    return reclutador
+
+
+def cliente(usuario):
+    client = APIClient()
+    token = TokenConRolSerializer.get_token(usuario).access_token
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client
+
+
+def registros(caplog, nivel):
+    return [json.loads(r.getMessage()) for r in caplog.records if r.name == LOGGER and r.levelno == nivel]
+
+
+@pytest.mark.django_db
+def test_peticion_muestreada_emite_server_timing_y_log(reclutador, settings, caplog):
+    settings.INSTRUMENTACION_MUESTREO = 1
+    with caplog.at_level(logging.INFO, logger=LOGGER):
+        response = cliente(reclutador).get(reverse("postulaciones-recibidas"))
+
+    assert response.status_code == 200
+    fases = {parte.split(";")[0] for parte in response["Server-Timing"].split(", ")}
+    assert fases == {"db", "auth", "serializacion", "render", "total"}
+
+    [datos] = registros(caplog, logging.INFO)
+    assert datos["patron"] == "api/postulaciones-recibidas/"
+    assert datos["consultas"] >= 1 and datos["sql_ms"] > 0
+    assert datos["bytes"] == len(response.content)
+    assert f'desc="{datos["consultas"]} consultas"' in response["Server-Timing"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("nombre, serializa", [
+    ("postulaciones-lote", True),
+    ("mi-perfil", True),
+    ("estadisticas", False),  # sin serializer: la fase va en 0
+])
+def test_toda_vista_de_drf_registra_serializacion(reclutador, settings, caplog, nombre, serializa):
+    settings.INSTRUMENTACION_MUESTREO = 1
+    ids = ",".join(str(p.id) for p in Postulacion.objects.all())
+    with caplog.at_level(logging.INFO, logger=LOGGER):
+        response = cliente(reclutador).get(reverse(nombre), {"ids": ids} if nombre == "postulaciones-lote" else {})
+
+    assert response.status_code == 200
+    assert "serializacion;dur=" in response["Server-Timing"]
+    [registro] = registros(caplog, logging.INFO)
+    assert (registro["serializacion_ms"] > 0) is serializa
+
+
+def test_serializacion_anidada_se_cuenta_una_vez():
+    medicion = Medicion()
+    token = _actual.set(medicion)
+    try:
+        with medir("serializacion"):
+            with medir("serializacion"):
+                pass
+            externa = medicion.fases["serializacion"]
+    finally:
+        _actual.reset(token)
+
+    assert externa == 0
+    assert medicion.fases["serializacion"] > 0
+
+
+@pytest.mark.django_db
+def test_peticion_lenta_registra_el_sql_sin_parametros(reclutador, settings, caplog):
+    settings.INSTRUMENTACION_MUESTREO = 0
+    settings.INSTRUMENTACION_UMBRAL_LENTO_MS = 0
+    with caplog.at_level(logging.INFO, logger=LOGGER):
+        response = cliente(reclutador).get(reverse("vacante-list-async"), {"ubicacion": "Zipaquirá"})
+
+    assert "Server-Timing" in response
+    [datos] = registros(caplog, logging.WARNING)
+    assert datos["sql_lentas"]
+    assert any("%s" in c["sql"] for c in datos["sql_lentas"])
+    assert "Zipaquirá" not in json.dumps(datos, ensure_ascii=False)
+
+
+@pytest.mark.django_db
+def test_fuera_de_la_muestra_no_emite_nada(reclutador, settings, caplog):
+    settings.INSTRUMENTACION_MUESTREO = 0
+    with caplog.at_level(logging.INFO, logger=LOGGER):
+        response = cliente(reclutador).get(reverse("postulaciones-recibidas"))
+
+    assert "Server-Timing" not in response
+    assert not registros(caplog, logging.INFO) + registros(caplog, logging.WARNING)
@@ -0,0 +1,89 @@
+import datetime
+import io
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIClient
+
+from empleos.models import Vacante
+from jobconnect_api.json_rapido import JSONParserRapido, JSONRendererRapido
+from usuarios.models import Usuario
+
+pytest.importorskip("orjson")
+
+DATOS = {
+    "salario": Decimal("2500000.50"),
+    "creada": datetime.datetime(2025, 3, 1, 15, 30, 0, 123456, tzinfo=datetime.timezone.utc),
+    "local": datetime.datetime(2025, 3, 1, 10, 30),
+    "dia": datetime.date(2025, 3, 1),
+    "mensaje": gettext_lazy("Postulación recibida"),
+    "texto": "línea\u2028otra",
+    7: ["a", 1.25, None, True],
+}
+
+
+def render(settings, rapido, datos, **kwargs):
+    settings.JSON_RAPIDO = rapido
+    return JSONRendererRapido().render(datos, **kwargs)
+
+
+def test_orjson_escribe_lo_mismo_que_json_estandar(settings):
+    rapido = render(settings, True, DATOS)
+
+    assert rapido == render(settings, False, DATOS)
+    assert b'"creada":"2025-03-01T10:30:00.123456-05:00"' in rapido
+    assert b'"salario":2500000.5' in rapido
+    assert '"mensaje":"Postulación recibida"'.encode() in rapido
+    assert b'l\xc3\xadnea\\u2028otra' in rapido
+    assert b'"7":["a",1.25,null,true]' in rapido
+
+
+def test_vuelve_al_json_estandar_con_indent_o_datos_que_orjson_rechaza(settings):
+    enorme = {"id": 2 ** 70}
+
+    assert render(settings, True, enorme) == b'{"id":1180591620717411303424}'
+    assert render(settings, True, {"id": 1}, accepted_media_type="application/json; indent=2") == b'{\n  "id": 1\n}'
+
+
+def test_parser_lee_con_orjson_y_conserva_los_errores_de_drf(settings):
+    settings.JSON_RAPIDO = True
+    parser = JSONParserRapido()
+
+    assert parser.parse(io.BytesIO('{"ciudad": "Bogotá", "n": [1, 2.5]}'.encode())) == {"ciudad": "Bogotá", "n": [1, 2.5]}
+    assert parser.parse(io.BytesIO(b'{"id": 1180591620717411303424}')) == {"id": 2 ** 70}
+    with pytest.raises(ParseError, match="JSON parse error"):
+        parser.parse(io.BytesIO(b'{"id": NaN}'))
+
+
+@pytest.mark.django_db
+def test_api_responde_igual_con_y_sin_orjson(settings):
+    settings.VACANTES_CACHE_ACTIVA = False
+    reclutador = Usuario.objects.create(username="reclu_json", rol="reclutador")
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+    creada = client.post(reverse("vacante-list"), {
+        "titulo": "Backend", "descripcion": "APIs — Django", "requisitos": "Python",
+        "tipo_contrato": "Indefinido", "ubicacion": "Medellín",
+    }, format="json")
+    assert creada.status_code == 201
+
+    respuestas = []
+    for rapido in (True, False):
+        settings.JSON_RAPIDO = rapido
+        respuestas.append(client.get(reverse("vacante-detail", args=[Vacante.objects.get().id])).content)
+
+    assert respuestas[0] == respuestas[1]
+
+
+@pytest.mark.django_db
+def test_medir_json_compara_las_dos_rutas(capsys):
+    call_command("medir_json", "--sembrar", "--filas", "5", "--repeticiones", "1")
+
+    lineas = capsys.readouterr().out.splitlines()
+    assert [linea.split()[0] for linea in lineas] == ["vacantes_completa", "vacantes_lista", "postulaciones"]
+    assert all(linea.endswith("idéntico: sí") for linea in lineas)
+    assert not Vacante.objects.exists()
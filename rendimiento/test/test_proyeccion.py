@@ -0,0 +1,173 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from empleos.models import Vacante
+from jobconnect_api import proyeccion
+from postulaciones.models import Postulacion
+from postulaciones.serializers import PostulacionSerializer
+from usuarios.models import PerfilCandidato, PerfilReclutador, Usuario
+
+
+@pytest.fixture
+def datos(db, settings):
+    settings.VACANTES_CACHE_ACTIVA = False
+    con_perfil = Usuario.objects.create(username="reclu_values", first_name="Ana", email="ana@x.co", rol="reclutador")
+    PerfilReclutador.objects.create(user=con_perfil, empresa="Empresa V", cargo="CTO", telefono="1",
+                                    sitio_web="https://v.co")
+    sin_perfil = Usuario.objects.create(username="reclu_sin_perfil", rol="reclutador")
+    vacantes = [
+        Vacante.objects.create(titulo=f"Backend {i}", descripcion="Diseñar APIs REST, " * (3 + 10 * i),
+                               requisitos="Python", ubicacion="Cali" if i % 2 else None,
+                               tipo_contrato="Indefinido", reclutador=con_perfil if i < 3 else sin_perfil)
+        for i in range(4)
+    ]
+    candidatos = []
+    for i in range(3):
+        candidato = Usuario.objects.create(username=f"cand_values_{i}", first_name=f"Cand {i}", rol="candidato")
+        if i != 1:
+            PerfilCandidato.objects.create(user=candidato, telefono="300", ciudad="Pasto", experiencia=None)
+        candidatos.append(candidato)
+    for i, vacante in enumerate(vacantes):
+        for j, candidato in enumerate(candidatos):
+            estado = ("en revision", "descartado", "seleccionado")[(i + j) % 3]
+            Postulacion.objects.create(
+                candidato=candidato, vacante=vacante, estado=estado,
+                fecha_decision=None if estado == "en revision" else timezone.now() - timedelta(days=i),
+            )
+    return con_perfil, candidatos[0]
+
+
+def cliente(usuario=None):
+    client = APIClient()
+    if usuario is not None:
+        client.force_authenticate(user=usuario)
+    return client
+
+
+def comparar(settings, monkeypatch, client, url, params=None):
+    """Pide ``url`` con y sin la proyección y exige la misma respuesta byte a byte."""
+    compilados = []
+    serializar = proyeccion.Plan.serializar
+
+    def espiar(plan, filas):
+        compilados.append(plan)
+        return serializar(plan, filas)
+    monkeypatch.setattr(proyeccion.Plan, "serializar", espiar)
+
+    respuestas = []
+    for rapida in (True, False):
+        settings.SERIALIZACION_RAPIDA = rapida
+        respuestas.append(client.get(url, params or {}))
+
+    rapida, lenta = respuestas
+    assert rapida.status_code == lenta.status_code == 200
+    assert rapida.content == lenta.content
+    assert rapida["ETag"] == lenta["ETag"]
+    assert len(compilados) == 1, "el listado no usó el plan compilado"
+    return rapida.json()
+
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"page": 2, "page_size": 2},
+    {"paginacion": "cursor", "page_size": 3},
+    {"ordering": "titulo"},
+    {"search": "Backend"},
+    {"ubicacion": "Cali"},
+    {"fields": "id,titulo,resumen,reclutador.email", "expand": "reclutador"},
+    {"expand": "reclutador"},
+])
+def test_listado_de_vacantes_identico(datos, settings, monkeypatch, params):
+    comparar(settings, monkeypatch, cliente(), reverse("vacante-list"), params)
+
+
+def test_listado_async_de_vacantes_identico(datos, settings, monkeypatch):
+    cuerpo = comparar(settings, monkeypatch, cliente(), reverse("vacante-list-async"))
+
+    assert {v["empresa"] for v in cuerpo["results"]} == {"Empresa V", None}
+
+
+@pytest.mark.parametrize("nombre, params", [
+    ("postulaciones-list", {}),
+    ("postulaciones-list", {"estado": "descartado", "expand": "candidato"}),
+    ("postulaciones-recibidas", {}),
+    ("postulaciones-recibidas", {"paginacion": "cursor", "page_size": 5}),
+    ("postulaciones-recibidas", {"fields": "id,perfil_candidato.ciudad,vacante.reclutador.perfil_reclutador"}),
+])
+def test_postulaciones_del_reclutador_identicas(datos, settings, monkeypatch, nombre, params):
+    reclutador, _ = datos
+
+    cuerpo = comparar(settings, monkeypatch, cliente(reclutador), reverse(nombre), params)
+
+    assert cuerpo["results"]
+
+
+def test_postulaciones_por_vacante_con_candidato_sin_perfil(datos, settings, monkeypatch):
+    reclutador, _ = datos
+    vacante = reclutador.vacantes.order_by("id").first()
+
+    cuerpo = comparar(settings, monkeypatch, cliente(reclutador), reverse("postulaciones-por-vacante"),
+                      {"vacante": vacante.id})
+
+    assert None in [p["perfil_candidato"] for p in cuerpo["results"]]
+
+
+@pytest.mark.parametrize("nombre", ["mis-postulaciones", "mis-postulaciones-async"])
+def test_mis_postulaciones_identicas(datos, settings, monkeypatch, nombre):
+    _, candidato = datos
+
+    cuerpo = comparar(settings, monkeypatch, cliente(candidato), reverse(nombre))
+
+    assert {p["vacante"]["reclutador"]["perfil_reclutador"] is None for p in cuerpo["results"]} == {True, False}
+
+
+def test_plan_se_compila_una_vez_por_serializer(db):
+    queryset = Postulacion.objects.all()
+
+    plan = proyeccion.compilar(PostulacionSerializer(many=True), queryset)
+
+    assert plan is proyeccion.compilar(PostulacionSerializer(many=True), queryset)
+    assert "candidato__perfil_candidato__id" in plan.rutas
+    assert "vacante__reclutador__perfil_reclutador__empresa" in plan.rutas
+
+
+class ConMetodo(serializers.ModelSerializer):
+    etiqueta = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Postulacion
+        fields = ["id", "etiqueta"]
+
+    def get_etiqueta(self, obj):
+        return obj.estado.upper()
+
+
+class ConPropiedad(serializers.ModelSerializer):
+    nombre = serializers.CharField(source="candidato.get_full_name")
+
+    class Meta:
+        model = Postulacion
+        fields = ["id", "nombre"]
+
+
+@pytest.mark.parametrize("clase", [ConMetodo, ConPropiedad])
+def test_lo_que_no_se_puede_reproducir_usa_el_serializer(db, clase):
+    assert proyeccion.compilar(clase(many=True), Postulacion.objects.all()) is None
+    precargado = Postulacion.objects.prefetch_related("vacante")
+    assert proyeccion.compilar(PostulacionSerializer(many=True), precargado) is None
+
+
+@pytest.mark.parametrize("zona", ["UTC", "America/Bogota"])
+def test_fechas_en_la_zona_actual(datos, settings, monkeypatch, zona):
+    reclutador, _ = datos
+
+    with timezone.override(zona):
+        cuerpo = comparar(settings, monkeypatch, cliente(reclutador), reverse("postulaciones-recibidas"))
+
+    fecha = cuerpo["results"][0]["fecha_postulacion"]
+    assert fecha.endswith("Z") if zona == "UTC" else fecha.endswith("-05:00")
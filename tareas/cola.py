@@ -0,0 +1,157 @@
+"""
+Cola de tareas en la base de datos, sin broker externo.
+
+Las vistas encolan con ``encolar(nueva(...))``, que inserta las filas cuando
+se confirma la transacción en curso; el trabajo lento (correos, webhooks) lo
+hace ``manage.py procesar_tareas`` fuera del ciclo de la petición.
+
+- Las funciones se registran con ``@tarea('app.nombre')`` en ``<app>/tareas.py``.
+- ``agrupable=True``: las tareas con la misma ``clave`` (p. ej. el
+  destinatario) esperan ``ventana`` segundos y se ejecutan juntas; la función
+  recibe la lista de argumentos del lote.
+- Un trabajador reserva las tareas con un ``UPDATE ... WHERE estado =
+  'pendiente'``, así dos trabajadores nunca toman la misma. Si muere, la
+  reserva vence a los ``TAREAS_DURACION_RESERVA`` segundos y otro la retoma.
+- Un fallo reprograma la tarea con espera exponencial hasta ``max_intentos``;
+  después queda ``fallida`` con el último error.
+"""
+import logging
+import random
+import traceback
+import uuid
+from collections import namedtuple
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Tarea
+
+logger = logging.getLogger(__name__)
+
+Definicion = namedtuple('Definicion', 'funcion agrupable max_intentos ventana')
+REGISTRO = {}
+
+
+def tarea(nombre, agrupable=False, max_intentos=5, ventana=None):
+    """Registra una función como tarea; ``ventana`` en segundos, solo para las agrupables."""
+    def decorador(funcion):
+        REGISTRO[nombre] = Definicion(funcion, agrupable, max_intentos, ventana)
+        return funcion
+    return decorador
+
+
+def _ajuste(nombre, defecto):
+    return getattr(settings, nombre, defecto)
+
+
+def nueva(nombre, clave='', **argumentos):
+    """
+    ``Tarea`` sin guardar, lista para ``encolar``. ``clave`` puede ser una
+    expresión (p. ej. una ``Subquery``), que se resuelve al insertar.
+    """
+    definicion = REGISTRO[nombre]
+    retraso = 0
+    if definicion.agrupable:
+        retraso = definicion.ventana if definicion.ventana is not None else _ajuste('TAREAS_VENTANA_AGRUPACION', 60)
+    return Tarea(
+        nombre=nombre, argumentos=argumentos,
+        clave=clave if hasattr(clave, 'resolve_expression') else str(clave),
+        ejecutar_desde=timezone.now() + timedelta(seconds=retraso),
+    )
+
+
+def encolar(*tareas, using=None):
+    """Inserta las tareas cuando se confirma la transacción; si se revierte, no se encolan."""
+    if tareas:
+        transaction.on_commit(lambda: Tarea.objects.using(using).bulk_create(tareas), using=using)
+
+
+def espera(intentos):
+    """Segundos hasta el siguiente intento: exponencial con un 10 % de variación."""
+    base = _ajuste('TAREAS_BACKOFF_BASE', 30) * 2 ** max(intentos - 1, 0)
+    return min(base, _ajuste('TAREAS_BACKOFF_MAXIMO', 3600)) * random.uniform(0.9, 1.1)
+
+
+def reclamar(limite, trabajador, ahora=None):
+    """Reserva hasta ``limite`` tareas vencidas (más el resto de sus lotes) y las devuelve."""
+    ahora = ahora or timezone.now()
+    disponible = Q(estado=Tarea.PENDIENTE) | Q(estado=Tarea.EN_CURSO, reservada_hasta__lt=ahora)
+    vencidas = list(
+        Tarea.objects.filter(
+            Q(estado=Tarea.PENDIENTE, ejecutar_desde__lte=ahora)
+            | Q(estado=Tarea.EN_CURSO, reservada_hasta__lt=ahora)
+        ).order_by('ejecutar_desde').values_list('id', 'nombre', 'clave')[:limite]
+    )
+    if not vencidas:
+        return []
+    ids = {i for i, _, _ in vencidas}
+    # Lo pendiente del mismo destinatario sale en el mismo lote aunque su ventana no haya vencido
+    lotes = {(n, c) for _, n, c in vencidas if c and getattr(REGISTRO.get(n), 'agrupable', False)}
+    if lotes:
+        mismo_lote = reduce(or_, (Q(nombre=n, clave=c) for n, c in lotes))
+        ids.update(Tarea.objects.filter(mismo_lote, estado=Tarea.PENDIENTE).values_list('id', flat=True))
+
+    reserva = timedelta(seconds=_ajuste('TAREAS_DURACION_RESERVA', 300))
+    Tarea.objects.filter(disponible, id__in=ids).update(
+        estado=Tarea.EN_CURSO, trabajador=trabajador, reservada_hasta=ahora + reserva,
+        intentos=F('intentos') + 1, fecha_actualizacion=ahora,
+    )
+    return list(Tarea.objects.filter(id__in=ids, estado=Tarea.EN_CURSO, trabajador=trabajador).order_by('id'))
+
+
+def ejecutar(tareas, trabajador):
+    """Ejecuta las tareas reservadas, una llamada por tarea o por lote."""
+    grupos = {}
+    for t in tareas:
+        definicion = REGISTRO.get(t.nombre)
+        llave = (t.nombre, t.clave) if definicion and definicion.agrupable else (t.nombre, t.pk)
+        grupos.setdefault(llave, []).append(t)
+
+    for (nombre, _), grupo in grupos.items():
+        definicion = REGISTRO.get(nombre)
+        try:
+            if definicion is None:
+                raise LookupError(f"Tarea no registrada: {nombre}")
+            with transaction.atomic():
+                if definicion.agrupable:
+                    definicion.funcion([t.argumentos for t in grupo])
+                else:
+                    definicion.funcion(**grupo[0].argumentos)
+        except Exception:
+            logger.exception("Falló la tarea %s (%s)", nombre, [t.pk for t in grupo])
+            fallar(grupo, traceback.format_exc(), definicion)
+        else:
+            Tarea.objects.filter(id__in=[t.pk for t in grupo], trabajador=trabajador).update(
+                estado=Tarea.COMPLETADA, reservada_hasta=None, ultimo_error='', fecha_actualizacion=timezone.now(),
+            )
+
+
+def fallar(grupo, error, definicion):
+    ahora = timezone.now()
+    for t in grupo:
+        if definicion is None or t.intentos >= definicion.max_intentos:
+            cambios = {'estado': Tarea.FALLIDA}
+        else:
+            cambios = {'estado': Tarea.PENDIENTE, 'ejecutar_desde': ahora + timedelta(seconds=espera(t.intentos))}
+        Tarea.objects.filter(pk=t.pk, trabajador=t.trabajador).update(
+            reservada_hasta=None, ultimo_error=error[-4000:], fecha_actualizacion=ahora, **cambios,
+        )
+
+
+def procesar(limite=50):
+    """Una pasada del trabajador; devuelve cuántas tareas ejecutó."""
+    trabajador = uuid.uuid4().hex
+    tareas = reclamar(limite, trabajador)
+    ejecutar(tareas, trabajador)
+    return len(tareas)
+
+
+def purgar(dias):
+    """Borra las tareas completadas hace más de ``dias`` días."""
+    limite = timezone.now() - timedelta(days=dias)
+    return Tarea.objects.filter(estado=Tarea.COMPLETADA, fecha_actualizacion__lt=limite).delete()[0]
@@ -0,0 +1,46 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from tareas.cola import procesar, purgar
+
+
+class Command(BaseCommand):
+    help = "Trabajador de la cola de tareas: ejecuta las tareas pendientes hasta recibir SIGINT/SIGTERM."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--una-vez', action='store_true',
+                            help='Vacía la cola de tareas vencidas y termina.')
+        parser.add_argument('--lote', type=int, default=50, help='Tareas reservadas por pasada.')
+        parser.add_argument('--espera', type=float, default=1.0,
+                            help='Segundos entre consultas cuando la cola está vacía.')
+        parser.add_argument('--purgar-dias', type=int,
+                            help='Antes de empezar, borra las tareas completadas hace más de N días.')
+
+    def handle(self, *args, **options):
+        if options['purgar_dias'] is not None:
+            self.stdout.write(f"Tareas purgadas: {purgar(options['purgar_dias'])}")
+
+        self.detener = False
+        if not options['una_vez']:
+            for senal in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(senal, self.pedir_parada)
+
+        total = 0
+        while not self.detener:
+            # Dentro de una transacción ajena (call_command en un test) la conexión no se recicla
+            if not connection.in_atomic_block:
+                close_old_connections()
+            ejecutadas = procesar(options['lote'])
+            total += ejecutadas
+            if not ejecutadas:
+                if options['una_vez']:
+                    break
+                time.sleep(options['espera'])
+        self.stdout.write(f"Tareas ejecutadas: {total}")
+
+    def pedir_parada(self, *args):
+        # Termina la pasada en curso antes de salir
+        self.detener = True
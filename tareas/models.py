@@ -0,0 +1,44 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Tarea(models.Model):
+    """
+    Trabajo pendiente para ``manage.py procesar_tareas``. ``clave`` agrupa las
+    tareas del mismo destinatario para entregarlas en un solo lote.
+    """
+    PENDIENTE = 'pendiente'
+    EN_CURSO = 'en_curso'
+    COMPLETADA = 'completada'
+    FALLIDA = 'fallida'
+    ESTADOS = [
+        (PENDIENTE, 'Pendiente'),
+        (EN_CURSO, 'En curso'),
+        (COMPLETADA, 'Completada'),
+        (FALLIDA, 'Fallida'),
+    ]
+
+    nombre = models.CharField(max_length=100)
+    argumentos = models.JSONField(default=dict)
+    clave = models.CharField(max_length=100, blank=True, default='')
+    estado = models.CharField(max_length=20, choices=ESTADOS, default=PENDIENTE)
+    intentos = models.PositiveSmallIntegerField(default=0)
+    ejecutar_desde = models.DateTimeField(default=timezone.now)
+    # Reserva del trabajador que la tomó; vencida, otro trabajador puede retomarla
+    trabajador = models.CharField(max_length=36, blank=True, default='')
+    reservada_hasta = models.DateTimeField(null=True, blank=True)
+    ultimo_error = models.TextField(blank=True, default='')
+    fecha_creacion = models.DateTimeField(auto_now_add=True)
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Próximas tareas por ejecutar y reservas vencidas
+            models.Index(fields=['estado', 'ejecutar_desde'], name='tarea_pendiente_idx'),
+            models.Index(fields=['estado', 'reservada_hasta'], name='tarea_reserva_idx'),
+            # Resto del lote de un destinatario
+            models.Index(fields=['nombre', 'clave', 'estado'], name='tarea_lote_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.nombre} #{self.pk} ({self.estado})"
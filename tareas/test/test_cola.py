@@ -0,0 +1,152 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from empleos.models import Vacante
+from postulaciones.models import Postulacion
+from tareas import cola
+from tareas.models import Tarea
+from usuarios.models import Usuario
+
+llamadas = []
+
+
+@cola.tarea('pruebas.fallar_dos_veces', max_intentos=3)
+def fallar_dos_veces(valor):
+    llamadas.append(valor)
+    if len(llamadas) <= 2:
+        raise RuntimeError("destino caído")
+
+
+@cola.tarea('pruebas.fallar_siempre', max_intentos=2)
+def fallar_siempre():
+    raise RuntimeError("sin remedio")
+
+
+@pytest.fixture(autouse=True)
+def sin_llamadas():
+    llamadas.clear()
+
+
+def vencer_todo():
+    Tarea.objects.update(ejecutar_desde=timezone.now() - timedelta(seconds=1))
+
+
+@pytest.fixture
+def escenario(db):
+    reclutador = Usuario.objects.create(username="reclu_tareas", email="reclu@test.com", rol="reclutador")
+    candidato = Usuario.objects.create(username="candi_tareas", email="candi@test.com", rol="candidato")
+    vacantes = [
+        Vacante.objects.create(titulo=f"Vacante {i}", descripcion="d", requisitos="r",
+                               tipo_contrato="Indefinido", reclutador=reclutador)
+        for i in range(3)
+    ]
+    return reclutador, candidato, vacantes
+
+
+@pytest.mark.django_db
+def test_encola_al_confirmar_y_no_si_se_revierte(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        cola.encolar(cola.nueva('pruebas.fallar_dos_veces', valor=1))
+    assert Tarea.objects.count() == 1
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            cola.encolar(cola.nueva('pruebas.fallar_dos_veces', valor=2))
+            raise RuntimeError
+    assert Tarea.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_reintenta_con_espera_exponencial(django_capture_on_commit_callbacks, settings):
+    settings.TAREAS_BACKOFF_BASE = 10
+    with django_capture_on_commit_callbacks(execute=True):
+        cola.encolar(cola.nueva('pruebas.fallar_dos_veces', valor=7))
+
+    esperas = []
+    for _ in range(3):
+        antes = timezone.now()
+        assert cola.procesar() == 1
+        tarea = Tarea.objects.get()
+        if tarea.estado == Tarea.PENDIENTE:
+            esperas.append((tarea.ejecutar_desde - antes).total_seconds())
+            vencer_todo()
+
+    assert tarea.estado == Tarea.COMPLETADA
+    assert tarea.intentos == 3
+    assert llamadas == [7, 7, 7]
+    assert 9 <= esperas[0] <= 11.5 and 18 <= esperas[1] <= 22.5
+
+
+@pytest.mark.django_db
+def test_agota_los_intentos_y_queda_fallida(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        cola.encolar(cola.nueva('pruebas.fallar_siempre'))
+    cola.procesar()
+    vencer_todo()
+    cola.procesar()
+
+    tarea = Tarea.objects.get()
+    assert tarea.estado == Tarea.FALLIDA
+    assert "sin remedio" in tarea.ultimo_error
+    assert cola.procesar() == 0
+
+
+@pytest.mark.django_db
+def test_una_reserva_vencida_se_retoma(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        cola.encolar(cola.nueva('pruebas.fallar_siempre'))
+    assert len(cola.reclamar(10, 'caido')) == 1
+    assert cola.reclamar(10, 'otro') == []
+
+    despues = timezone.now() + timedelta(hours=1)
+    assert [t.trabajador for t in cola.reclamar(10, 'otro', ahora=despues)] == ['otro']
+
+
+@pytest.mark.django_db
+def test_cambios_de_estado_llegan_en_un_solo_correo(escenario, django_capture_on_commit_callbacks):
+    reclutador, candidato, vacantes = escenario
+    postulaciones = [Postulacion.objects.create(candidato=candidato, vacante=v) for v in vacantes]
+    client = APIClient()
+    client.force_authenticate(user=reclutador)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        client.patch(reverse("postulaciones-detail", args=[postulaciones[0].id]), {"estado": "seleccionado"})
+        client.post(reverse("postulaciones-estado-lote"),
+                    {"ids": [p.id for p in postulaciones[1:]], "estado": "descartado"}, format="json")
+
+    # La petición solo encola: la entrega la hace el trabajador
+    assert Tarea.objects.filter(clave=str(candidato.id)).count() == 3
+    assert mail.outbox == []
+
+    vencer_todo()
+    call_command("procesar_tareas", "--una-vez")
+
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].to == ["candi@test.com"]
+    assert "Vacante 0: Seleccionado" in mail.outbox[0].body
+    assert "Vacante 2: Descartado" in mail.outbox[0].body
+    assert not Tarea.objects.exclude(estado=Tarea.COMPLETADA).exists()
+
+
+@pytest.mark.django_db
+def test_postulacion_nueva_avisa_al_reclutador(escenario, django_capture_on_commit_callbacks):
+    reclutador, candidato, vacantes = escenario
+    client = APIClient()
+    client.force_authenticate(user=candidato)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        for vacante in vacantes[:2]:
+            client.post(reverse("postulaciones-list"), {"vacante": vacante.id})
+
+    vencer_todo()
+    assert cola.procesar() == 2
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].to == ["reclu@test.com"]
+    assert "Recibiste 2 postulación(es)" in mail.outbox[0].body
@@ -0,0 +1,161 @@
+"""
+Autenticación JWT con el usuario en caché.
+
+``JWTAuthentication`` de simplejwt busca el ``Usuario`` en cada petición.
+``CachedJWTAuthentication`` guarda los campos del usuario (sin la contraseña)
+y el id de su perfil durante ``AUTH_USUARIO_CACHE_TIMEOUT`` segundos, así una
+petición con la caché caliente no consulta la base de datos. En un fallo se
+lee todo en una sola consulta, incluido el perfil.
+
+Las señales de ``usuarios/signals.py`` borran la entrada cuando se guarda o
+elimina el usuario o su perfil (desactivarlo es un ``save()``). Los
+``QuerySet.update()`` no emiten señales: quien los use sobre ``Usuario`` debe
+llamar a ``revocar()``. Con varios procesos la caché tiene que ser compartida
+(``CACHE_BACKEND``), si no un proceso seguiría viendo un usuario desactivado
+hasta que expire su copia. Por lo mismo, con réplicas el fallo de caché se lee
+siempre de la principal.
+
+El token de acceso lleva además los claims ``rol`` y ``perfil_id`` para que
+el frontend no tenga que pedir ``/perfil-usuario/`` al iniciar sesión; el
+servidor no confía en ellos para autorizar.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import F
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from jobconnect_api.instrumentacion import medir
+from jobconnect_api.replicas import aidentificar, identificar
+
+from .models import Usuario
+
+PREFIJO = 'usuarios:auth'
+
+
+def _cache():
+    return caches[getattr(settings, 'AUTH_USUARIO_CACHE_ALIAS', 'default')]
+
+
+def _timeout():
+    return getattr(settings, 'AUTH_USUARIO_CACHE_TIMEOUT', 60)
+
+
+def clave(user_id):
+    return f'{PREFIJO}:{user_id}'
+
+
+def revocar(*ids):
+    _cache().delete_many([clave(pk) for pk in ids])
+
+
+def perfil_id(user):
+    """Id del perfil del rol del usuario, o None si aún no lo tiene."""
+    if hasattr(user, 'perfil_id'):
+        return user.perfil_id
+    relacion = {'candidato': 'perfil_candidato', 'reclutador': 'perfil_reclutador'}.get(user.rol)
+    perfil = getattr(user, relacion, None) if relacion else None
+    return perfil.pk if perfil else None
+
+
+# Todo menos la contraseña, que queda diferida y solo se lee si alguien la pide
+CAMPOS = [f.attname for f in Usuario._meta.concrete_fields if f.attname != 'password']
+
+
+def _consulta(user_id):
+    # De la principal: una réplica atrasada dejaría en caché un usuario ya desactivado
+    return Usuario.objects.using(DEFAULT_DB_ALIAS).filter(pk=user_id).values(
+        *CAMPOS, candidato=F('perfil_candidato__id'), reclutador=F('perfil_reclutador__id'),
+    )
+
+
+def _entrada(fila):
+    if fila is None:
+        return None
+    return {
+        'campos': [fila[c] for c in CAMPOS],
+        'perfil_id': fila['candidato'] if fila['rol'] == 'candidato' else fila['reclutador'],
+    }
+
+
+def _construir(entrada):
+    user = Usuario.from_db(Usuario.objects.db, CAMPOS, entrada['campos'])
+    user.perfil_id = entrada['perfil_id']
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        with medir('auth'):
+            return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        user_id = self._user_id(validated_token)
+        identificar(user_id)
+        # La revocación por cambio de contraseña necesita el hash en cada petición
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        cache = _cache()
+        entrada = cache.get(clave(user_id))
+        if entrada is None:
+            entrada = _entrada(_consulta(user_id).first())
+            if entrada is not None:
+                cache.set(clave(user_id), entrada, timeout=_timeout())
+        return self._usuario(entrada)
+
+    async def aauthenticate(self, request):
+        """Versión de ``authenticate`` para las vistas asíncronas (ver ``jobconnect_api/asincrono.py``)."""
+        with medir('auth'):
+            header = self.get_header(request)
+            if header is None:
+                return None
+            raw_token = self.get_raw_token(header)
+            if raw_token is None:
+                return None
+            validated_token = self.get_validated_token(raw_token)
+            return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        user_id = self._user_id(validated_token)
+        await aidentificar(user_id)
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return await sync_to_async(super().get_user)(validated_token)
+
+        cache = _cache()
+        entrada = await cache.aget(clave(user_id))
+        if entrada is None:
+            entrada = _entrada(await _consulta(user_id).afirst())
+            if entrada is not None:
+                await cache.aset(clave(user_id), entrada, timeout=_timeout())
+        return self._usuario(entrada)
+
+    @staticmethod
+    def _user_id(validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+    @staticmethod
+    def _usuario(entrada):
+        if entrada is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        user = _construir(entrada)
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+
+class TokenConRolSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['rol'] = user.rol
+        token['perfil_id'] = perfil_id(user)
+        return token
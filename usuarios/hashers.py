@@ -0,0 +1,67 @@
+"""
+Hash de contraseñas para el registro.
+
+``PASSWORD_HASHERS`` (ver ``settings.py``) pone primero el algoritmo de
+``PASSWORD_HASHER``: ``argon2`` si está instalado ``argon2-cffi``, si no
+``scrypt``. Los demás quedan detrás para verificar los hashes existentes, que
+Django rehace con el primero cuando el usuario inicia sesión.
+
+Argon2 usa los parámetros mínimos de OWASP para almacenar contraseñas
+(argon2id, 19 MiB, dos pasadas, un hilo) en lugar de los de Django (100 MiB y
+8 hilos): da la misma resistencia frente a GPU que PBKDF2 con 1.000.000 de
+iteraciones en una décima parte del tiempo de CPU (``manage.py
+medir_registro``). scrypt se queda con los de Django, que ya son los de
+OWASP; cuesta casi lo mismo que PBKDF2 y solo se usa si falta argon2.
+
+Con ``REGISTRO_HASH_EJECUTOR`` (``'hilos'`` o ``'procesos'``) el hash se
+calcula en un pool de ``REGISTRO_HASH_TRABAJADORES`` del worker. No lo hace
+más rápido: limita cuántos hashes corren a la vez, así una ráfaga de
+registros no se come los núcleos que necesitan las demás peticiones. Con
+``'procesos'`` además no compite por el GIL con los hilos del worker.
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, get_hasher
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+EJECUTORES = {'hilos': ThreadPoolExecutor, 'procesos': ProcessPoolExecutor}
+
+_ejecutor = None
+
+
+class Argon2Ajustado(Argon2PasswordHasher):
+    """argon2id con los parámetros mínimos de OWASP (19 MiB, 2 pasadas, 1 hilo)."""
+
+    time_cost = 2
+    memory_cost = 19456
+    parallelism = 1
+
+
+def ejecutor():
+    global _ejecutor
+    tipo = getattr(settings, 'REGISTRO_HASH_EJECUTOR', '')
+    if not tipo:
+        return None
+    if _ejecutor is None:
+        _ejecutor = EJECUTORES[tipo](max_workers=getattr(settings, 'REGISTRO_HASH_TRABAJADORES', 2))
+    return _ejecutor
+
+
+@receiver(setting_changed)
+def _reiniciar(setting, **kwargs):
+    global _ejecutor
+    if setting in ('REGISTRO_HASH_EJECUTOR', 'REGISTRO_HASH_TRABAJADORES', 'PASSWORD_HASHERS') and _ejecutor:
+        _ejecutor.shutdown(wait=False)
+        _ejecutor = None
+
+
+def hashear(password):
+    """Lo mismo que ``make_password(password)``, en el pool si está configurado."""
+    hasher = get_hasher('default')
+    salt = hasher.salt()
+    pool = ejecutor()
+    if pool is None:
+        return hasher.encode(password, salt)
+    return pool.submit(hasher.encode, password, salt).result()
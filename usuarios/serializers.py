@@ -1,22 +1,24 @@
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 from django.contrib.auth.password_validation import validate_password
+from jobconnect_api.campos import CamposDinamicosMixin
+from .hashers import hashear
 from .models import Usuario, PerfilCandidato, PerfilReclutador
 
 # Perfil del candidato
-class PerfilCandidatoSerializer(serializers.ModelSerializer):
+class PerfilCandidatoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = PerfilCandidato
         exclude = ['user']
 
 # Perfil del reclutador
-class PerfilReclutadorSerializer(serializers.ModelSerializer):
+class PerfilReclutadorSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = PerfilReclutador
         exclude = ['user']
 
 # Usuario básico (para mostrar datos generales)
-class UsuarioSerializer(serializers.ModelSerializer):
+class UsuarioSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = Usuario
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'rol']
@@ -68,7 +70,7 @@ class RegistroUsuarioSerializer(serializers.ModelSerializer):
         
         # Crear usuario base
         usuario = Usuario(**validated_data)
-        usuario.set_password(password)
+        usuario.password = hashear(password)
         usuario.save()
         
         # Crear perfil según el rol
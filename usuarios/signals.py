@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import revocar
+from .models import PerfilCandidato, PerfilReclutador, Usuario
+
+
+@receiver([post_save, post_delete], sender=Usuario)
+def revocar_usuario(sender, instance, **kwargs):
+    revocar(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=PerfilCandidato)
+@receiver([post_save, post_delete], sender=PerfilReclutador)
+def revocar_perfil(sender, instance, **kwargs):
+    revocar(instance.user_id)
@@ -0,0 +1,106 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from usuarios.authentication import TokenConRolSerializer
+from usuarios.models import PerfilCandidato, Usuario
+
+
+def cliente_con_token(user):
+    client = APIClient()
+    token = TokenConRolSerializer.get_token(user).access_token
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client
+
+
+@pytest.mark.django_db
+def test_login_incluye_rol_y_perfil_en_el_token():
+    user = Usuario.objects.create_user(username="claims", password="Test1234Segura$", rol="candidato")
+    perfil = PerfilCandidato.objects.create(user=user, telefono="300", ciudad="Pasto")
+
+    response = APIClient().post(reverse("login"), {"username": "claims", "password": "Test1234Segura$"})
+
+    token = AccessToken(response.data["access"])
+    assert token["rol"] == "candidato"
+    assert token["perfil_id"] == perfil.id
+
+
+@pytest.mark.django_db
+def test_usuario_en_cache_no_consulta_la_base():
+    user = Usuario.objects.create(username="cacheado", rol="candidato")
+    PerfilCandidato.objects.create(user=user, telefono="300", ciudad="Cali")
+    client = cliente_con_token(user)
+    url = reverse("mi-perfil")
+
+    with CaptureQueriesContext(connection) as primera:
+        assert client.get(url).status_code == 200
+    with CaptureQueriesContext(connection) as segunda:
+        response = client.get(url)
+
+    assert response.data["usuario"]["username"] == "cacheado"
+    assert response.data["perfil"]["ciudad"] == "Cali"
+    # Usuario y perfil en la primera; después solo la lectura del perfil que pide la vista
+    assert len(primera) == 2
+    assert len(segunda) == 1
+
+
+@pytest.mark.django_db
+def test_desactivar_usuario_revoca_la_cache():
+    user = Usuario.objects.create(username="revocado", rol="reclutador")
+    client = cliente_con_token(user)
+    url = reverse("mi-perfil")
+    assert client.get(url).status_code == 200
+
+    user.is_active = False
+    user.save()
+
+    assert client.get(url).status_code == 401
+
+
+@pytest.mark.django_db
+def test_crear_perfil_revoca_la_cache():
+    user = Usuario.objects.create(username="sin_perfil", rol="candidato")
+    client = cliente_con_token(user)
+    url = reverse("mi-perfil")
+    assert client.get(url).data["perfil"] == {}
+
+    PerfilCandidato.objects.create(user=user, telefono="300", ciudad="Medellín")
+
+    assert client.get(url).data["perfil"]["ciudad"] == "Medellín"
+
+
+@pytest.mark.django_db
+def test_perfil_async_con_usuario_en_cache():
+    user = Usuario.objects.create(username="perfil_async", rol="candidato")
+    PerfilCandidato.objects.create(user=user, telefono="300", ciudad="Cali")
+    client = cliente_con_token(user)
+    url = reverse("mi-perfil-async")
+    assert client.get(url).json() == client.get(reverse("mi-perfil")).json()
+
+    with CaptureQueriesContext(connection) as consultas:
+        response = client.get(url)
+
+    assert response.json()["perfil"]["ciudad"] == "Cali"
+    assert len(consultas) == 1
+    assert APIClient().get(url).status_code == 401
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ruta", ["mi-perfil", "mi-perfil-async"])
+def test_perfil_borrado_con_usuario_en_cache(monkeypatch, ruta):
+    user = Usuario.objects.create(username=f"perfil_borrado_{ruta}", rol="candidato")
+    perfil = PerfilCandidato.objects.create(user=user, telefono="300", ciudad="Cali")
+    client = cliente_con_token(user)
+    url = reverse(ruta)
+    assert client.get(url).json()["perfil"]["ciudad"] == "Cali"
+
+    # La revocación se pierde: la caché sigue con el id del perfil borrado
+    monkeypatch.setattr("usuarios.signals.revocar", lambda *ids: None)
+    perfil.delete()
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert response.json()["perfil"] == {}
@@ -0,0 +1,59 @@
+import pytest
+from django.contrib.auth.hashers import check_password, identify_hasher, make_password
+
+from usuarios.hashers import Argon2Ajustado, hashear
+from usuarios.models import Usuario
+from usuarios.serializers import RegistroUsuarioSerializer
+
+HASHERS = [
+    "usuarios.hashers.Argon2Ajustado",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+]
+
+
+@pytest.fixture
+def hashers(settings):
+    settings.PASSWORD_HASHERS = HASHERS
+    return settings
+
+
+def registrar(username="hash_nuevo", password="Clave-Registro-2025"):
+    serializer = RegistroUsuarioSerializer(data={
+        "username": username, "email": f"{username}@example.com", "password": password,
+        "rol": "candidato", "perfil_candidato": {"telefono": "300", "ciudad": "Pasto"},
+    })
+    assert serializer.is_valid(), serializer.errors
+    return serializer.save()
+
+
+@pytest.mark.django_db
+def test_registro_hashea_con_argon2_ajustado(hashers):
+    usuario = registrar()
+
+    hasher = identify_hasher(usuario.password)
+    assert isinstance(hasher, Argon2Ajustado)
+    assert "m=19456,t=2,p=1" in usuario.password
+    assert usuario.check_password("Clave-Registro-2025")
+
+
+@pytest.mark.django_db
+def test_hash_pbkdf2_existente_se_rehace_al_iniciar_sesion(hashers):
+    usuario = Usuario.objects.create(username="antiguo", rol="candidato",
+                                     password=make_password("Clave-Antigua-2020", hasher="pbkdf2_sha256"))
+
+    assert usuario.check_password("Clave-Antigua-2020")
+
+    usuario.refresh_from_db()
+    assert usuario.password.startswith("argon2$argon2id$")
+
+
+@pytest.mark.parametrize("ejecutor", ["hilos", "procesos"])
+def test_hash_en_pool_del_worker(hashers, ejecutor):
+    hashers.REGISTRO_HASH_EJECUTOR = ejecutor
+    hashers.REGISTRO_HASH_TRABAJADORES = 1
+
+    encoded = hashear("Clave-En-Pool-2025")
+
+    assert check_password("Clave-En-Pool-2025", encoded)
+    assert encoded != hashear("Clave-En-Pool-2025")  # cada hash con su sal
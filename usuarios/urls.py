@@ -1,8 +1,10 @@
 from django.urls import path
+from jobconnect_api.asincrono import vista_async
 from .views import RegistroUsuarioView, MiPerfilView
 
 
 urlpatterns = [
     path('registro/', RegistroUsuarioView.as_view(), name='registro'),
     path('perfil-usuario/', MiPerfilView.as_view(), name='mi-perfil'),
+    path('async/perfil-usuario/', vista_async(MiPerfilView, 'get'), name='mi-perfil-async'),
 ]
\ No newline at end of file
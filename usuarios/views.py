@@ -1,8 +1,11 @@
+from asgiref.sync import sync_to_async
 from rest_framework.generics import CreateAPIView
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from .models import Usuario
+from jobconnect_api.replicas import fijar_primaria
+from .authentication import perfil_id
+from .models import PerfilCandidato, PerfilReclutador, Usuario
 from .serializers import (
     RegistroUsuarioSerializer,
     UsuarioSerializer,
@@ -21,6 +24,8 @@ class RegistroUsuarioView(CreateAPIView):
         try:
             serializer.is_valid(raise_exception=True)
             self.perform_create(serializer)
+            # Sin usuario autenticado el middleware no sabe a quién fijar
+            fijar_primaria(serializer.instance.pk)
             headers = self.get_success_headers(serializer.data)
 
             return Response({
@@ -38,19 +43,34 @@ class RegistroUsuarioView(CreateAPIView):
 # 🔐 Devolver los datos del usuario autenticado + perfil
 class MiPerfilView(APIView):
     permission_classes = [IsAuthenticated]
+    perfiles = {
+        'candidato': (PerfilCandidato, PerfilCandidatoSerializer),
+        'reclutador': (PerfilReclutador, PerfilReclutadorSerializer),
+    }
 
     def get(self, request):
         user = request.user
-        user_data = UsuarioSerializer(user).data
+        # El id del perfil viene resuelto desde la autenticación: sin perfil no hay consulta.
+        # Puede venir de la caché y el perfil ya no existir: se responde como sin perfil
+        id_perfil = perfil_id(user)
+        perfil = None
+        if id_perfil is not None and user.rol in self.perfiles:
+            perfil = self.perfiles[user.rol][0].objects.filter(pk=id_perfil).first()
+        return self.respuesta(request, user, perfil)
 
-        if user.rol == 'candidato' and hasattr(user, 'perfil_candidato'):
-            perfil_data = PerfilCandidatoSerializer(user.perfil_candidato).data
-        elif user.rol == 'reclutador' and hasattr(user, 'perfil_reclutador'):
-            perfil_data = PerfilReclutadorSerializer(user.perfil_reclutador).data
-        else:
-            perfil_data = {}
+    # Variante asíncrona (/api/async/perfil-usuario/)
+    async def aget(self, request):
+        user = request.user
+        id_perfil = user.perfil_id if hasattr(user, 'perfil_id') else await sync_to_async(perfil_id)(user)
+        perfil = None
+        if id_perfil is not None and user.rol in self.perfiles:
+            perfil = await self.perfiles[user.rol][0].objects.filter(pk=id_perfil).afirst()
+        return self.respuesta(request, user, perfil)
 
+    def respuesta(self, request, user, perfil):
+        # Cada serializer es raíz de su parte: ?fields= recorta los dos
+        contexto = {'request': request}
         return Response({
-            'usuario': user_data,
-            'perfil': perfil_data
-        })
\ No newline at end of file
+            'usuario': UsuarioSerializer(user, context=contexto).data,
+            'perfil': self.perfiles[user.rol][1](perfil, context=contexto).data if perfil else {}
+        })